@@ -4,6 +4,17 @@ from django.http import HttpResponse
 import sentry_sdk
 
 from api.deprecation import get_view_func_deprecation_level, DeprecationLevel
+from share.search import coalesced_index_messages
+
+
+class CoalescedIndexMessagesMiddleware:
+    '''send index messages from each request all at once (see `coalesced_index_messages`)'''
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with coalesced_index_messages():
+            return self.get_response(request)
 
 
 class DeprecationMiddleware:
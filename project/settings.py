@@ -163,6 +163,7 @@ MIDDLEWARE = [
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     'api.middleware.DeprecationMiddleware',
+    'api.middleware.CoalescedIndexMessagesMiddleware',
     'allauth.account.middleware.AccountMiddleware',
 ]
 
@@ -303,12 +304,43 @@ ELASTICSEARCH = {
     'CHUNK_SIZE': int(os.environ.get('ELASTICSEARCH_CHUNK_SIZE', 2000)),
     'MAX_RETRIES': int(os.environ.get('ELASTICSEARCH_MAX_RETRIES', 7)),
     'POST_INDEX_DELAY': int(os.environ.get('ELASTICSEARCH_POST_INDEX_DELAY', 3)),
+    # if greater than 1, send bulk requests in parallel (with this many threads)
+    'BULK_THREAD_COUNT': int(os.environ.get('ELASTICSEARCH_BULK_THREAD_COUNT', 1)),
 }
 ELASTICSEARCH8_URL = os.environ.get('ELASTICSEARCH8_URL')
 ELASTICSEARCH8_CERT_PATH = os.environ.get('ELASTICSEARCH8_CERT_PATH')
 ELASTICSEARCH8_USERNAME = os.environ.get('ELASTICSEARCH8_USERNAME', 'elastic')
 ELASTICSEARCH8_SECRET = os.environ.get('ELASTICSEARCH8_SECRET')
 
+CACHES = {
+    'default': {
+        'BACKEND': os.environ.get('DJANGO_CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.environ.get('DJANGO_CACHE_LOCATION', ''),
+    },
+}
+
+# cache for search results (see share.search.search_result_cache) -- any BACKEND needs
+# SHARED_CACHE_ALIAS to name a cache shared across processes (e.g. DJANGO_CACHE_BACKEND
+# redis or memcached, not the default locmem), else fails the system check share.search.E002
+SEARCH_RESULT_CACHE = {
+    # 'locmem' (in-process) or 'django' (a django cache) -- empty for no cache
+    'BACKEND': os.environ.get('SEARCH_RESULT_CACHE_BACKEND', ''),
+    'TTL_SECONDS': int(os.environ.get('SEARCH_RESULT_CACHE_TTL_SECONDS', 60)),
+    'MAX_ENTRIES': int(os.environ.get('SEARCH_RESULT_CACHE_MAX_ENTRIES', 1000)),  # for 'locmem'
+    'DJANGO_CACHE_ALIAS': os.environ.get('SEARCH_RESULT_CACHE_DJANGO_CACHE_ALIAS', 'default'),  # for 'django'
+    # a django cache shared across processes (for invalidation by the indexer daemon, and hit/miss counts)
+    'SHARED_CACHE_ALIAS': os.environ.get('SEARCH_RESULT_CACHE_SHARED_CACHE_ALIAS', 'default'),
+    # how often each process checks the shared cache for invalidations
+    'GENERATION_CHECK_SECONDS': float(os.environ.get('SEARCH_RESULT_CACHE_GENERATION_CHECK_SECONDS', 2)),
+    # how often each process adds its hit/miss counts to the shared cache
+    'COUNT_FLUSH_SECONDS': float(os.environ.get('SEARCH_RESULT_CACHE_COUNT_FLUSH_SECONDS', 10)),
+}
+
+# a django cache shared across processes (e.g. redis or memcached, not locmem), for counting
+# records skipped as unchanged when ingested (see trove.digestive_tract.noop_ingest_count)
+# -- empty for no count; else a cache shared across processes (system check trove.E001)
+INGEST_COUNT_CACHE_ALIAS = os.environ.get('INGEST_COUNT_CACHE_ALIAS', '')
+
 # Seconds, not an actual celery settings
 CELERY_RETRY_BACKOFF_BASE = int(os.environ.get('CELERY_RETRY_BACKOFF_BASE', 2 if DEBUG else 10))
 
@@ -334,6 +366,10 @@ CELERY_BEAT_SCHEDULE = {
         'task': 'trove.digestive_tract.task__expel_expired_data',
         'schedule': crontab(hour=0, minute=0),  # every day at midnight UTC
     },
+    'Delete unreferenced blobs': {
+        'task': 'trove.digestive_tract.task__delete_unreferenced_blobs',
+        'schedule': crontab(hour=1, minute=0),  # every day at 1am UTC (after expelling)
+    },
 }
 
 CELERY_RESULT_BACKEND = 'share.celery:CeleryDatabaseBackend'
@@ -365,6 +401,7 @@ CELERY_TASK_DEFAULT_ROUTING_KEY = 'share_default'
 
 URGENT_TASK_QUEUES = {
     'trove.digestive_tract.task__derive': 'digestive_tract.urgent',
+    'trove.digestive_tract.task__derive_chunk': 'digestive_tract.urgent',
 }
 
 
@@ -458,6 +495,9 @@ SHARE_LIMITS = {
     'MAX_AGENT_RELATIONS': 500,
 }
 
+# number of records per page of an OAI-PMH list (ListRecords, ListIdentifiers)
+OAIPMH_PAGE_SIZE = int(os.environ.get('OAIPMH_PAGE_SIZE', 100))
+
 OSF_API_URL = os.environ.get('OSF_API_URL', 'http://localhost:8000').rstrip('/') + '/'
 OSF_BYPASS_THROTTLE_TOKEN = os.environ.get('BYPASS_THROTTLE_TOKEN', None)
 
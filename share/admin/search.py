@@ -7,6 +7,7 @@ from django.urls import reverse
 from share.admin.util import admin_url
 from share.models.index_backfill import IndexBackfill
 from share.search.index_messenger import IndexMessenger
+from share.search.search_result_cache import get_search_result_cache, search_result_cache_counts
 from share.search.index_strategy import (
     IndexStrategy,
     all_strategy_names,
@@ -28,6 +29,11 @@ def search_indexes_view(request):
                 'search_url_prefix': _search_url_prefix(),
                 'mappings_url_prefix': _mappings_url_prefix(),
                 'index_status_by_strategy': _index_status_by_strategy(),
+                'search_result_cache_counts': (
+                    search_result_cache_counts()
+                    if get_search_result_cache() is not None
+                    else None
+                ),
             },
         )
     if request.method == 'POST':
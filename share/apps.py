@@ -1,6 +1,6 @@
 from django.apps import AppConfig
 from django.core import checks
-from share.checks import check_all_index_strategies_current
+from share.checks import check_all_index_strategies_current, check_search_result_cache
 
 
 class ShareConfig(AppConfig):
@@ -8,3 +8,4 @@ class ShareConfig(AppConfig):
 
     def ready(self):
         checks.register(check_all_index_strategies_current)
+        checks.register(check_search_result_cache)
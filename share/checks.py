@@ -18,3 +18,19 @@ def check_all_index_strategies_current(app_configs, **kwargs):
                 )
             )
     return errors
+
+
+def check_search_result_cache(app_configs, **kwargs):
+    from django.core.exceptions import ImproperlyConfigured
+    from share.search.search_result_cache import get_search_result_cache
+    try:
+        get_search_result_cache()
+    except ImproperlyConfigured as exception:
+        return [
+            checks.Error(
+                'Search result cache enabled without a shared cache!',
+                hint=str(exception),
+                id='share.search.E002',
+            )
+        ]
+    return []
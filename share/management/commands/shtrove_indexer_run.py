@@ -1,17 +1,57 @@
-from django.core.management.base import BaseCommand
+import multiprocessing
+import signal
+
+from django.core.management.base import BaseCommand, CommandError
 from share.search.daemon import IndexerDaemonControl
+from share.search.index_strategy import all_strategy_names
 from project.celery import app as celery_app
 
 
 class Command(BaseCommand):
     help = "Start the search indexing daemon"
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--processes",
+            action="append",
+            default=[],
+            metavar="STRATEGY_NAME=COUNT",
+            help="Run the named strategy's daemon in COUNT worker processes (default: threads in this process)",
+        )
+
     def handle(self, *args, **options):
-        daemon_control = IndexerDaemonControl(celery_app)
-        daemon_control.start_all_daemonthreads()
+        process_counts = self._parse_process_counts(options["processes"])
+        daemon_control = IndexerDaemonControl(
+            celery_app,
+            # (shared with worker processes, if any)
+            stop_event=(multiprocessing.Event() if any(process_counts.values()) else None),
+        )
+        # stop politely on SIGTERM, as on KeyboardInterrupt (SIGINT) -- worker processes
+        # share the stop_event (and stop on their own if this process dies)
+        prior_sigterm_handler = signal.signal(
+            signal.SIGTERM,
+            lambda _signum, _frame: daemon_control.stop_event.set(),
+        )
         try:
+            daemon_control.start_all_daemonthreads(process_counts=process_counts)
             daemon_control.stop_event.wait()
         except KeyboardInterrupt:
             pass
         finally:
             daemon_control.stop_daemonthreads(wait=True)
+            signal.signal(signal.SIGTERM, prior_sigterm_handler)
+
+    def _parse_process_counts(self, process_args):
+        process_counts = {}
+        for process_arg in process_args:
+            strategy_name, _, count = process_arg.partition("=")
+            if strategy_name not in all_strategy_names():
+                raise CommandError(
+                    f'Unknown strategy name "{strategy_name}" in "--processes {process_arg}"'
+                    f' (expected one of {sorted(all_strategy_names())})'
+                )
+            try:
+                process_counts[strategy_name] = int(count)
+            except ValueError:
+                raise CommandError(f'Expected "--processes STRATEGY_NAME=COUNT" (got "{process_arg}")')
+        return process_counts
@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models import Case, Exists, OuterRef, Q, Subquery, Value, When
 
 from share.util import BaseJSONAPIMeta
 
@@ -51,6 +52,45 @@ class SourceUniqueIdentifier(models.Model):
             .exists()
         )
 
+    @staticmethod
+    def backcompat_sharev2_suid_id_expression(suid_path: str = ''):
+        '''expression for annotating many at once: id of the suid `get_backcompat_sharev2_suid`
+        would get (or null), given the lookup path to a suid from the queryset's model
+        '''
+        _prefix = f'{suid_path}__' if suid_path else ''
+        return Subquery(
+            SourceUniqueIdentifier.objects
+            .filter(
+                identifier=OuterRef(f'{_prefix}identifier'),
+                source_config__source_id=OuterRef(f'{_prefix}source_config__source_id'),
+                source_config__transformer_key='v2_push',
+            )
+            .values('id')
+            [:1]
+        )
+
+    @staticmethod
+    def has_forecompat_replacement_expression(suid_path: str = ''):
+        '''expression for annotating many at once: the value `has_forecompat_replacement`
+        would return, given the lookup path to a suid from the queryset's model
+        '''
+        _prefix = f'{suid_path}__' if suid_path else ''
+        return Case(
+            When(
+                Q(**{f'{_prefix}source_config__transformer_key': 'v2_push'})
+                & Exists(
+                    SourceUniqueIdentifier.objects
+                    .filter(
+                        identifier=OuterRef(f'{_prefix}identifier'),
+                        source_config__source_id=OuterRef(f'{_prefix}source_config__source_id'),
+                        source_config__transformer_key__isnull=True,
+                    )
+                ),
+                then=Value(True),
+            ),
+            default=Value(False),
+        )
+
     def __repr__(self):
         return '<{}({}, {}, {!r})>'.format('Suid', self.id, self.source_config.label, self.identifier)
 
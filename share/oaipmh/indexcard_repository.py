@@ -1,6 +1,8 @@
 import datetime
+import itertools
 import uuid
 
+from django.core import signing
 from django.core.exceptions import ValidationError as DjangoValidationError
 from django.conf import settings
 from django.db.models import OuterRef, Subquery, F
@@ -10,10 +12,14 @@ from share.oaipmh.verbs import OAIVerb
 from share.oaipmh.response_renderer import OAIRenderer
 from share import models as share_db
 from trove import models as trove_db
-from trove.util.datetime import datetime_isoformat_z as format_datetime
+from trove.models.content_blob import decompressed
 from trove.vocab.namespaces import OAI_DC
 
 
+_RESUMPTION_TOKEN_SALT = 'share.oaipmh.resumption_token'
+_STREAM_CHUNK_SIZE = 500  # rows per fetch from a server-side cursor
+
+
 class OaiPmhRepository:
     NAME = 'SHARE/trove'
     REPOSITORY_IDENTIFIER = 'share.osf.io'
@@ -30,7 +36,10 @@ class OaiPmhRepository:
             'namespace': 'http://www.openarchives.org/OAI/2.0/oai_dc/',
         },
     }
-    PAGE_SIZE = 13
+
+    @property
+    def page_size(self) -> int:
+        return settings.OAIPMH_PAGE_SIZE  # (read per request, not at import)
 
     def handle_request(self, request, kwargs):
         xml = None
@@ -150,10 +159,10 @@ class OaiPmhRepository:
         return renderer.listIdentifiers(_indexcards, _next_token)
 
     def _do_listrecords(self, kwargs, renderer):
-        _indexcards, _next_token = self._load_page(kwargs, just_identifiers=False)
+        _indexcards, _get_next_token = self._stream_page(kwargs)
         if self.errors:
             return
-        return renderer.listRecords(_indexcards, _next_token)
+        return renderer.listRecords(_indexcards, _get_next_token)
 
     def _do_getrecord(self, kwargs, renderer):
         _indexcard = self.resolve_oai_identifier(
@@ -171,40 +180,91 @@ class OaiPmhRepository:
         return renderer.getRecord(_indexcard)
 
     def _load_page(self, kwargs, just_identifiers):
-        if 'resumptionToken' in kwargs:
-            try:
-                _indexcard_queryset, kwargs = self._resume(kwargs['resumptionToken'])
-            except (ValueError, KeyError):
-                self.errors.append(oai_errors.BadResumptionToken(kwargs['resumptionToken']))
-        else:
-            _indexcard_queryset = self._get_indexcard_page_queryset(kwargs)
+        _indexcard_queryset, kwargs = self._get_page_queryset(kwargs, just_identifiers)
         if self.errors:
             return [], None
-        if not just_identifiers:
-            _indexcard_queryset = self._add_oai_metadata_annotation(
-                _indexcard_queryset,
-                kwargs['metadataPrefix'],
-            )
         _indexcards = list(_indexcard_queryset)
         if not len(_indexcards):
             self.errors.append(oai_errors.NoResults())
             return [], None
-        if len(_indexcards) <= self.PAGE_SIZE:
+        if len(_indexcards) <= self.page_size:
             _next_token = None  # Last page
         else:
-            _indexcards = _indexcards[:self.PAGE_SIZE]
+            _indexcards = _indexcards[:self.page_size]
             _next_token = self._get_resumption_token(kwargs, last_id=_indexcards[-1].id)
         return _indexcards, _next_token
 
-    def _get_indexcard_page_queryset(self, kwargs, catch=True, last_id=None):
+    def _stream_page(self, kwargs):
+        '''like `_load_page`, but reads indexcards (with metadata) from a server-side cursor
+
+        returns an iterator of indexcards and a callable that gives the resumption token
+        (only known once the page has been iterated)
+        '''
+        _indexcard_queryset, kwargs = self._get_page_queryset(kwargs, just_identifiers=False)
+        if self.errors:
+            return iter(()), None
+        _indexcard_iter = _indexcard_queryset.iterator(chunk_size=_STREAM_CHUNK_SIZE)
+        _first_indexcard = next(_indexcard_iter, None)  # no results is an error, before streaming
+        if _first_indexcard is None:
+            self.errors.append(oai_errors.NoResults())
+            return iter(()), None
+        _next_token = None
+
+        def _iter_page():
+            nonlocal _next_token
+            _last_id = None
+            _indexcards = itertools.chain([_first_indexcard], _indexcard_iter)
+            for _count, _indexcard in enumerate(_indexcards):
+                if _count == self.page_size:  # got the extra one; not the last page
+                    _next_token = self._get_resumption_token(kwargs, last_id=_last_id)
+                    break
+                _last_id = _indexcard.id
+                yield _indexcard
+            _indexcard_iter.close()  # done with the cursor
+
+        return _iter_page(), (lambda: _next_token)
+
+    def _get_page_queryset(self, kwargs, just_identifiers):
+        if 'resumptionToken' in kwargs:
+            try:
+                _indexcard_queryset, kwargs = self._resume(
+                    kwargs['resumptionToken'],
+                    with_metadata=(not just_identifiers),
+                )
+            except (ValueError, KeyError, TypeError, signing.BadSignature):
+                self.errors.append(oai_errors.BadResumptionToken(kwargs['resumptionToken']))
+        else:
+            _indexcard_queryset = self._get_indexcard_page_queryset(
+                kwargs,
+                with_metadata=(not just_identifiers),
+            )
+        if self.errors:
+            return None, kwargs
+        return _indexcard_queryset, kwargs
+
+    def _get_indexcard_page_queryset(self, kwargs, catch=True, last_id=None, with_metadata=False):
+        # keyset pagination (by id), joined with datestamp and metadata (at most
+        # one of each per indexcard) instead of per-row subqueries -- repeat the
+        # keyset bound on each joined table, so each index scan can start there
+        _after_id = (0 if last_id is None else last_id)
+        _deriver_identifier_id = self._deriver_identifier_id(kwargs['metadataPrefix'])
         _indexcard_queryset = (
-            self._get_indexcard_queryset_with_annotations()
+            self._get_base_indexcard_queryset()
             .filter(
-                derived_indexcard_set__deriver_identifier_id__in=self._deriver_identifier_ids(
-                    kwargs['metadataPrefix'],
-                ),
+                id__gt=_after_id,
+                derived_indexcard_set__deriver_identifier_id=_deriver_identifier_id,
+                derived_indexcard_set__upriver_indexcard_id__gt=_after_id,
+                trove_latestresourcedescription_set__indexcard_id__gt=_after_id,
+            )
+            .annotate(
+                oai_datestamp=F('trove_latestresourcedescription_set__modified'),
+                oai_setspec=F('source_record_suid__source_config__source__name'),
             )
         )
+        if with_metadata:  # reuses the join from the filter above (as do the other annotations)
+            _indexcard_queryset = _indexcard_queryset.annotate(
+                oai_metadata=decompressed(F('derived_indexcard_set__derived_blob__content')),
+            )
         if 'from' in kwargs:
             try:
                 _from = datetime.datetime.fromisoformat(kwargs['from'])
@@ -213,9 +273,7 @@ class OaiPmhRepository:
                     raise
                 self.errors.append(oai_errors.BadArgument('Invalid value for', 'from'))
             else:
-                _indexcard_queryset = _indexcard_queryset.filter(
-                    trove_latestresourcedescription_set__modified__gte=_from,
-                )
+                _indexcard_queryset = _indexcard_queryset.filter(oai_datestamp__gte=_from)
         if 'until' in kwargs:
             try:
                 _until = datetime.datetime.fromisoformat(kwargs['until'])
@@ -224,22 +282,13 @@ class OaiPmhRepository:
                     raise
                 self.errors.append(oai_errors.BadArgument('Invalid value for', 'until'))
             else:
-                _indexcard_queryset = _indexcard_queryset.filter(
-                    trove_latestresourcedescription_set__modified__lte=_until,
-                )
+                _indexcard_queryset = _indexcard_queryset.filter(oai_datestamp__lte=_until)
         if 'set' in kwargs:
-            _sourceconfig_ids = tuple(
-                share_db.SourceConfig.objects
-                .filter(source__name=kwargs['set'])
-                .values_list('id', flat=True)
-            )
-            _indexcard_queryset = _indexcard_queryset.filter(
-                source_record_suid__source_config_id__in=_sourceconfig_ids,
-            )
-        if last_id is not None:
-            _indexcard_queryset = _indexcard_queryset.filter(id__gt=last_id)
+            _indexcard_queryset = _indexcard_queryset.filter(oai_setspec=kwargs['set'])
+        if _deriver_identifier_id is None:  # nothing derived in this format yet
+            _indexcard_queryset = _indexcard_queryset.none()
         # include one extra so we can tell whether this is the last page
-        return _indexcard_queryset.order_by('id')[:self.PAGE_SIZE + 1]
+        return _indexcard_queryset.order_by('id')[:self.page_size + 1]
 
     def _get_base_indexcard_queryset(self):
         return trove_db.Indexcard.objects.filter(deleted__isnull=True)
@@ -257,21 +306,19 @@ class OaiPmhRepository:
 
     def _add_oai_metadata_annotation(self, indexcard_queryset, metadata_prefix: str):
         return indexcard_queryset.annotate(
-            oai_metadata=Subquery(
+            oai_metadata=decompressed(Subquery(
                 trove_db.DerivedIndexcard.objects
                 .filter(
                     upriver_indexcard_id=OuterRef('id'),
-                    deriver_identifier_id__in=self._deriver_identifier_ids(
-                        metadata_prefix,
-                    ),
+                    deriver_identifier_id=self._deriver_identifier_id(metadata_prefix),
                 )
-                .values_list('derived_text', flat=True)
+                .values_list('derived_blob__content', flat=True)
                 [:1]
-            ),
+            )),
         )
 
-    def _resume(self, token):
-        _from, _until, _set_spec, _prefix, _last_id = token.split('|')
+    def _resume(self, token, with_metadata=False):
+        _from, _until, _set_spec, _prefix, _last_id = self._parse_resumption_token(token)
         _kwargs = {}
         if _from:
             _kwargs['from'] = _from
@@ -284,32 +331,40 @@ class OaiPmhRepository:
             _kwargs,
             catch=False,
             last_id=int(_last_id),
+            with_metadata=with_metadata,
         )
         return _indexcard_queryset, _kwargs
 
     def _get_resumption_token(self, kwargs, last_id):
-        _from = None
-        _until = None
-        if 'from' in kwargs:
-            try:
-                _from = datetime.datetime.fromisoformat(kwargs['from'])
-            except ValueError:
-                self.errors.append(oai_errors.BadArgument('Invalid value for', 'from'))
-        if 'until' in kwargs:
-            try:
-                _until = datetime.datetime.fromisoformat(kwargs['until'])
-            except ValueError:
-                self.errors.append(oai_errors.BadArgument('Invalid value for', 'until'))
-        _set_spec = kwargs.get('set', '')
-        return self._format_resumption_token(_from, _until, _set_spec, kwargs['metadataPrefix'], last_id)
+        # (from, until, and set already validated when getting the page)
+        return self._format_resumption_token(
+            kwargs.get('from', ''),
+            kwargs.get('until', ''),
+            kwargs.get('set', ''),
+            kwargs['metadataPrefix'],
+            last_id,
+        )
 
     def _format_resumption_token(self, from_, until, set_spec, prefix, last_id):
-        # TODO something more opaque, maybe
-        return '{}|{}|{}|{}|{}'.format(format_datetime(from_) if from_ else '', format_datetime(until) if until else '', set_spec, prefix, last_id)
+        # opaque to harvesters, compact, and signed (so tampering is a badResumptionToken)
+        return signing.dumps(
+            [from_, until, set_spec, prefix, last_id],
+            salt=_RESUMPTION_TOKEN_SALT,
+            compress=True,
+        )
+
+    def _parse_resumption_token(self, token) -> list:
+        if token.count('|') == 4:
+            # pipe-delimited, unsigned tokens (from before tokens were signed) are still
+            # accepted so harvests in progress can finish -- remove after 2026-12-31
+            return token.split('|')
+        _values = signing.loads(token, salt=_RESUMPTION_TOKEN_SALT)
+        if not isinstance(_values, list):
+            raise ValueError(f'invalid resumption token values: {_values}')
+        return _values
 
-    def _deriver_identifier_ids(self, metadata_prefix: str):
-        return tuple(
+    def _deriver_identifier_id(self, metadata_prefix: str) -> int | None:
+        return (
             trove_db.ResourceIdentifier.objects
-            .queryset_for_iri(self.FORMATS[metadata_prefix]['deriver_iri'])
-            .values_list('id', flat=True)
+            .cached_id_for_iri(self.FORMATS[metadata_prefix]['deriver_iri'])
         )
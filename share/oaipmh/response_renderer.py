@@ -1,5 +1,7 @@
-
+from collections.abc import Callable, Iterable, Iterator
 from datetime import datetime
+import io
+
 from lxml import etree
 
 from django.urls import reverse
@@ -8,6 +10,9 @@ from share.oaipmh.util import SubEl, ns, nsmap
 from trove.util.datetime import datetime_isoformat_z as format_datetime
 
 
+_STREAMING_BUFFER_SIZE = 2**16  # bytes
+
+
 class OAIRenderer:
     def __init__(self, repository, request):
         self.repository = repository
@@ -66,12 +71,39 @@ class OAIRenderer:
         SubEl(list_identifiers, ns('oai', 'resumptionToken'), next_token)
         return self._render(list_identifiers)
 
-    def listRecords(self, indexcards, next_token):
-        list_records = etree.Element(ns('oai', 'ListRecords'))
-        for _indexcard in indexcards:
-            list_records.append(self._record(_indexcard))
-        SubEl(list_records, ns('oai', 'resumptionToken'), next_token)
-        return self._render(list_records)
+    def listRecords(
+        self,
+        indexcards: Iterable,
+        get_next_token: Callable[[], str | None],
+    ) -> Iterator[bytes]:
+        '''yield the document in chunks, writing each record as indexcards are iterated
+
+        each record's metadata is written as-is (already xml, no need to parse it),
+        and the resumption token is gotten after the last record
+        '''
+        _buffer = io.BytesIO()
+        with etree.xmlfile(_buffer, encoding='utf-8') as _xmlfile:
+            _xmlfile.write_declaration()
+            _root = self._root_element()
+            with _xmlfile.element(_root.tag, attrib=dict(_root.attrib), nsmap=_root.nsmap):
+                for _child in _root:  # (responseDate, request -- text only)
+                    with _xmlfile.element(_child.tag, attrib=dict(_child.attrib)):
+                        _xmlfile.write(_child.text)
+                with _xmlfile.element(ns('oai', 'ListRecords')):
+                    for _indexcard in indexcards:
+                        with _xmlfile.element(ns('oai', 'record')):
+                            _xmlfile.write(self._header(_indexcard))
+                            with _xmlfile.element(ns('oai', 'metadata')):
+                                _xmlfile.flush()
+                                _buffer.write(_indexcard.oai_metadata.encode())
+                        _xmlfile.flush()
+                        if _buffer.tell() >= _STREAMING_BUFFER_SIZE:
+                            yield _drain(_buffer)
+                    with _xmlfile.element(ns('oai', 'resumptionToken')):
+                        _next_token = get_next_token()
+                        if _next_token:
+                            _xmlfile.write(_next_token)
+        yield _drain(_buffer)
 
     def getRecord(self, indexcard):
         get_record = etree.Element(ns('oai', 'GetRecord'))
@@ -87,6 +119,12 @@ class OAIRenderer:
         return self._render(*elements)
 
     def _render(self, *elements):
+        root = self._root_element()
+        for element in elements:
+            root.append(element)
+        return etree.tostring(root, encoding='utf-8', xml_declaration=True)
+
+    def _root_element(self):
         root = etree.Element(
             ns('oai', 'OAI-PMH'),
             attrib={
@@ -101,14 +139,10 @@ class OAIRenderer:
             request.set('verb', verb)
             for k, v in self.kwargs.items():
                 request.set(k, v)
-
-        for element in elements:
-            root.append(element)
-
-        return etree.tostring(root, encoding='utf-8', xml_declaration=True)
+        return root
 
     def _header(self, indexcard):
-        header = etree.Element(ns('oai', 'header'))
+        header = etree.Element(ns('oai', 'header'), nsmap=nsmap(default='oai'))
         SubEl(header, ns('oai', 'identifier'), self.repository.oai_identifier(indexcard))
         SubEl(header, ns('oai', 'datestamp'), format_datetime(indexcard.oai_datestamp)),
         SubEl(header, ns('oai', 'setSpec'), indexcard.oai_setspec)
@@ -121,3 +155,10 @@ class OAIRenderer:
         _metadata.append(etree.fromstring(indexcard.oai_metadata))
         # TODO SHARE-730 Add <about><provenance><originDescription> elements
         return _record_element
+
+
+def _drain(buffer: io.BytesIO) -> bytes:
+    _bytes = buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate()
+    return _bytes
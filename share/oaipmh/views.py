@@ -1,3 +1,4 @@
+from django.http import StreamingHttpResponse
 from django.views.generic.base import View
 from django.template.response import HttpResponse
 
@@ -16,4 +17,6 @@ class OAIPMHView(View):
     def oai_response(self, **kwargs):
         repository = OaiPmhRepository()
         xml = repository.handle_request(self.request, kwargs)
-        return HttpResponse(xml, content_type=self.CONTENT_TYPE)
+        if isinstance(xml, bytes):
+            return HttpResponse(xml, content_type=self.CONTENT_TYPE)
+        return StreamingHttpResponse(xml, content_type=self.CONTENT_TYPE)  # chunks of bytes
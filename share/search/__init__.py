@@ -1,5 +1,5 @@
 from share.search.messages import MessageType, MessagesChunk
-from share.search.index_messenger import IndexMessenger
+from share.search.index_messenger import IndexMessenger, coalesced_index_messages
 
 
-__all__ = ('IndexMessenger', 'MessageType', 'MessagesChunk',)
+__all__ = ('IndexMessenger', 'MessageType', 'MessagesChunk', 'coalesced_index_messages',)
@@ -1,14 +1,17 @@
 import contextlib
 import collections
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 import dataclasses
 import logging
+import multiprocessing
+import os
 import queue
 import random
 import threading
 import time
 
 from django.conf import settings
+from django.db import connections as db_connections
 import kombu
 from kombu.mixins import ConsumerMixin
 import sentry_sdk
@@ -19,6 +22,7 @@ from share.search import (
     index_strategy,
     IndexMessenger,
 )
+from share.search.search_result_cache import invalidate_strategy
 
 
 logger = logging.getLogger(__name__)
@@ -37,13 +41,16 @@ class TooFastSlowDown(Exception):
 
 class IndexerDaemonControl:
     def __init__(self, celery_app, *, daemonthread_context=None, stop_event=None):
+        self.celery_app = celery_app
         self.kombu_connection = kombu.Connection(
             celery_app.conf.broker_url,  # use celery_app.conf for consistent config
             heartbeat=settings.RABBITMQ_HEARTBEAT_TIMEOUT,
         )
         self.daemonthread_context = daemonthread_context
         self._daemonthreads = []
-        # shared stop_event for all threads below
+        self._daemonprocesses = []
+        # shared stop_event for all threads below (and processes -- to start daemons in
+        # worker processes, give a `multiprocessing.Event`, shared across processes)
         self.stop_event = stop_event or threading.Event()
 
     def start_daemonthreads_for_strategy(self, index_strategy):
@@ -66,8 +73,34 @@ class IndexerDaemonControl:
         threading.Thread(target=_consumer.run).start()
         return _daemon
 
-    def start_all_daemonthreads(self):
+    def start_all_daemonthreads(self, *, process_counts: Mapping[str, int] | None = None):
+        '''start daemons for every strategy -- as threads in this process, unless given a
+        `process_counts` value (keyed by strategy name) to run in worker processes instead
+
+        all processes are forked before any thread starts (forking a process with other
+        threads running could copy a lock held by one of them, and deadlock the child)
+
+        each worker process consumes from its strategy's queues on its own connection --
+        rabbitmq splits messages among them, up to each consumer's `prefetch_count` unacked
+        at a time
+        '''
+        _process_counts = process_counts or {}
+        _unknown_names = set(_process_counts).difference(index_strategy.all_strategy_names())
+        if _unknown_names:
+            raise exceptions.IndexStrategyError(
+                f'unknown strategy names: {sorted(_unknown_names)}'
+                f' (expected any of {sorted(index_strategy.all_strategy_names())})'
+            )
+        _processes = []
+        _thread_strategys = []
         for _index_strategy in index_strategy.each_strategy():
+            _process_count = _process_counts.get(_index_strategy.strategy_name, 0)
+            if _process_count > 0:
+                _processes.extend(self._fork_daemonprocesses(_index_strategy, _process_count))
+            else:
+                _thread_strategys.append(_index_strategy)
+        self._watch_daemonprocesses(_processes)
+        for _index_strategy in _thread_strategys:
             self.start_daemonthreads_for_strategy(_index_strategy)
 
     def stop_daemonthreads(self, *, wait=False):
@@ -75,6 +108,65 @@ class IndexerDaemonControl:
         if wait:
             for _thread in self._daemonthreads:
                 _thread.join()
+            for _process in self._daemonprocesses:
+                _process.join()
+
+    def _fork_daemonprocesses(self, index_strategy, process_count: int) -> list:
+        if isinstance(self.stop_event, threading.Event):
+            raise ValueError(
+                'cannot share a threading.Event with worker processes'
+                ' (give IndexerDaemonControl a `stop_event=multiprocessing.Event()`)'
+            )
+        logger.info('starting %d daemon processes for %s', process_count, index_strategy)
+        db_connections.close_all()  # don't share db connections with forked processes
+        _mp_context = multiprocessing.get_context('fork')
+        _processes = []
+        for _ in range(process_count):
+            _process = _mp_context.Process(
+                target=_run_daemonprocess,
+                kwargs={
+                    'celery_app': self.celery_app,
+                    'index_strategy': index_strategy,
+                    'stop_event': self.stop_event,
+                    'daemonthread_context': self.daemonthread_context,
+                },
+            )
+            _process.start()
+            _processes.append(_process)
+        self._daemonprocesses.extend(_processes)
+        return _processes
+
+    def _watch_daemonprocesses(self, processes):
+        # if a process dies, stop everything (as when a daemonthread dies)
+        for _process in processes:
+            threading.Thread(target=self._stop_after_process, args=(_process,)).start()
+
+    def _stop_after_process(self, process):
+        process.join()
+        if not self.stop_event.is_set():
+            logger.error('daemon process %s exited unexpectedly (exitcode %s)', process.pid, process.exitcode)
+            self.stop_event.set()
+
+
+def _run_daemonprocess(*, celery_app, index_strategy, stop_event, daemonthread_context):
+    # in a new process: start daemonthreads, then wait for the shared stop_event
+    # (or for the parent process to die without setting it)
+    _daemon_control = IndexerDaemonControl(
+        celery_app,
+        stop_event=stop_event,
+        daemonthread_context=daemonthread_context,
+    )
+    _daemon_control.start_daemonthreads_for_strategy(index_strategy)
+    _parent_process = multiprocessing.parent_process()
+    try:
+        while not stop_event.wait(timeout=UNPRESSURED_TIMEOUT):
+            if (_parent_process is not None) and not _parent_process.is_alive():
+                logger.error('parent process exited; stopping daemon process %s', os.getpid())
+                stop_event.set()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        _daemon_control.stop_daemonthreads(wait=True)
 
 
 class KombuMessageConsumer(ConsumerMixin):
@@ -295,6 +387,8 @@ class MessageHandlingLoop:
                         'target_ids': tuple(daemon_messages_by_target_id.keys()),
                     },
                 )
+        if doc_count:
+            invalidate_strategy(self.index_strategy)  # cached search results may be stale
         time_elapsed = time.time() - start_time
         if doc_count or error_count:
             logger.info('%sIndexed %d documents in %.02fs (with %d errors)', self.log_prefix, doc_count, time_elapsed, error_count)
@@ -1,10 +1,15 @@
+from __future__ import annotations
+from collections.abc import Collection, Iterator
 import contextlib
+import contextvars
+import functools
 import logging
 import typing
 import urllib.parse
 
 import celery
 from django.conf import settings
+from django.db import transaction
 import kombu
 import kombu.simple
 import requests
@@ -17,6 +22,37 @@ from trove.util.django import pk_chunked
 
 logger = logging.getLogger(__name__)
 
+# index messages held back (within `coalesced_index_messages`) to send all at once
+_MESSAGE_BUFFER: contextvars.ContextVar[_IndexMessageBuffer | None] = (
+    contextvars.ContextVar('index_message_buffer', default=None)
+)
+
+
+@contextlib.contextmanager
+def coalesced_index_messages() -> Iterator[None]:
+    '''hold back index messages sent within (e.g. for a request, task, or transaction),
+    then send them all at once -- deduplicated, one chunk per strategy and message type
+
+    each message is kept only once the transaction it was sent in (if any) commits,
+    and dropped if it rolls back -- all kept are sent when the outermost scope ends
+    (or when the transaction it ends in commits), even if an exception was raised,
+    since the writes behind them stand
+
+    may be nested (only the outermost sends) or used as a decorator
+    '''
+    if _MESSAGE_BUFFER.get() is not None:
+        yield  # already coalescing
+        return
+    _buffer = _IndexMessageBuffer()
+    _token = _MESSAGE_BUFFER.set(_buffer)
+    try:
+        yield
+    finally:
+        _MESSAGE_BUFFER.reset(_token)
+        if _buffer.has_messages:
+            # (after those kept on commit; if not in a transaction, sent now)
+            transaction.on_commit(_buffer.send_all)
+
 
 class IndexMessenger:
     retry_policy = {
@@ -34,7 +70,31 @@ class IndexMessenger:
         )
         self.index_strategys = index_strategys or tuple(index_strategy.each_strategy())
 
-    def notify_indexcard_update(self, indexcards: list[Indexcard], *, urgent=False) -> None:
+    def notify_indexcard_update(
+        self,
+        indexcards: list[Indexcard],
+        *,
+        urgent=False,
+        changed_deriver_iris: Collection[str] | None = None,
+    ) -> None:
+        '''send index messages for the given index cards
+
+        if `changed_deriver_iris` is given, skip index strategies that subscribe
+        only to other derivers (see `IndexStrategy.SUBSCRIBED_DERIVER_IRIS`)
+        '''
+        if changed_deriver_iris is not None:
+            _subscribed_strategys = tuple(
+                _strategy
+                for _strategy in self.index_strategys
+                if _strategy.is_subscribed_to_any(changed_deriver_iris)
+            )
+            if _subscribed_strategys != self.index_strategys:
+                if _subscribed_strategys:
+                    IndexMessenger(
+                        celery_app=self.celery_app,
+                        index_strategys=_subscribed_strategys,
+                    ).notify_indexcard_update(indexcards, urgent=urgent)
+                return
         self.send_messages_chunk(
             MessagesChunk(
                 MessageType.UPDATE_INDEXCARD,
@@ -116,6 +176,10 @@ class IndexMessenger:
             }
 
     def send_messages_chunk(self, messages_chunk: MessagesChunk, *, urgent=False):
+        _buffer = _MESSAGE_BUFFER.get()
+        if _buffer is not None:  # send later (see `coalesced_index_messages`)
+            _buffer.add(self, messages_chunk, urgent=urgent)
+            return
         with self._open_message_queues(messages_chunk.message_type, urgent) as message_queues:
             self._put_messages_chunk(messages_chunk, message_queues)
 
@@ -145,3 +209,42 @@ class IndexMessenger:
             for message_queue in message_queues:
                 logger.debug('putting %s into %s', message_dict, message_queue.queue)
                 message_queue.put(message_dict, retry=True, retry_policy=self.retry_policy)
+
+
+class _IndexMessageBuffer:
+    def __init__(self) -> None:
+        # target ids (deduplicated, in order) by (celery app, strategy, message type, urgent)
+        self._target_ids: dict[tuple, dict[int, None]] = {}
+        self.has_messages = False
+
+    def add(self, messenger: IndexMessenger, messages_chunk: MessagesChunk, *, urgent: bool) -> None:
+        _target_ids = list(messages_chunk.target_ids_chunk)
+        if not _target_ids:
+            return
+        self.has_messages = True
+        # kept once committed (now, if not in a transaction; never, if rolled back)
+        transaction.on_commit(functools.partial(
+            self._keep,
+            messenger,
+            messages_chunk.message_type,
+            _target_ids,
+            urgent=urgent,
+        ))
+
+    def _keep(self, messenger: IndexMessenger, message_type: MessageType, target_ids: list[int], *, urgent: bool) -> None:
+        for _strategy in messenger.index_strategys:
+            _key = (messenger.celery_app, _strategy, message_type, urgent)
+            self._target_ids.setdefault(_key, {}).update(dict.fromkeys(target_ids))
+
+    def send_all(self) -> None:
+        # strategies getting the same messages share one connection
+        _strategys_by_chunk: dict[tuple, list[index_strategy.IndexStrategy]] = {}
+        for (_celery_app, _strategy, _message_type, _urgent), _target_ids in self._target_ids.items():
+            if _target_ids:
+                _chunk_key = (_celery_app, _message_type, _urgent, tuple(_target_ids))
+                _strategys_by_chunk.setdefault(_chunk_key, []).append(_strategy)
+        self._target_ids.clear()
+        for (_celery_app, _message_type, _urgent, _target_ids), _strategys in _strategys_by_chunk.items():
+            _messenger = IndexMessenger(celery_app=_celery_app, index_strategys=tuple(_strategys))
+            with _messenger._open_message_queues(_message_type, _urgent) as _message_queues:
+                _messenger._put_messages_chunk(MessagesChunk(_message_type, _target_ids), _message_queues)
@@ -45,6 +45,11 @@ class IndexStrategy(abc.ABC):
       (should include identifiers like version numbers in subclass name)
     '''
     CURRENT_STRATEGY_CHECKSUM: typing.ClassVar[ChecksumIri]  # set on subclasses to protect against accidents
+    # iris of IndexcardDerivers whose output this strategy indexes -- if set, index messages
+    # for an index card are sent only when one of these derivers' output changed (if None, always)
+    # -- so set only if every input to this strategy's documents that derive may change (the
+    # card's rdf, with supplements) also changes one of these derivers' output
+    SUBSCRIBED_DERIVER_IRIS: typing.ClassVar[frozenset[str] | None] = None
 
     strategy_name: str
     strategy_check: str = ''  # if unspecified, uses current checksum
@@ -88,6 +93,12 @@ class IndexStrategy(abc.ABC):
     def is_current(self) -> bool:
         return self.strategy_check == self.CURRENT_STRATEGY_CHECKSUM.hexdigest
 
+    def is_subscribed_to_any(self, deriver_iris: typing.Iterable[str]) -> bool:
+        return (
+            self.SUBSCRIBED_DERIVER_IRIS is None
+            or not self.SUBSCRIBED_DERIVER_IRIS.isdisjoint(deriver_iris)
+        )
+
     def assert_message_type(self, message_type: messages.MessageType):
         if message_type not in self.supported_message_types:
             raise IndexStrategyError(f'Invalid message_type "{message_type}" (expected {self.supported_message_types})')
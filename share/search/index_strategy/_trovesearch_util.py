@@ -9,9 +9,10 @@ import json
 import logging
 import typing
 
-from django.db.models import Exists, OuterRef
+from django.db.models import Exists, OuterRef, Prefetch
 from primitive_metadata import primitive_rdf as rdf
 
+from share import models as share_db
 from trove import models as trove_db
 from trove.trovesearch.search_params import (
     is_globpath,
@@ -53,15 +54,23 @@ def latest_resource_description_for_indexcard_pks(indexcard_pks):
         .filter(Exists(  # only index items that have an osfmap_json representation
             trove_db.DerivedIndexcard.objects
             .filter(upriver_indexcard_id=OuterRef('indexcard_id'))
-            .filter(deriver_identifier__in=(
+            .filter(deriver_identifier_id=(
                 trove_db.ResourceIdentifier.objects
-                .queryset_for_iri(TROVE['derive/osfmap_json'])
+                .cached_id_for_iri(TROVE['derive/osfmap_json'])
             ))
         ))
         .exclude(indexcard__deleted__isnull=False)
-        .select_related('indexcard__source_record_suid__source_config')
+        .annotate(has_forecompat_replacement=(  # for the whole chunk at once
+            share_db.SourceUniqueIdentifier
+            .has_forecompat_replacement_expression('indexcard__source_record_suid')
+        ))
+        .select_related('indexcard__source_record_suid__source_config', 'turtle_blob')
+        .defer('turtle_blob__content')  # (rdf read pre-parsed, when packed)
         .prefetch_related('indexcard__focus_identifier_set')
-        .prefetch_related('indexcard__supplementary_description_set')
+        .prefetch_related(Prefetch(
+            'indexcard__supplementary_description_set__turtle_blob',
+            queryset=trove_db.TurtleBlob.objects.defer('content'),
+        ))
     )
 
 
@@ -2,9 +2,11 @@ from __future__ import annotations
 import abc
 import collections
 from collections.abc import Mapping
+import concurrent.futures
 import dataclasses
 import functools
 from http import HTTPStatus
+import itertools
 import logging
 import types
 import typing
@@ -26,6 +28,9 @@ from ._indexnames import (
 
 logger = logging.getLogger(__name__)
 
+# actions per bulk request (the default for elasticsearch bulk helpers)
+BULK_CHUNK_SIZE = 500
+
 
 class Elastic8IndexStrategy(IndexStrategy):
     '''abstract base class for index strategies using elasticsearch 8
@@ -175,11 +180,8 @@ class Elastic8IndexStrategy(IndexStrategy):
     def pls_handle_messages_chunk(self, messages_chunk):
         self.assert_message_type(messages_chunk.message_type)
         _action_tracker = _ActionTracker()
-        _bulk_stream = streaming_bulk(
-            self.es8_client,
+        _bulk_stream = self._bulk_stream(
             self._elastic_actions_with_index(messages_chunk, _action_tracker),
-            raise_on_error=False,
-            max_retries=settings.ELASTICSEARCH['MAX_RETRIES'],
         )
         _affected_indexnames: set[str] = set()
         for (_ok, _response) in _bulk_stream:
@@ -270,17 +272,55 @@ class Elastic8IndexStrategy(IndexStrategy):
     def _alias_for_keeping_live(self):
         return combine_indexname_parts(self.strategy_name, 'live')
 
+    def _bulk_stream(self, elastic_actions: typing.Iterable[dict]) -> typing.Iterator[tuple[bool, dict]]:
+        _thread_count = settings.ELASTICSEARCH['BULK_THREAD_COUNT']
+        if _thread_count <= 1:
+            return self._streaming_bulk(elastic_actions)
+        return self._parallel_streaming_bulk(elastic_actions, _thread_count)
+
+    def _streaming_bulk(self, elastic_actions: typing.Iterable[dict]) -> typing.Iterator[tuple[bool, dict]]:
+        return iter(streaming_bulk(  # (a generator, typed as merely iterable)
+            self.es8_client,
+            elastic_actions,
+            chunk_size=BULK_CHUNK_SIZE,
+            raise_on_error=False,
+            max_retries=settings.ELASTICSEARCH['MAX_RETRIES'],
+        ))
+
+    def _parallel_streaming_bulk(
+        self,
+        elastic_actions: typing.Iterable[dict],
+        thread_count: int,
+    ) -> typing.Iterator[tuple[bool, dict]]:
+        # like elasticsearch's `parallel_bulk` (up to `thread_count` bulk requests in flight),
+        # but each chunk sent with `streaming_bulk`, to retry with backoff like the sequential path
+        # (actions built and responses handled in this thread, while earlier chunks are in
+        # flight -- only bulk requests are sent from pool threads, so the `_ActionTracker`
+        # is used from this thread only)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=thread_count) as _executor:
+            _in_flight: collections.deque[concurrent.futures.Future] = collections.deque()
+            for _actions_chunk in itertools.batched(elastic_actions, BULK_CHUNK_SIZE):
+                _in_flight.append(_executor.submit(self._streaming_bulk_list, _actions_chunk))
+                if len(_in_flight) >= thread_count:
+                    yield from _in_flight.popleft().result()
+            while _in_flight:
+                yield from _in_flight.popleft().result()
+
+    def _streaming_bulk_list(self, elastic_actions: typing.Iterable[dict]) -> list[tuple[bool, dict]]:
+        return list(self._streaming_bulk(elastic_actions))
+
     def _elastic_actions_with_index(
         self,
         messages_chunk: messages.MessagesChunk,
         action_tracker: _ActionTracker,
     ):
+        # resolve index names once per chunk (not once per action)
+        _indexnames_by_subname = self._get_indexnames_by_subname(
+            is_backfill_action=messages_chunk.message_type.is_backfill,
+        )
         for _actionset in self.build_elastic_actions(messages_chunk):
             for _index_subname, _elastic_actions in _actionset.actions_by_subname.items():
-                _indexnames = self._get_indexnames_for_action(
-                    index_subname=_index_subname,
-                    is_backfill_action=messages_chunk.message_type.is_backfill,
-                )
+                _indexnames = _indexnames_by_subname.get(_index_subname, ())
                 for _elastic_action in _elastic_actions:
                     _docid = _elastic_action['_id']
                     for _indexname in _indexnames:
@@ -293,19 +333,20 @@ class Elastic8IndexStrategy(IndexStrategy):
                         yield _elastic_action_with_index
             action_tracker.done_scheduling(_actionset.message_target_id)
 
-    def _get_indexnames_for_action(
+    def _get_indexnames_by_subname(
         self,
-        index_subname: str,
         *,
         is_backfill_action: bool = False,
-    ) -> set[str]:
+    ) -> dict[str, set[str]]:
         if is_backfill_action:
-            return {self.get_index(index_subname).full_index_name}
-        return {
-            _index.full_index_name
-            for _index in self.each_live_index()
-            if _index.subname == index_subname
-        }
+            return {
+                _index.subname: {_index.full_index_name}
+                for _index in self.each_subnamed_index()
+            }
+        _indexnames_by_subname: dict[str, set[str]] = collections.defaultdict(set)
+        for _index in self.each_live_index():  # one alias lookup
+            _indexnames_by_subname[_index.subname].add(_index.full_index_name)
+        return _indexnames_by_subname
 
     def _get_indexnames_for_alias(self, alias_name) -> set[str]:
         try:
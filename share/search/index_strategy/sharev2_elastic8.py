@@ -24,6 +24,7 @@ class Sharev2Elastic8IndexStrategy(Elastic8IndexStrategy):
         salt='Sharev2Elastic8IndexStrategy',
         hexdigest='bcaa90e8fa8a772580040a8edbedb5f727202d1fca20866948bc0eb0e935e51f',
     )
+    SUBSCRIBED_DERIVER_IRIS = frozenset({SHAREv2.sharev2_elastic})
 
     # abstract method from IndexStrategy
     @property
@@ -149,13 +150,20 @@ class Sharev2Elastic8IndexStrategy(Elastic8IndexStrategy):
                 else self.build_index_action(_doc_id, _source_doc)
             ))
         # delete any leftovers
-        for _leftover_suid in SourceUniqueIdentifier.objects.filter(id__in=_suid_ids):
-            _suid_ids.discard(_leftover_suid.id)
-            try:
-                _suid_for_doc_id = _leftover_suid.get_backcompat_sharev2_suid().id
-            except SourceUniqueIdentifier.DoesNotExist:
-                _suid_for_doc_id = _leftover_suid.id
-            yield _make_actionset(_leftover_suid.id, self.build_delete_action(
+        _leftover_suid_qs = (
+            SourceUniqueIdentifier.objects
+            .filter(id__in=_suid_ids)
+            .annotate(backcompat_suid_id=SourceUniqueIdentifier.backcompat_sharev2_suid_id_expression())
+            .values_list('id', 'backcompat_suid_id')
+        )
+        for _leftover_suid_id, _backcompat_suid_id in _leftover_suid_qs:
+            _suid_ids.discard(_leftover_suid_id)
+            _suid_for_doc_id = (
+                _leftover_suid_id
+                if _backcompat_suid_id is None
+                else _backcompat_suid_id
+            )
+            yield _make_actionset(_leftover_suid_id, self.build_delete_action(
                 self._get_doc_id(_suid_for_doc_id),
             ))
         # these ones don't even exist!
@@ -171,7 +179,8 @@ class Sharev2Elastic8IndexStrategy(Elastic8IndexStrategy):
         _card_qs = (
             DerivedIndexcard.objects
             .filter(upriver_indexcard__source_record_suid_id__in=suid_ids)
-            .filter(deriver_identifier__in=ResourceIdentifier.objects.queryset_for_iri(SHAREv2.sharev2_elastic))
+            .filter(deriver_identifier_id=ResourceIdentifier.objects.cached_id_for_iri(SHAREv2.sharev2_elastic))
+            .select_related('derived_blob')
             .annotate(suid_id=F('upriver_indexcard__source_record_suid_id'))
         )
         for _card in _card_qs:
@@ -22,13 +22,17 @@ from share.search import exceptions
 from share.search import messages
 from share.search.index_strategy._base import IndexStrategy
 from share.search.index_strategy.elastic8 import Elastic8IndexStrategy
+from share.search.search_result_cache import with_cached_aggregations
 from share.util.checksum_iri import ChecksumIri
 from trove import models as trove_db
 from trove.trovesearch.page_cursor import (
     MANY_MORE,
+    MAX_PAGE_SIZE,
+    FirstPageThenSearchAfterCursor,
     OffsetCursor,
     PageCursor,
     ReproduciblyRandomSampleCursor,
+    SearchAfterCursor,
 )
 from trove.trovesearch.search_params import (
     CardsearchParams,
@@ -50,7 +54,7 @@ from trove.util.propertypath import (
     Propertypath,
 )
 from trove.vocab import osfmap
-from trove.vocab.namespaces import OWL, RDF
+from trove.vocab.namespaces import OWL, RDF, TROVE
 from . import _trovesearch_util as ts
 
 
@@ -64,6 +68,20 @@ _PRIOR_UNSPLIT_STRATEGY_CHECKSUM = ChecksumIri(
 )
 _UNSPLIT_INDEX_SUBNAME = ''
 
+# how long to keep a point-in-time open between pages of a sorted cardsearch
+_CARDSEARCH_PIT_KEEP_ALIVE = '5m'
+
+# unique tiebreaker for sorted cardsearch (so sort values from any page can be searched after)
+_CARDSEARCH_TIEBREAKER_SORT = {'card.card_pk': 'asc'}
+
+# greatest `_shard_doc` sort value, to search after all docs with the same sort values
+# (within a point-in-time, which adds `_shard_doc` as an implicit last sort)
+_LAST_SHARD_DOC = 2 ** 63 - 1
+
+# how many field names (by propertypath) to remember while building queries
+# (a few distinct paths, each seen in many queries)
+_FIELD_NAME_CACHE_SIZE = 1024
+
 
 def _is_unsplit_strat(strategy: TrovesearchDenormIndexStrategy) -> bool:
     return (strategy.strategy_check == _PRIOR_UNSPLIT_STRATEGY_CHECKSUM.hexdigest)
@@ -75,6 +93,10 @@ class TrovesearchDenormIndexStrategy(Elastic8IndexStrategy):
         salt='TrovesearchDenormIndexStrategy',
         hexdigest='ef44d5bc272589754b3b0753e5ee61719349fd96284b62ecafab1d0cb043bde9',
     )
+    # indexes only cards with osfmap_json, which renders the same rdf read here (reachable
+    # from the focus, with supplements, less osfmap:contains, which is skipped here too)
+    # -- see tests/share/search/index_strategy/test_trovesearch_denorm_subscription.py
+    SUBSCRIBED_DERIVER_IRIS = frozenset({TROVE['derive/osfmap_json']})
 
     # abstract method from Elastic8IndexStrategy
     @classmethod
@@ -284,50 +306,117 @@ class TrovesearchDenormIndexStrategy(Elastic8IndexStrategy):
         _search_kwargs = _querybuilder.build()
         if settings.DEBUG:
             logger.info(json.dumps(_search_kwargs, indent=2))
+        _cursor = _querybuilder.response_cursor
         try:
-            _es8_response = self.es8_client.search(
-                index=self.cardsearch_index().full_index_name,
-                source=False,  # no need to get _source, identifiers are enough
-                docvalue_fields=['card.card_iri'],
-                highlight={
-                    'require_field_match': False,
-                    'fields': {'card.text_by_propertypath.*': {}},
-                },
-                **_search_kwargs,
+            _es8_response = (
+                self._search_cards_after(_cursor, _search_kwargs)
+                if isinstance(_cursor, SearchAfterCursor)
+                else self._search_cards(index=self.cardsearch_index().full_index_name, **_search_kwargs)
             )
         except elasticsearch8.TransportError as error:
             raise exceptions.IndexStrategyError() from error  # TODO: error messaging
         return self._cardsearch_handle(
             cardsearch_params,
             _es8_response,
-            _querybuilder.response_cursor,
+            _cursor,
+        )
+
+    def _search_cards(self, **search_kwargs):
+        return self.es8_client.search(
+            source=False,  # no need to get _source, identifiers are enough
+            docvalue_fields=['card.card_iri'],
+            highlight={
+                'require_field_match': False,
+                'fields': {'card.text_by_propertypath.*': {}},
+            },
+            **search_kwargs,
+        )
+
+    def _search_cards_after(self, cursor: SearchAfterCursor, search_kwargs: dict):
+        # the first page is a plain search (most never go further); a point-in-time,
+        # for consistent results across pages, is opened only when the next page is requested
+        # -- or from the first page, when streaming every page (e.g. `page[size]=all`)
+        _es8_response = (
+            self._search_cards(index=self.cardsearch_index().full_index_name, **search_kwargs)
+            if cursor.is_first_page() and not cursor.has_unbounded_page_size()
+            else self._search_cards_in_pit(cursor, search_kwargs)
         )
+        # one extra hit was requested, to tell whether there's another page in the
+        # direction searched (the next page or, paging back, the previous page)
+        _hits = _es8_response['hits']['hits']
+        _has_more = len(_hits) > cursor.bounded_page_size
+        del _hits[cursor.bounded_page_size:]
+        if cursor.is_paging_back():
+            _hits.reverse()  # (searched in reverse order)
+            (_has_prev, _has_next) = (_has_more, True)
+        else:
+            (_has_prev, _has_next) = (not cursor.is_first_page(), _has_more)
+        _sort_length = len(search_kwargs['sort'])  # (without any implicit `_shard_doc` from a point-in-time)
+        cursor.prev_search_before = _hits[0]['sort'][:_sort_length] if (_has_prev and _hits) else None
+        cursor.next_search_after = _hits[-1]['sort'][:_sort_length] if (_has_next and _hits) else None
+        if (cursor.next_search_after is None) and (cursor.pit_id is not None):
+            # last page; no need to keep the point-in-time around (paging back opens another)
+            self.es8_client.close_point_in_time(id=cursor.pit_id)
+        return _es8_response
+
+    def _search_cards_in_pit(self, cursor: SearchAfterCursor, search_kwargs: dict):
+        _search_kwargs = (
+            {  # (after all with the same sort values, including the implicit `_shard_doc`)
+                **search_kwargs,
+                'search_after': [*search_kwargs['search_after'], _LAST_SHARD_DOC],
+            }
+            if 'search_after' in search_kwargs
+            else search_kwargs  # (first page)
+        )
+        if cursor.pit_id is not None:
+            try:
+                _es8_response = self._search_cards(
+                    pit={'id': cursor.pit_id, 'keep_alive': _CARDSEARCH_PIT_KEEP_ALIVE},
+                    **_search_kwargs,
+                )
+            except elasticsearch8.NotFoundError:  # point-in-time expired; open another
+                cursor.pit_id = None
+        if cursor.pit_id is None:
+            cursor.pit_id = self.es8_client.open_point_in_time(
+                index=self.cardsearch_index().full_index_name,
+                keep_alive=_CARDSEARCH_PIT_KEEP_ALIVE,
+            )['id']
+            _es8_response = self._search_cards(
+                pit={'id': cursor.pit_id, 'keep_alive': _CARDSEARCH_PIT_KEEP_ALIVE},
+                **_search_kwargs,
+            )
+        cursor.pit_id = _es8_response.get('pit_id', cursor.pit_id)
+        return _es8_response
 
     # abstract method from IndexStrategy
     def pls_handle_valuesearch(self, valuesearch_params: ValuesearchParams) -> ValuesearchHandle:
         _path = valuesearch_params.valuesearch_propertypath
-        _cursor = OffsetCursor.from_cursor(valuesearch_params.page_cursor)
-        _is_date_search = osfmap.is_date_property(_path[-1])
-        if _is_date_search:
-            _index = self.cardsearch_index()
-            _query = _build_date_valuesearch(valuesearch_params)
-        else:
-            _index = self.irivaluesearch_index()
-            _query = _build_iri_valuesearch(valuesearch_params, _cursor)
-        if settings.DEBUG:
-            logger.info(json.dumps(_query, indent=2))
-        try:
-            _es8_response = self.es8_client.search(
-                **_query,
-                index=_index.full_index_name,
+        if osfmap.is_date_property(_path[-1]):
+            _aggregations = self._search_aggregations(
+                self.cardsearch_index(),
+                _build_date_valuesearch(valuesearch_params),
             )
-        except elasticsearch8.TransportError as error:
-            raise exceptions.IndexStrategyError() from error  # TODO: error messaging
-        return (
-            self._valuesearch_dates_response(valuesearch_params, _es8_response)
-            if _is_date_search
-            else self._valuesearch_iris_response(valuesearch_params, _es8_response, _cursor)
+            return self._valuesearch_dates_response(valuesearch_params, _aggregations)
+        _cursor = _valuesearch_cursor(valuesearch_params.page_cursor)
+        _aggregations = self._search_aggregations(
+            self.irivaluesearch_index(),
+            _build_iri_valuesearch(valuesearch_params, _cursor),
         )
+        return self._valuesearch_iris_response(valuesearch_params, _aggregations, _cursor)
+
+    def _search_aggregations(self, index: IndexStrategy.SpecificIndex, query: dict) -> dict:
+        # aggregation results are cached (if configured) by the whole query, including
+        # any composite "after" key -- each page of buckets computed once per index update
+        if settings.DEBUG:
+            logger.info(json.dumps(query, indent=2))
+
+        def _search() -> dict:
+            try:
+                _es8_response = self.es8_client.search(**query, index=index.full_index_name)
+            except elasticsearch8.TransportError as error:
+                raise exceptions.IndexStrategyError() from error  # TODO: error messaging
+            return _es8_response['aggregations']
+        return with_cached_aggregations(self, {'index': index.subname, **query}, _search)
 
     ###
     # building sourcedocs
@@ -340,18 +429,24 @@ class TrovesearchDenormIndexStrategy(Elastic8IndexStrategy):
         chunk_timestamp: int
         indexcard: trove_db.Indexcard = dataclasses.field(init=False)
         focus_iri: str = dataclasses.field(init=False)
-        rdfdoc: rdf.RdfTripleDictionary = dataclasses.field(init=False)
+        rdfdoc: rdf.RdfGraph = dataclasses.field(init=False)
 
         def __post_init__(self) -> None:
             self.indexcard = self.resource_description.indexcard
             self.focus_iri = self.resource_description.focus_iri
-            self.rdfdoc = self.resource_description.as_rdfdoc_with_supplements()
+            self.rdfdoc = self.resource_description.as_shared_rdfdoc_with_supplements()
 
         def should_skip(self) -> bool:
-            _suid = self.indexcard.source_record_suid
+            _has_forecompat_replacement = getattr(  # annotated by `latest_resource_description_for_indexcard_pks`
+                self.resource_description,
+                'has_forecompat_replacement',
+                None,
+            )
+            if _has_forecompat_replacement is None:
+                _has_forecompat_replacement = self.indexcard.source_record_suid.has_forecompat_replacement()
             return (
                 # skip cards that belong to an obsolete suid with a later duplicate
-                _suid.has_forecompat_replacement()
+                _has_forecompat_replacement
                 # ...or that are without some value for name/title/label
                 or not any(self.rdfdoc.q(self.focus_iri, osfmap.NAMELIKE_PROPERTIES))
             )
@@ -402,7 +497,7 @@ class TrovesearchDenormIndexStrategy(Elastic8IndexStrategy):
                 'value_title': list(self._texts_at_properties(_shortwalk, osfmap.TITLE_PROPERTIES)),
                 'value_label': list(self._texts_at_properties(_shortwalk, osfmap.LABEL_PROPERTIES)),
                 'at_card_propertypaths': [
-                    ts.propertypath_as_keyword(_path)
+                    _path_keyword(_path)
                     for _path in self._fullwalk.paths_by_iri[iri]
                 ],
             }
@@ -425,7 +520,7 @@ class TrovesearchDenormIndexStrategy(Elastic8IndexStrategy):
 
         def _propertypaths_present(self, walk: ts.GraphWalk):
             return [
-                ts.propertypath_as_keyword(_path)
+                _path_keyword(_path)
                 for _path in walk.paths_walked
             ]
 
@@ -485,20 +580,46 @@ class TrovesearchDenormIndexStrategy(Elastic8IndexStrategy):
     def _valuesearch_iris_response(
         self,
         valuesearch_params: ValuesearchParams,
-        es8_response: dict,
-        cursor: OffsetCursor,
+        aggregations: dict,
+        cursor: FirstPageThenSearchAfterCursor,
     ) -> ValuesearchHandle:
-        _iri_aggs = es8_response['aggregations'].get('agg_valuesearch_iris')
-        _buckets = _iri_aggs['buckets']
-        _bucket_count = len(_buckets)
-        # WARNING: terribly hacky pagination (part two)
-        _page_end_index = cursor.start_offset + cursor.bounded_page_size
-        _bucket_page = _buckets[cursor.start_offset:_page_end_index]  # discard prior pages
-        cursor.total_count = (
-            MANY_MORE
-            if (_bucket_count > _page_end_index)  # agg includes one more, if there
-            else _bucket_count
+        _iri_agg = aggregations['agg_valuesearch_iris']
+        _buckets = [  # without values on the first page (skipped here, by the cursor's bound)
+            _bucket
+            for _bucket in _iri_agg['buckets']
+            if not _is_on_first_page(_bucket, cursor)
+        ]
+        # one extra bucket was requested, to tell whether there's more in the direction
+        # searched (on later pages, with room for skipping those on the first page)
+        _bucket_page = _buckets[:cursor.bounded_page_size]
+        _next_after_bucket: dict | None = (
+            _bucket_page[-1]
+            if len(_buckets) > cursor.bounded_page_size
+            else (  # short page, but more after those skipped
+                _iri_agg['buckets'][-1]
+                if len(_iri_agg['buckets']) >= _iri_agg_size(cursor)
+                else None
+            )
         )
+        if cursor.is_first_page():  # most common values (excluded from later pages)
+            if _bucket_page:
+                cursor.first_page_bound = _first_page_sort_values(_bucket_page[-1])
+            cursor.prev_search_before = None
+        else:
+            if cursor.is_paging_back():
+                _bucket_page.reverse()  # (searched in reverse order)
+                _next_after_bucket = _bucket_page[-1] if _bucket_page else None
+            cursor.prev_search_before = [_bucket_value_iri(_bucket_page[0])] if _bucket_page else None
+        if _next_after_bucket is not None:
+            cursor.next_search_after = (
+                []  # from the start of the rest
+                if cursor.is_first_page()
+                else [_bucket_value_iri(_next_after_bucket)]
+            )
+            cursor.total_count = MANY_MORE
+        else:
+            cursor.next_search_after = None
+            cursor.total_count = cursor.start_offset + len(_bucket_page)
         return ValuesearchHandle(
             cursor=cursor,
             search_result_page=[
@@ -511,13 +632,9 @@ class TrovesearchDenormIndexStrategy(Elastic8IndexStrategy):
     def _valuesearch_dates_response(
         self,
         valuesearch_params: ValuesearchParams,
-        es8_response: dict,
+        aggregations: dict,
     ) -> ValuesearchHandle:
-        _year_buckets = (
-            es8_response['aggregations']
-            ['agg_valuesearch_dates']
-            ['buckets']
-        )
+        _year_buckets = aggregations['agg_valuesearch_dates']['buckets']
         return ValuesearchHandle(
             cursor=PageCursor(len(_year_buckets)),
             search_result_page=[
@@ -529,7 +646,7 @@ class TrovesearchDenormIndexStrategy(Elastic8IndexStrategy):
 
     def _valuesearch_iri_result(self, iri_bucket) -> ValuesearchResult:
         return ValuesearchResult(
-            value_iri=iri_bucket['key'],
+            value_iri=_bucket_value_iri(iri_bucket),
             value_type=_bucketlist(iri_bucket.get('agg_type_iri', [])),
             name_text=_bucketlist(iri_bucket.get('agg_value_name', [])),
             title_text=_bucketlist(iri_bucket.get('agg_value_title', [])),
@@ -549,7 +666,7 @@ class TrovesearchDenormIndexStrategy(Elastic8IndexStrategy):
         self,
         cardsearch_params: CardsearchParams,
         es8_response: dict,
-        cursor: OffsetCursor,
+        cursor: PageCursor,
     ) -> CardsearchHandle:
         _es8_total = es8_response['hits']['total']
         if _es8_total['relation'] != 'eq':
@@ -574,7 +691,7 @@ class TrovesearchDenormIndexStrategy(Elastic8IndexStrategy):
                 for _path in cardsearch_params.related_property_paths
             )
             _relatedproperty_by_pathkey = {
-                ts.propertypath_as_keyword(_result.property_path): _result
+                _path_keyword(_result.property_path): _result
                 for _result in _relatedproperty_list
             }
             for _bucket in es8_response['aggregations']['agg_related_propertypath_usage']['buckets']:
@@ -676,7 +793,7 @@ class _QueryHelper:
 
     def _path_presence_query(self, path: Propertypath):
         _field = f'{self.base_field}.propertypaths_present'
-        return {'term': {_field: ts.propertypath_as_keyword(path)}}
+        return {'term': {_field: _path_keyword(path)}}
 
     def _iri_filter(self, search_filter) -> dict:
         _iris = ts.suffuniq_iris(search_filter.value_set)
@@ -686,13 +803,7 @@ class _QueryHelper:
         ])
 
     def _path_iri_query(self, path, suffuniq_iris):
-        if path == (OWL.sameAs,):
-            _field = f'{self.base_field}.focus_iri_synonyms'
-        elif is_globpath(path):
-            _field = f'{self.base_field}.iri_by_depth.{_depth_field_name(len(path))}'
-        else:
-            _field = f'{self.base_field}.iri_by_propertypath.{_path_field_name(path)}'
-        return {'terms': {_field: suffuniq_iris}}
+        return {'terms': {_iri_field_name(self.base_field, path): suffuniq_iris}}
 
     def _date_filter(self, search_filter):
         return _any_query([
@@ -717,11 +828,7 @@ class _QueryHelper:
             raise ValueError(f'invalid date filter operator (got {filter_operator})')
 
     def _text_field_name(self, propertypath: Propertypath):
-        return (
-            f'{self.base_field}.text_by_depth.{_depth_field_name(len(propertypath))}'
-            if is_globpath(propertypath)
-            else f'{self.base_field}.text_by_propertypath.{_path_field_name(propertypath)}'
-        )
+        return _text_field_name(self.base_field, propertypath)
 
 
 @dataclasses.dataclass
@@ -729,17 +836,34 @@ class _CardsearchQueryBuilder:
     params: CardsearchParams
 
     def build(self):
-        return {
+        _search_kwargs = {
             'query': self._cardsearch_query(),
             'aggs': self._cardsearch_aggs(),
-            'sort': list(self._cardsearch_sorts()) or None,
-            'from_': self._cardsearch_start_offset(),
+            'sort': list(self._cardsearch_sorts()) or self._default_sorts(),
             'size': self.response_cursor.bounded_page_size,
         }
+        if isinstance(self.response_cursor, SearchAfterCursor):
+            _search_kwargs['sort'].append(_CARDSEARCH_TIEBREAKER_SORT)
+            _search_kwargs['size'] += 1  # one extra, to tell whether there's a next page
+            if self.response_cursor.is_paging_back():
+                # the previous page: after the next page's first result, in reverse order
+                _search_kwargs['sort'] = [_reversed_sort(_sort) for _sort in _search_kwargs['sort']]
+                _search_kwargs['search_after'] = self.response_cursor.search_before
+            elif self.response_cursor.search_after is not None:
+                _search_kwargs['search_after'] = self.response_cursor.search_after
+        else:
+            _search_kwargs['from_'] = self._cardsearch_start_offset()
+        return _search_kwargs
 
     @functools.cached_property
-    def response_cursor(self) -> OffsetCursor:
+    def response_cursor(self) -> OffsetCursor | SearchAfterCursor:
         _request_cursor = self.params.page_cursor
+        if isinstance(_request_cursor, SearchAfterCursor) or (
+            # sorted by field value (or exporting every result); can page deeply with `search_after`
+            _request_cursor.is_basic()
+            and (self.params.sort_list or _request_cursor.has_unbounded_page_size())
+        ):
+            return SearchAfterCursor.from_cursor(_request_cursor)
         if (
             _request_cursor.is_basic()
             and not self.params.sort_list
@@ -749,6 +873,7 @@ class _CardsearchQueryBuilder:
         return OffsetCursor.from_cursor(_request_cursor)
 
     def _cardsearch_start_offset(self):
+        assert isinstance(self.response_cursor, OffsetCursor)
         if (
             self.response_cursor.is_first_page()
             or not isinstance(self.response_cursor, ReproduciblyRandomSampleCursor)
@@ -809,13 +934,23 @@ class _CardsearchQueryBuilder:
             _aggs['agg_related_propertypath_usage'] = {'terms': {
                 'field': 'card.propertypaths_present',
                 'include': [
-                    ts.propertypath_as_keyword(_path)
+                    _path_keyword(_path)
                     for _path in self.params.related_property_paths
                 ],
                 'size': len(self.params.related_property_paths),
             }}
         return _aggs
 
+    def _default_sorts(self) -> list | None:
+        if not isinstance(self.response_cursor, SearchAfterCursor):
+            return None  # default relevance (or random) order
+        # `search_after` needs explicit sort values (followed by a tiebreaker; see `build`)
+        return (
+            ['_score']
+            if self.params.cardsearch_searchtext
+            else []
+        )
+
     def _cardsearch_sorts(self):
         for _sortparam in self.params.sort_list:
             _fieldkey = _path_field_name(_sortparam.propertypath)
@@ -836,11 +971,61 @@ class _CardsearchQueryBuilder:
             }}
 
 
-def _build_iri_valuesearch(params: ValuesearchParams, cursor: OffsetCursor) -> dict:
+def _reversed_sort(sort: str | dict) -> dict:
+    # the same sort in reverse order (for paging back with `search_after`)
+    if isinstance(sort, str):
+        sort = {sort: {}}
+    ((_field, _options),) = sort.items()
+    if isinstance(_options, str):
+        _options = {'order': _options}
+    _order = _options.get('order', ('desc' if _field == '_score' else 'asc'))
+    _reversed = {**_options, 'order': ('asc' if _order == 'desc' else 'desc')}
+    if _field != '_score':
+        _missing = _options.get('missing', '_last')
+        _reversed['missing'] = {'_last': '_first', '_first': '_last'}.get(_missing, _missing)
+    return {_field: _reversed}
+
+
+def _valuesearch_cursor(request_cursor: PageCursor) -> FirstPageThenSearchAfterCursor:
+    return (
+        dataclasses.replace(request_cursor)
+        if isinstance(request_cursor, FirstPageThenSearchAfterCursor)
+        else FirstPageThenSearchAfterCursor(page_size=request_cursor.page_size)  # start from the first page
+    )
+
+
+def _bucket_value_iri(iri_bucket: dict) -> str:
+    _key = iri_bucket['key']
+    return _key['value_iri'] if isinstance(_key, dict) else _key  # (composite or terms bucket)
+
+
+def _first_page_sort_values(iri_bucket: dict) -> list:
+    # the first page is the most common values: by count (descending), then value iri
+    return [iri_bucket['doc_count'], _bucket_value_iri(iri_bucket)]
+
+
+def _is_on_first_page(iri_bucket: dict, cursor: FirstPageThenSearchAfterCursor) -> bool:
+    if cursor.is_first_page() or not cursor.first_page_bound:
+        return False
+    (_bound_count, _bound_iri) = cursor.first_page_bound
+    (_count, _iri) = _first_page_sort_values(iri_bucket)
+    return (_count > _bound_count) or (_count == _bound_count and _iri <= _bound_iri)
+
+
+def _iri_agg_size(cursor: FirstPageThenSearchAfterCursor) -> int:
+    _size = cursor.bounded_page_size + 1  # one extra, to tell whether there's more
+    if not cursor.is_first_page():
+        # values on the first page are skipped from the rest (see `_is_on_first_page`)
+        # -- also request as many extra as were on the first page (at most a page)
+        _size += int(min(cursor.page_size, MAX_PAGE_SIZE))
+    return _size
+
+
+def _build_iri_valuesearch(params: ValuesearchParams, cursor: FirstPageThenSearchAfterCursor) -> dict:
     _path = params.valuesearch_propertypath
     _bool = _BoolBuilder()
     _bool.add_boolpart('filter', {'term': {
-        'iri_value.at_card_propertypaths': ts.propertypath_as_keyword(_path),
+        'iri_value.at_card_propertypaths': _path_keyword(_path),
     }})
     _bool.add_boolparts(
         _QueryHelper(
@@ -858,16 +1043,34 @@ def _build_iri_valuesearch(params: ValuesearchParams, cursor: OffsetCursor) -> d
             relevance_matters=False,
         ).boolparts()
     )
+    if cursor.is_first_page():
+        # the most common values first
+        _iri_agg = {'terms': {
+            'field': 'iri_value.single_focus_iri',
+            'size': _iri_agg_size(cursor),
+            'order': [{'_count': 'desc'}, {'_key': 'asc'}],
+        }}
+    else:
+        # the rest, in a composite aggregation paged by "after" key (the last value
+        # iri on the previous page, or the first on the next page, searching back)
+        # at constant cost per page
+        _after = cursor.search_before if cursor.is_paging_back() else cursor.search_after
+        _iri_agg = {'composite': {
+            'sources': [
+                {'value_iri': {'terms': {
+                    'field': 'iri_value.single_focus_iri',
+                    **({'order': 'desc'} if cursor.is_paging_back() else {}),
+                }}},
+            ],
+            'size': _iri_agg_size(cursor),
+            **({'after': {'value_iri': _after[0]}} if _after else {}),
+        }}
     return {
         'query': _bool.as_query(),
         'size': 0,  # ignore hits; just want the aggs
         'aggs': {
             'agg_valuesearch_iris': {
-                'terms': {
-                    'field': 'iri_value.single_focus_iri',
-                    # WARNING: terribly hacky pagination (part one)
-                    'size': cursor.start_offset + cursor.bounded_page_size + 1,
-                },
+                **_iri_agg,
                 'aggs': {
                     'agg_type_iri': {'terms': {
                         'field': f'iri_value.iri_by_propertypath.{_path_field_name((RDF.type,))}',
@@ -934,8 +1137,30 @@ def _depth_field_name(depth: int) -> str:
     return f'depth{depth}'
 
 
+@functools.lru_cache(maxsize=_FIELD_NAME_CACHE_SIZE)
+def _path_keyword(path: Propertypath) -> str:
+    return ts.propertypath_as_keyword(path)
+
+
+@functools.lru_cache(maxsize=_FIELD_NAME_CACHE_SIZE)
 def _path_field_name(path: Propertypath) -> str:
-    return ts.b64(ts.propertypath_as_keyword(path))
+    return ts.b64(_path_keyword(path))
+
+
+@functools.lru_cache(maxsize=_FIELD_NAME_CACHE_SIZE)
+def _iri_field_name(base_field: str, path: Propertypath) -> str:
+    if path == (OWL.sameAs,):
+        return f'{base_field}.focus_iri_synonyms'
+    if is_globpath(path):
+        return f'{base_field}.iri_by_depth.{_depth_field_name(len(path))}'
+    return f'{base_field}.iri_by_propertypath.{_path_field_name(path)}'
+
+
+@functools.lru_cache(maxsize=_FIELD_NAME_CACHE_SIZE)
+def _text_field_name(base_field: str, path: Propertypath) -> str:
+    if is_globpath(path):
+        return f'{base_field}.text_by_depth.{_depth_field_name(len(path))}'
+    return f'{base_field}.text_by_propertypath.{_path_field_name(path)}'
 
 
 def _parse_path_field_name(path_field_name: str) -> Propertypath:
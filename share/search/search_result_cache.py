@@ -0,0 +1,347 @@
+'''a cache for search results (from `IndexStrategy.pls_handle_cardsearch`/`pls_handle_valuesearch`)
+
+configured by `settings.SEARCH_RESULT_CACHE`, with backend:
+- `'locmem'`: in-process, with LRU eviction (up to `MAX_ENTRIES`) and expiry (`TTL_SECONDS`)
+- `'django'`: a django cache (`DJANGO_CACHE_ALIAS`), with expiry (`TTL_SECONDS`) -- eviction
+  is up to that cache's own configuration (e.g. a redis `maxmemory-policy` of `allkeys-lru`)
+- `''` (default): no cache
+
+cache keys include a fingerprint of the search params (normalized from `to_querydict`)
+and the index strategy's name, check, and "generation" -- the generation is kept in
+the django cache `SHARED_CACHE_ALIAS`, incremented by the indexer daemon after each
+chunk indexed (which invalidates that strategy's cached results); that cache must be
+shared across processes (not locmem), else invalidations from the daemon would never
+reach web workers -- hit/miss counts are kept there too (see the admin "search indexes" page)
+
+to spare round trips to the shared cache, each process checks a strategy's generation
+at most every `GENERATION_CHECK_SECONDS` (so results may be that much staler than
+the index) and adds up its hit/miss counts, flushed to the shared cache at most every
+`COUNT_FLUSH_SECONDS`
+
+only first pages (with a basic page cursor) are cached -- not pages from a `page[cursor]`
+nor streamed downloads -- and without any point-in-time id (which expires, and belongs
+to the request that opened it)
+
+index strategies may also cache aggregation results (e.g. valuesearch buckets) with
+`with_cached_aggregations`, keyed by the whole elasticsearch query (including any
+page cursor, e.g. a composite aggregation's "after" key) -- each page of buckets is
+computed once per generation
+'''
+from __future__ import annotations
+import abc
+import collections
+import copy
+import dataclasses
+from collections import OrderedDict
+from collections.abc import Callable
+import functools
+import hashlib
+import json
+import logging
+import pickle
+import threading
+import time
+import typing
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.exceptions import ImproperlyConfigured
+
+from trove.trovesearch.page_cursor import SearchAfterCursor
+
+if typing.TYPE_CHECKING:
+    from share.search.index_strategy import IndexStrategy
+    from trove.trovesearch.search_handle import BasicSearchHandle
+    from trove.trovesearch.search_params import CardsearchParams
+
+
+__all__ = (
+    'SearchResultCache',
+    'LocmemSearchResultCache',
+    'DjangoSearchResultCache',
+    'get_search_result_cache',
+    'with_search_result_cache',
+    'with_cached_aggregations',
+    'invalidate_strategy',
+    'search_result_cache_counts',
+)
+
+logger = logging.getLogger(__name__)
+
+_KEY_PREFIX = 'share.search.search_result_cache'
+HIT_COUNT_CACHE_KEY = f'{_KEY_PREFIX}--hit_count'
+MISS_COUNT_CACHE_KEY = f'{_KEY_PREFIX}--miss_count'
+
+_SearchHandler = Callable[['CardsearchParams'], 'BasicSearchHandle']
+
+
+class SearchResultCache(abc.ABC):
+    def __init__(
+        self,
+        *,
+        ttl_seconds: int,
+        max_entries: int,
+        generation_check_seconds: float,
+        count_flush_seconds: float,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.generation_check_seconds = generation_check_seconds
+        self.count_flush_seconds = count_flush_seconds
+        self._local_lock = threading.Lock()
+        self._generations: dict[str, tuple[float, int]] = {}  # (expiry, generation) by key
+        self._unflushed_counts: collections.Counter[str] = collections.Counter()
+        self._last_count_flush = time.monotonic()
+
+    @abc.abstractmethod
+    def get_bytes(self, key: str) -> bytes | None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def set_bytes(self, key: str, value: bytes) -> None:
+        raise NotImplementedError
+
+    def cached_handler(self, index_strategy: IndexStrategy, handler: _SearchHandler) -> _SearchHandler:
+        def _cached_handler(search_params: CardsearchParams) -> BasicSearchHandle:
+            if not _is_cacheable(search_params):
+                return handler(search_params)
+            _key = self.cache_key(index_strategy, params_fingerprint(search_params))
+            _cached = self.get_bytes(_key)
+            if _cached is not None:
+                self.count(HIT_COUNT_CACHE_KEY)
+                _handle = pickle.loads(_cached)
+                _handle.search_params = search_params  # for any streamed pages that follow
+                return _handle
+            self.count(MISS_COUNT_CACHE_KEY)
+            _handle = handler(search_params)
+            self.set_bytes(_key, _pickle_handle(_handle))
+            return _handle
+        return _cached_handler
+
+    def cached_aggregations(
+        self,
+        index_strategy: IndexStrategy,
+        query: dict,
+        search: Callable[[], dict],
+    ) -> dict:
+        _key = self.cache_key(index_strategy, query_fingerprint(query))
+        _cached = self.get_bytes(_key)
+        if _cached is not None:
+            self.count(HIT_COUNT_CACHE_KEY)
+            return json.loads(_cached)
+        self.count(MISS_COUNT_CACHE_KEY)
+        _aggregations = search()
+        self.set_bytes(_key, json.dumps(_aggregations).encode())
+        return _aggregations
+
+    def cache_key(self, index_strategy: IndexStrategy, fingerprint: str) -> str:
+        return '--'.join((
+            _KEY_PREFIX,
+            index_strategy.strategy_name,
+            index_strategy.strategy_check,
+            str(self.get_generation(index_strategy)),
+            fingerprint,
+        ))
+
+    def get_generation(self, index_strategy: IndexStrategy) -> int:
+        # from the shared cache, at most every `generation_check_seconds`
+        _key = _generation_key(index_strategy)
+        _now = time.monotonic()
+        with self._local_lock:
+            _expiry, _generation = self._generations.get(_key, (_now, 0))
+        if _expiry <= _now:
+            _generation = _get_shared_cache().get(_key, 0)
+            with self._local_lock:
+                self._generations[_key] = (_now + self.generation_check_seconds, _generation)
+        return _generation
+
+    def forget_generation(self, index_strategy: IndexStrategy) -> None:
+        with self._local_lock:
+            self._generations.pop(_generation_key(index_strategy), None)
+
+    def count(self, cache_key: str) -> None:
+        # counted in-process, flushed to the shared cache at most every `count_flush_seconds`
+        with self._local_lock:
+            self._unflushed_counts[cache_key] += 1
+            _should_flush = (time.monotonic() - self._last_count_flush) >= self.count_flush_seconds
+        if _should_flush:
+            self.flush_counts()
+
+    def flush_counts(self) -> None:
+        with self._local_lock:
+            _counts = self._unflushed_counts
+            self._unflushed_counts = collections.Counter()
+            self._last_count_flush = time.monotonic()
+        for _cache_key, _count in _counts.items():
+            _incr_shared(_cache_key, _count)
+
+
+class LocmemSearchResultCache(SearchResultCache):
+    '''in-process cache, with least-recently-used eviction and time-to-live expiry'''
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()  # (expiry, value) by key
+
+    def get_bytes(self, key):
+        with self._lock:
+            try:
+                _expiry, _value = self._entries[key]
+            except KeyError:
+                return None
+            if _expiry < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)  # recently used
+            return _value
+
+    def set_bytes(self, key, value):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)  # least recently used
+
+
+class DjangoSearchResultCache(SearchResultCache):
+    '''cache in a (possibly shared) django cache'''
+
+    def __init__(self, *, django_cache_alias: str, **kwargs):
+        super().__init__(**kwargs)
+        self.django_cache_alias = django_cache_alias
+
+    def get_bytes(self, key):
+        return caches[self.django_cache_alias].get(key)
+
+    def set_bytes(self, key, value):
+        caches[self.django_cache_alias].set(key, value, timeout=self.ttl_seconds)
+
+
+@functools.cache
+def get_search_result_cache() -> SearchResultCache | None:
+    _settings = settings.SEARCH_RESULT_CACHE
+    _backend = _settings['BACKEND']
+    _kwargs = {
+        'ttl_seconds': _settings['TTL_SECONDS'],
+        'max_entries': _settings['MAX_ENTRIES'],
+        'generation_check_seconds': _settings['GENERATION_CHECK_SECONDS'],
+        'count_flush_seconds': _settings['COUNT_FLUSH_SECONDS'],
+    }
+    if not _backend:
+        return None
+    _require_shared_cache(_settings['SHARED_CACHE_ALIAS'])
+    if _backend == 'locmem':
+        return LocmemSearchResultCache(**_kwargs)
+    if _backend == 'django':
+        return DjangoSearchResultCache(django_cache_alias=_settings['DJANGO_CACHE_ALIAS'], **_kwargs)
+    raise ValueError(f'unknown SEARCH_RESULT_CACHE backend "{_backend}" (expected "locmem" or "django")')
+
+
+def with_search_result_cache(index_strategy: IndexStrategy, handler: _SearchHandler) -> _SearchHandler:
+    '''wrap the given search handler with the configured cache (if any)'''
+    _cache = get_search_result_cache()
+    return (
+        handler
+        if _cache is None
+        else _cache.cached_handler(index_strategy, handler)
+    )
+
+
+def with_cached_aggregations(
+    index_strategy: IndexStrategy,
+    query: dict,
+    search: Callable[[], dict],
+) -> dict:
+    '''get aggregation results for the given query from the configured cache (if any), else `search()`'''
+    _cache = get_search_result_cache()
+    return (
+        search()
+        if _cache is None
+        else _cache.cached_aggregations(index_strategy, query, search)
+    )
+
+
+def invalidate_strategy(index_strategy: IndexStrategy) -> None:
+    '''invalidate cached results for the given strategy (by incrementing its generation)
+
+    does nothing if no cache is configured (not touching the shared cache at all)
+    '''
+    _cache = get_search_result_cache()
+    if _cache is not None:
+        _incr_shared(_generation_key(index_strategy), 1)
+        _cache.forget_generation(index_strategy)  # (other processes see it within `GENERATION_CHECK_SECONDS`)
+
+
+def search_result_cache_counts() -> dict[str, int]:
+    '''cache hits and misses (as counted in the shared django cache, across processes --
+    not including counts from other processes not yet flushed)
+    '''
+    _cache = get_search_result_cache()
+    if _cache is not None:
+        _cache.flush_counts()
+    _shared_cache = _get_shared_cache()
+    return {
+        'hit': _shared_cache.get(HIT_COUNT_CACHE_KEY, 0),
+        'miss': _shared_cache.get(MISS_COUNT_CACHE_KEY, 0),
+    }
+
+
+def params_fingerprint(search_params: CardsearchParams) -> str:
+    # normalized (sorted) query params, plus whatever else affects the results
+    _querydict = search_params.to_querydict()
+    _normalized = repr((
+        type(search_params).__name__,
+        sorted(
+            (_name, sorted(_values))
+            for _name, _values in _querydict.lists()
+        ),
+        search_params.related_property_paths,
+    ))
+    return hashlib.sha256(_normalized.encode()).hexdigest()
+
+
+def query_fingerprint(query: dict) -> str:
+    _normalized = json.dumps(query, sort_keys=True)
+    return hashlib.sha256(_normalized.encode()).hexdigest()
+
+
+def _is_cacheable(search_params: CardsearchParams) -> bool:
+    _cursor = search_params.page_cursor
+    return _cursor.is_basic() and not _cursor.has_unbounded_page_size()
+
+
+def _pickle_handle(handle: BasicSearchHandle) -> bytes:
+    _handle_copy = copy.copy(handle)
+    # without search params (given again when loaded; they may hold unpicklable vocab)
+    # or handler (used only to stream unbounded pages, which are not cached)
+    _handle_copy.search_params = None
+    _handle_copy.handler = None
+    if isinstance(_handle_copy.cursor, SearchAfterCursor) and _handle_copy.cursor.pit_id is not None:
+        _handle_copy.cursor = dataclasses.replace(_handle_copy.cursor, pit_id=None)
+    return pickle.dumps(_handle_copy)
+
+
+def _generation_key(index_strategy: IndexStrategy) -> str:
+    return f'{_KEY_PREFIX}--generation--{index_strategy.strategy_name}--{index_strategy.strategy_check}'
+
+
+def _get_shared_cache():
+    return caches[settings.SEARCH_RESULT_CACHE['SHARED_CACHE_ALIAS']]
+
+
+def _require_shared_cache(cache_alias: str) -> None:
+    if isinstance(caches[cache_alias], (LocMemCache, DummyCache)):
+        raise ImproperlyConfigured(
+            f'SEARCH_RESULT_CACHE["SHARED_CACHE_ALIAS"] ("{cache_alias}") must name a django cache'
+            ' shared across processes (e.g. redis or memcached), so the indexer daemon may invalidate'
+            ' cached search results in every web worker',
+        )
+
+
+def _incr_shared(cache_key: str, delta: int) -> None:
+    _shared_cache = _get_shared_cache()
+    if not _shared_cache.add(cache_key, delta, timeout=None):
+        _shared_cache.incr(cache_key, delta)
@@ -1,7 +1,10 @@
 import io
+import multiprocessing.synchronize
+import signal
 from unittest import mock
 import pytest
 from django.core.management import call_command
+from django.core.management.base import CommandError
 
 
 def run_command(*args):
@@ -50,3 +53,40 @@ class TestCommandSearch:
         with mock.patch('share.search.daemon.IndexerDaemonControl') as mock_daemon_control:
             run_command('shtrove_indexer_run')
             mock_daemon_control.return_value.start_all_daemonthreads.assert_called_once()
+
+    def test_daemon_processes(self):
+        with (
+            mock.patch('share.management.commands.shtrove_indexer_run.IndexerDaemonControl') as mock_daemon_control,
+            mock.patch('share.management.commands.shtrove_indexer_run.all_strategy_names', return_value={'foo', 'bar'}),
+        ):
+            run_command('shtrove_indexer_run', '--processes', 'foo=3', '--processes', 'bar=2')
+            mock_daemon_control.return_value.start_all_daemonthreads.assert_called_once_with(
+                process_counts={'foo': 3, 'bar': 2},
+            )
+            # (a stop_event shared with worker processes)
+            _stop_event = mock_daemon_control.call_args.kwargs['stop_event']
+            assert isinstance(_stop_event, multiprocessing.synchronize.Event)
+
+    def test_daemon_threads_only(self):
+        with mock.patch('share.management.commands.shtrove_indexer_run.IndexerDaemonControl') as mock_daemon_control:
+            run_command('shtrove_indexer_run')
+            assert mock_daemon_control.call_args.kwargs['stop_event'] is None  # (threading.Event)
+
+    def test_daemon_stops_on_sigterm(self):
+        _prior_handler = signal.getsignal(signal.SIGTERM)
+        with mock.patch('share.management.commands.shtrove_indexer_run.IndexerDaemonControl') as mock_daemon_control:
+            _stop_event = mock_daemon_control.return_value.stop_event
+            _stop_event.wait.side_effect = lambda: signal.raise_signal(signal.SIGTERM)
+            run_command('shtrove_indexer_run')
+            _stop_event.set.assert_called_once()
+            mock_daemon_control.return_value.stop_daemonthreads.assert_called_once_with(wait=True)
+        assert signal.getsignal(signal.SIGTERM) is _prior_handler
+
+    def test_daemon_processes_unknown_strategy(self):
+        with (
+            mock.patch('share.management.commands.shtrove_indexer_run.IndexerDaemonControl') as mock_daemon_control,
+            mock.patch('share.management.commands.shtrove_indexer_run.all_strategy_names', return_value={'foo'}),
+        ):
+            with pytest.raises(CommandError):
+                run_command('shtrove_indexer_run', '--processes', 'fooo=3')
+            mock_daemon_control.return_value.start_all_daemonthreads.assert_not_called()
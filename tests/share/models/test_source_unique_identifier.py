@@ -0,0 +1,46 @@
+from django.test import TestCase
+
+from share import models as share_db
+from tests import factories
+
+
+class TestSourceUniqueIdentifier(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        _source = factories.SourceFactory()
+        _v2_push_config = factories.SourceConfigFactory(source=_source, transformer_key='v2_push')
+        _trove_config = factories.SourceConfigFactory(source=_source)
+        cls.replaced_suid = factories.SourceUniqueIdentifierFactory(identifier='foo', source_config=_v2_push_config)
+        cls.replacement_suid = factories.SourceUniqueIdentifierFactory(identifier='foo', source_config=_trove_config)
+        cls.unreplaced_suid = factories.SourceUniqueIdentifierFactory(identifier='bar', source_config=_v2_push_config)
+        cls.new_suid = factories.SourceUniqueIdentifierFactory(identifier='baz', source_config=_trove_config)
+        cls.all_suids = [cls.replaced_suid, cls.replacement_suid, cls.unreplaced_suid, cls.new_suid]
+
+    def test_has_forecompat_replacement_expression(self):
+        with self.assertNumQueries(1):
+            _annotated = dict(
+                share_db.SourceUniqueIdentifier.objects
+                .filter(id__in=[_suid.id for _suid in self.all_suids])
+                .annotate(_replaced=share_db.SourceUniqueIdentifier.has_forecompat_replacement_expression())
+                .values_list('id', '_replaced')
+            )
+        self.assertEqual(_annotated, {
+            _suid.id: _suid.has_forecompat_replacement()
+            for _suid in self.all_suids
+        })
+        self.assertEqual(_annotated[self.replaced_suid.id], True)
+
+    def test_backcompat_sharev2_suid_id_expression(self):
+        with self.assertNumQueries(1):
+            _annotated = dict(
+                share_db.SourceUniqueIdentifier.objects
+                .filter(id__in=[_suid.id for _suid in self.all_suids])
+                .annotate(_backcompat_id=share_db.SourceUniqueIdentifier.backcompat_sharev2_suid_id_expression())
+                .values_list('id', '_backcompat_id')
+            )
+        self.assertEqual(_annotated, {
+            self.replaced_suid.id: self.replaced_suid.id,
+            self.replacement_suid.id: self.replaced_suid.id,
+            self.unreplaced_suid.id: self.unreplaced_suid.id,
+            self.new_suid.id: None,
+        })
@@ -1,4 +1,5 @@
 from typing import Iterable, Iterator
+import dataclasses
 from datetime import date, timedelta
 import math
 from urllib.parse import urlencode
@@ -141,6 +142,72 @@ class CommonTrovesearchTests(RealElasticTestCase):
         self.assertEqual(_page_count, math.ceil(_total_count / _page_size))
         self.assertEqual(_result_iris, _expected_iris)
 
+    def test_cardsearch_pagination_sorted(self):
+        _cards: list[trove_db.Indexcard] = []
+        _expected_iris = []
+        _page_size = 7
+        _total_count = 56  # exactly 8 pages
+        _start_date = date(1999, 12, 31)
+        for _i in range(_total_count):
+            _focus_iri = BLARG[f'i{_i}']
+            _expected_iris.append(_focus_iri)
+            _cards.append(self._create_indexcard(_focus_iri, {
+                RDF.type: {BLARG.Thing},
+                DCTERMS.title: {rdf.literal(f'card #{_i}')},
+                DCTERMS.created: {rdf.literal(_start_date + timedelta(weeks=_i, days=_i))},
+            }))
+        self._index_indexcards(_cards)
+        # gather all pages results, in order:
+        _querystring: str | None = f'page[size]={_page_size}&sort=dateCreated'
+        _result_iris: list[str] = []
+        _page_count = 0
+        while _querystring is not None:
+            _cardsearch_handle = self.index_strategy.pls_handle_cardsearch(
+                CardsearchParams.from_querystring(_querystring),
+            )
+            _result_iris.extend(
+                self._indexcard_focus_by_uuid[_result.card_uuid]
+                for _result in _cardsearch_handle.search_result_page
+            )
+            _page_count += 1
+            _next_cursor = _cardsearch_handle.cursor.next_cursor()
+            _querystring = (
+                urlencode({'page[cursor]': _next_cursor.as_queryparam_value()})
+                if _next_cursor is not None
+                else None  # done
+            )
+        self.assertEqual(_page_count, _total_count // _page_size)
+        self.assertEqual(_result_iris, _expected_iris)
+
+    def test_cardsearch_export(self):
+        _total_count = 150  # more than one streamed page
+        _cards = [
+            self._create_indexcard(BLARG[f'i{_i}'], {
+                RDF.type: {BLARG.Thing},
+                DCTERMS.title: {rdf.literal(f'card #{_i}')},
+            })
+            for _i in range(_total_count)
+        ]
+        self._index_indexcards(_cards)
+        _params = CardsearchParams.from_querystring('page[size]=all&withFileName=blarg')
+        _result_iris: set[str] = set()
+        _page_count = 0
+        while _params is not None:
+            _cardsearch_handle = self.index_strategy.pls_handle_cardsearch(_params)
+            _result_iris.update(
+                self._indexcard_focus_by_uuid[_result.card_uuid]
+                for _result in _cardsearch_handle.search_result_page
+            )
+            _page_count += 1
+            _next_cursor = _cardsearch_handle.cursor.next_cursor()
+            _params = (
+                dataclasses.replace(_params, page_cursor=_next_cursor)
+                if _next_cursor is not None
+                else None  # done
+            )
+        self.assertEqual(_page_count, 2)
+        self.assertEqual(_result_iris, {BLARG[f'i{_i}'] for _i in range(_total_count)})
+
     def test_cardsearch_related_properties(self):
         self._fill_test_data_for_querying()
         with mock.patch(
@@ -164,6 +231,33 @@ class CommonTrovesearchTests(RealElasticTestCase):
         for _queryparams, _expected_values in self.valuesearch_cases():
             self._assert_valuesearch_values(_queryparams, _expected_values)
 
+    def test_valuesearch_pagination(self):
+        self._fill_test_data_for_querying()
+        _expected_values = {BLARG.subj_a, BLARG.subj_ac, BLARG.subj_b, BLARG.subj_bc, BLARG.subj_c}
+        _page_size = 2
+        _params = ValuesearchParams.from_querystring(urlencode({
+            'valueSearchPropertyPath': 'subject',
+            'page[size]': _page_size,
+        }))
+        _actual_values: list[str] = []
+        _page_count = 0
+        while _params is not None:
+            _valuesearch_handle = self.index_strategy.pls_handle_valuesearch(_params)
+            _page_count += 1
+            _actual_values.extend(
+                _result.value_iri
+                for _result in _valuesearch_handle.search_result_page
+            )
+            _next_cursor = _valuesearch_handle.cursor.next_cursor()
+            _params = (
+                dataclasses.replace(_params, page_cursor=_next_cursor)
+                if _next_cursor is not None
+                else None  # done
+            )
+        self.assertEqual(_page_count, math.ceil(len(_expected_values) / _page_size))
+        self.assertEqual(len(_actual_values), len(_expected_values))  # no repeats
+        self.assertEqual(set(_actual_values), _expected_values)
+
     def test_valuesearch_after_deletion(self):
         _cards = self._fill_test_data_for_querying()
         _deleted_focus_iris = {BLARG.c}
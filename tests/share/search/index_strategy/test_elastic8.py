@@ -1,4 +1,6 @@
 import functools
+import threading
+import time
 from unittest import mock
 
 import pytest
@@ -88,3 +90,56 @@ class TestIndexStrategy:
             index=fake_specific_index.full_index_name,
             ignore=[400, 404],
         )
+
+    def test_elastic_actions_resolve_live_indexes_once(self, fake_strategy, fake_specific_index, mock_es_client):
+        mock_es_client.indices.get_alias.return_value = {fake_specific_index.full_index_name: {}}
+        _actionsets = [
+            fake_strategy.MessageActionSet(_id, {'': [fake_strategy.build_delete_action(f'doc{_id}')]})
+            for _id in range(7)
+        ]
+        with mock.patch.object(FakeElastic8IndexStrategy, 'build_elastic_actions', return_value=_actionsets):
+            _actions = list(fake_strategy._elastic_actions_with_index(
+                messages.MessagesChunk(messages.MessageType.INDEX_SUID, list(range(7))),
+                mock.Mock(),
+            ))
+        assert len(_actions) == 7
+        assert {_action['_index'] for _action in _actions} == {fake_specific_index.full_index_name}
+        mock_es_client.indices.get_alias.assert_called_once()
+
+    def test_pls_handle_messages_chunk_parallel(self, settings, fake_strategy, fake_specific_index, mock_es_client):
+        settings.ELASTICSEARCH = {**settings.ELASTICSEARCH, 'BULK_THREAD_COUNT': 3}
+        mock_es_client.indices.get_alias.return_value = {fake_specific_index.full_index_name: {}}
+        _actionsets = [
+            fake_strategy.MessageActionSet(_id, {'': [fake_strategy.build_delete_action(f'doc{_id}')]})
+            for _id in range(7)
+        ]
+
+        _in_flight = []
+        _max_in_flight = 0
+        _lock = threading.Lock()
+
+        def _fake_streaming_bulk(client, actions, **kwargs):
+            nonlocal _max_in_flight
+            # each parallel chunk sent with the same retry settings as the sequential path
+            assert kwargs['max_retries'] == settings.ELASTICSEARCH['MAX_RETRIES']
+            with _lock:
+                _in_flight.append(actions)
+                _max_in_flight = max(_max_in_flight, len(_in_flight))
+            time.sleep(0.01)
+            with _lock:
+                _in_flight.remove(actions)
+            for _action in actions:
+                yield (True, {'delete': {'_id': _action['_id'], '_index': _action['_index'], 'status': 200}})
+
+        with (
+            mock.patch.object(FakeElastic8IndexStrategy, 'build_elastic_actions', return_value=_actionsets),
+            mock.patch('share.search.index_strategy.elastic8.streaming_bulk', new=_fake_streaming_bulk),
+            mock.patch('share.search.index_strategy.elastic8.BULK_CHUNK_SIZE', new=1),
+            mock.patch.object(FakeElastic8IndexStrategy, 'after_chunk'),
+        ):
+            _responses = list(fake_strategy.pls_handle_messages_chunk(
+                messages.MessagesChunk(messages.MessageType.INDEX_SUID, list(range(7))),
+            ))
+        assert 1 < _max_in_flight <= 3
+        assert all(_response.is_done for _response in _responses)
+        assert sorted(_response.index_message.target_id for _response in _responses) == list(range(7))
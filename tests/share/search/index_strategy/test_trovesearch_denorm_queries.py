@@ -0,0 +1,308 @@
+import dataclasses
+import json
+from unittest import mock
+
+from django.test import TestCase
+import pytest
+
+from share.search.index_strategy import trovesearch_denorm
+from trove.trovesearch.page_cursor import FirstPageThenSearchAfterCursor, PageCursor, SearchAfterCursor
+from trove.trovesearch.search_params import CardsearchParams, ValuesearchParams
+
+
+# shapes of cardsearch/valuesearch requests seen in production (values are examples --
+# the shapes are what matter for query building)
+CARDSEARCH_QUERY_SHAPES = (
+    'cardSearchFilter[resourceType]=Project,ProjectComponent&cardSearchFilter[accessService]=https://osf.io/&sort=-relevance',
+    'cardSearchFilter[resourceType]=Preprint&cardSearchFilter[publisher]=https://osf.io/preprints/psyarxiv&sort=-dateCreated',
+    'cardSearchFilter[resourceType]=Registration,RegistrationComponent&cardSearchText=climate&page[size]=20',
+    'cardSearchFilter[creator.affiliation]=https://ror.org/05dxps055&cardSearchFilter[dateCreated][after]=2022',
+    'cardSearchFilter[subject]=https://api.osf.io/v2/subjects/584240da54be81056cecac48&cardSearchFilter[resourceType]=Preprint',
+    'cardSearchFilter[isPartOf]=https://osf.io/abcde&cardSearchFilter[resourceType]=Project,ProjectComponent,File',
+    'cardSearchFilter[funder][is-present]&cardSearchFilter[affiliation][is-absent]',
+    'cardSearchFilter[creator]=https://orcid.org/0000-0002-6155-6104&cardSearchText[*,title]=ramen',
+    'cardSearchFilter[sameAs]=https://doi.org/10.17605/osf.io/abcde,https://osf.io/abcde',
+    'cardSearchFilter[dateCreated][before]=2024-06&sort[integer-value]=-usage.viewCount',
+    'cardSearchFilter[rights][none-of]=https://creativecommons.org/licenses/by/4.0/&cardSearchText=data',
+    'cardSearchText=hello&page[size]=50&sort=dateModified',
+)
+VALUESEARCH_QUERY_SHAPES = (
+    'valueSearchPropertyPath=creator&cardSearchFilter[resourceType]=Project',
+    'valueSearchPropertyPath=subject&valueSearchText=psych&cardSearchFilter[resourceType]=Preprint',
+    'valueSearchPropertyPath=affiliation&valueSearchFilter[resourceType]=Agent&cardSearchText=ocean',
+)
+
+
+def _parse_params() -> list[CardsearchParams]:
+    return [
+        *map(CardsearchParams.from_querystring, CARDSEARCH_QUERY_SHAPES),
+        *map(ValuesearchParams.from_querystring, VALUESEARCH_QUERY_SHAPES),
+    ]
+
+
+def _build_queries(params_list: list[CardsearchParams]) -> list[dict]:
+    _queries = []
+    for _params in params_list:
+        if isinstance(_params, ValuesearchParams):
+            _cursor = trovesearch_denorm._valuesearch_cursor(_params.page_cursor)
+            _queries.append(trovesearch_denorm._build_iri_valuesearch(_params, _cursor))
+        else:
+            _queries.append(trovesearch_denorm._CardsearchQueryBuilder(_params).build())
+    return _queries
+
+
+class TestQueryShapes(TestCase):
+    def test_same_shape_different_values(self):
+        _one, _other = (
+            trovesearch_denorm._CardsearchQueryBuilder(CardsearchParams.from_querystring(
+                f'cardSearchFilter[creator.affiliation,funder]={_value}&sort=-dateCreated',
+            )).build()['query']
+            for _value in ('https://one.example', 'https://other.example')
+        )
+        self.assertEqual(json.dumps(_one).replace('one.example', 'other.example'), json.dumps(_other))
+        # built queries are not shared (safe to modify)
+        _one['bool']['filter'].clear()
+        _again = trovesearch_denorm._CardsearchQueryBuilder(CardsearchParams.from_querystring(
+            'cardSearchFilter[creator.affiliation,funder]=https://one.example&sort=-dateCreated',
+        )).build()['query']
+        self.assertEqual(len(_again['bool']['filter']), 1)
+
+    def test_path_field_name(self):
+        _path = ('https://foo.example/bar', 'https://foo.example/baz')
+        _field_name = trovesearch_denorm._path_field_name(_path)
+        self.assertEqual(trovesearch_denorm._parse_path_field_name(_field_name), _path)
+        self.assertIs(trovesearch_denorm._path_field_name(_path), _field_name)  # memoized
+
+
+class TestSortedCardsearchPaging(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.strategy = trovesearch_denorm.TrovesearchDenormIndexStrategy('trovesearch_denorm')
+        self.es8_client = mock.Mock()
+        self.enterContext(mock.patch.object(
+            trovesearch_denorm.TrovesearchDenormIndexStrategy,
+            'es8_client',
+            new_callable=mock.PropertyMock,
+            return_value=self.es8_client,
+        ))
+
+    def _search(self, cursor, hit_sorts, querystring='sort=-dateCreated&page[size]=2'):
+        _params = CardsearchParams.from_querystring(querystring)
+        _params = dataclasses.replace(_params, page_cursor=cursor)
+        _querybuilder = trovesearch_denorm._CardsearchQueryBuilder(_params)
+        _search_kwargs = _querybuilder.build()
+        self.es8_client.search.return_value = {
+            'hits': {'hits': [{'sort': _sort} for _sort in hit_sorts]},
+            **({'pit_id': 'pit-2'} if getattr(cursor, 'pit_id', None) else {}),
+        }
+        _cursor = _querybuilder.response_cursor
+        self.strategy._search_cards_after(_cursor, _search_kwargs)
+        return _search_kwargs, _cursor
+
+    def test_first_page_without_pit(self):
+        _search_kwargs, _cursor = self._search(
+            PageCursor(page_size=2),
+            [['2001', '1'], ['2000', '5'], ['1999', '3']],
+        )
+        self.assertEqual(_search_kwargs['sort'][-1], {'card.card_pk': 'asc'})  # unique tiebreaker
+        self.es8_client.open_point_in_time.assert_not_called()
+        self.es8_client.close_point_in_time.assert_not_called()
+        self.assertNotIn('pit', self.es8_client.search.call_args.kwargs)
+        self.assertIsNone(_cursor.pit_id)
+        self.assertEqual(_cursor.next_search_after, ['2000', '5'])
+
+    def test_next_page_opens_pit(self):
+        self.es8_client.open_point_in_time.return_value = {'id': 'pit-1'}
+        _first = SearchAfterCursor(page_size=2, next_search_after=['2000', '5'])
+        _search_kwargs, _cursor = self._search(
+            _first.next_cursor(),
+            [['1999', '3', 77], ['1998', '2', 78], ['1997', '4', 79]],
+        )
+        self.es8_client.open_point_in_time.assert_called_once()
+        _search_call = self.es8_client.search.call_args.kwargs
+        self.assertEqual(_search_call['pit']['id'], 'pit-1')
+        # after all with the same sort values (including the implicit `_shard_doc`)
+        self.assertEqual(_search_call['search_after'], ['2000', '5', trovesearch_denorm._LAST_SHARD_DOC])
+        self.assertEqual(_cursor.pit_id, 'pit-1')
+        self.assertEqual(_cursor.next_search_after, ['1998', '2'])
+        # last page closes the point-in-time
+        self._search(_cursor.next_cursor(), [['1996', '6', 80]])
+        self.es8_client.open_point_in_time.assert_called_once()  # not again
+        self.assertEqual(self.es8_client.search.call_args.kwargs['pit']['id'], 'pit-1')
+        self.es8_client.close_point_in_time.assert_called_once_with(id='pit-2')
+
+    def test_export_first_page_opens_pit(self):
+        self.es8_client.open_point_in_time.return_value = {'id': 'pit-1'}
+        _params = CardsearchParams.from_querystring('page[size]=all&withFileName=blarg')
+        _search_kwargs, _cursor = self._search(
+            _params.page_cursor,
+            [[11, 1], [12, 2]],
+            querystring='page[size]=all&withFileName=blarg',
+        )
+        # every page from the same point-in-time, including the first
+        self.es8_client.open_point_in_time.assert_called_once()
+        _search_call = self.es8_client.search.call_args.kwargs
+        self.assertEqual(_search_call['pit']['id'], 'pit-1')
+        self.assertNotIn('search_after', _search_call)
+        self.assertEqual(_cursor.pit_id, 'pit-1')
+
+    def test_prev_page_reversed(self):
+        _third = SearchAfterCursor(page_size=2, search_after=['1998', '2'], pit_id='pit-1', start_offset=4)
+        _forward_kwargs, _cursor = self._search(_third, [['1997', '4', 79], ['1996', '6', 80]])
+        self.assertEqual(_cursor.prev_search_before, ['1997', '4'])
+        # previous page: in reverse order, after the third page's first result
+        _search_kwargs, _cursor = self._search(
+            _cursor.prev_cursor(),
+            [['1998', '2', 78], ['1999', '3', 77], ['2000', '5', 76]],
+        )
+        ((_date_field, _date_sort),) = _forward_kwargs['sort'][0].items()
+        self.assertEqual(_search_kwargs['sort'], [
+            {_date_field: {**_date_sort, 'order': 'asc', 'missing': '_first'}},
+            {'card.card_pk': {'order': 'desc', 'missing': '_first'}},
+        ])
+        _search_call = self.es8_client.search.call_args.kwargs
+        self.assertEqual(_search_call['search_after'], ['1997', '4', trovesearch_denorm._LAST_SHARD_DOC])
+        self.assertEqual(
+            [_hit['sort'] for _hit in self.es8_client.search.return_value['hits']['hits']],
+            [['1999', '3', 77], ['1998', '2', 78]],  # (back in order)
+        )
+        self.assertEqual(_cursor.start_offset, 2)
+        self.assertEqual(_cursor.next_search_after, ['1998', '2'])
+        self.assertEqual(_cursor.prev_search_before, ['1999', '3'])  # (the first page, extra hit)
+        self.assertEqual(_cursor.prev_cursor(), SearchAfterCursor(page_size=2))
+
+    def test_cursor_without_sort(self):
+        # a search-after cursor given without the sort it came from
+        _cursor = SearchAfterCursor(page_size=2, search_after=['2000', '5'], pit_id='pit-1')
+        _params = CardsearchParams.from_querystring('page[size]=2')
+        _params = dataclasses.replace(_params, page_cursor=_cursor)
+        _search_kwargs = trovesearch_denorm._CardsearchQueryBuilder(_params).build()
+        self.assertEqual(_search_kwargs['sort'], [{'card.card_pk': 'asc'}])
+        self.assertEqual(_search_kwargs['search_after'], ['2000', '5'])
+
+
+def _iri_bucket(key, doc_count):
+    return {
+        'key': key,
+        'doc_count': doc_count,
+        **{
+            _subagg: {'buckets': []}
+            for _subagg in ('agg_type_iri', 'agg_value_name', 'agg_value_title', 'agg_value_label')
+        },
+    }
+
+
+class TestIriValuesearchPaging(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.strategy = trovesearch_denorm.TrovesearchDenormIndexStrategy('trovesearch_denorm')
+        self.es8_client = mock.Mock()
+        self.enterContext(mock.patch.object(
+            trovesearch_denorm.TrovesearchDenormIndexStrategy,
+            'es8_client',
+            new_callable=mock.PropertyMock,
+            return_value=self.es8_client,
+        ))
+
+    def _valuesearch(self, cursor, buckets):
+        _params = ValuesearchParams.from_querystring('valueSearchPropertyPath=creator')
+        _params = dataclasses.replace(_params, page_cursor=cursor)
+        self.es8_client.search.return_value = {'aggregations': {'agg_valuesearch_iris': {'buckets': buckets}}}
+        _handle = self.strategy.pls_handle_valuesearch(_params)
+        return _handle, self.es8_client.search.call_args.kwargs
+
+    def test_most_common_first(self):
+        _handle, _query = self._valuesearch(PageCursor(page_size=2), [
+            _iri_bucket('https://foo.example/zzz', 9),
+            _iri_bucket('https://foo.example/aaa', 5),
+            _iri_bucket('https://foo.example/mmm', 2),
+        ])
+        _agg = _query['aggs']['agg_valuesearch_iris']
+        self.assertEqual(_agg['terms']['order'], [{'_count': 'desc'}, {'_key': 'asc'}])
+        # in the order given (by count), not by iri
+        self.assertEqual(
+            [_result.value_iri for _result in _handle.search_result_page],
+            ['https://foo.example/zzz', 'https://foo.example/aaa'],
+        )
+        self.assertIsNone(_handle.cursor.prev_cursor())
+        # the rest, without those (by count and iri, through the last on the first page)
+        _next = _handle.cursor.next_cursor()
+        self.assertEqual(_next.first_page_bound, [5, 'https://foo.example/aaa'])
+        _handle, _query = self._valuesearch(_next, [
+            _iri_bucket({'value_iri': 'https://foo.example/aaa'}, 5),
+            _iri_bucket({'value_iri': 'https://foo.example/bbb'}, 5),
+            _iri_bucket({'value_iri': 'https://foo.example/mmm'}, 2),
+            _iri_bucket({'value_iri': 'https://foo.example/nnn'}, 1),
+            _iri_bucket({'value_iri': 'https://foo.example/zzz'}, 9),
+        ])
+        _agg = _query['aggs']['agg_valuesearch_iris']
+        self.assertNotIn('after', _agg['composite'])
+        self.assertEqual(_agg['composite']['size'], 5)  # (room to skip the first page)
+        self.assertNotIn('must_not', _query['query']['bool'])
+        self.assertEqual(
+            [_result.value_iri for _result in _handle.search_result_page],
+            ['https://foo.example/bbb', 'https://foo.example/mmm'],
+        )
+        _third = _handle.cursor.next_cursor()
+        _handle, _query = self._valuesearch(_third, [
+            _iri_bucket({'value_iri': 'https://foo.example/nnn'}, 1),
+            _iri_bucket({'value_iri': 'https://foo.example/zzz'}, 9),
+        ])
+        self.assertEqual(
+            _query['aggs']['agg_valuesearch_iris']['composite']['after'],
+            {'value_iri': 'https://foo.example/mmm'},
+        )
+        self.assertEqual(
+            [_result.value_iri for _result in _handle.search_result_page],
+            ['https://foo.example/nnn'],
+        )
+        self.assertIsNone(_handle.cursor.next_cursor())
+        # and back
+        _back = _handle.cursor.prev_cursor()
+        _handle, _query = self._valuesearch(_back, [
+            _iri_bucket({'value_iri': 'https://foo.example/mmm'}, 2),
+            _iri_bucket({'value_iri': 'https://foo.example/bbb'}, 5),
+            _iri_bucket({'value_iri': 'https://foo.example/aaa'}, 5),
+        ])
+        _agg = _query['aggs']['agg_valuesearch_iris']
+        self.assertEqual(_agg['composite']['after'], {'value_iri': 'https://foo.example/nnn'})
+        self.assertEqual(_agg['composite']['sources'][0]['value_iri']['terms']['order'], 'desc')
+        self.assertEqual(
+            [_result.value_iri for _result in _handle.search_result_page],
+            ['https://foo.example/bbb', 'https://foo.example/mmm'],
+        )
+        self.assertEqual(_handle.cursor.next_search_after, ['https://foo.example/mmm'])
+        self.assertEqual(_handle.cursor.prev_cursor(), _next.first_cursor())
+
+    def test_short_page_after_skipping(self):
+        _second = FirstPageThenSearchAfterCursor(
+            page_size=2,
+            search_after=[],
+            start_offset=2,
+            first_page_bound=[9, 'https://foo.example/zzz'],
+        )
+        # a full aggregation page, mostly skipped (e.g. counts changed since the first page)
+        _handle, _query = self._valuesearch(_second, [
+            _iri_bucket({'value_iri': 'https://foo.example/aaa'}, 3),
+            _iri_bucket({'value_iri': 'https://foo.example/bbb'}, 9),
+            _iri_bucket({'value_iri': 'https://foo.example/ccc'}, 12),
+            _iri_bucket({'value_iri': 'https://foo.example/ddd'}, 2),
+            _iri_bucket({'value_iri': 'https://foo.example/eee'}, 10),
+        ])
+        self.assertEqual(_query['aggs']['agg_valuesearch_iris']['composite']['size'], 5)
+        self.assertEqual(
+            [_result.value_iri for _result in _handle.search_result_page],
+            ['https://foo.example/aaa', 'https://foo.example/ddd'],
+        )
+        # next after all those seen
+        self.assertEqual(_handle.cursor.next_search_after, ['https://foo.example/eee'])
+
+
+class TestQueryBuildingBenchmark:
+    # run with `pytest -o addopts='' -k Benchmark tests/share/search/index_strategy/test_trovesearch_denorm_queries.py`
+
+    @pytest.mark.django_db
+    def test_build_queries(self, benchmark):
+        _params_list = _parse_params()  # just query building, not param parsing
+        _queries = benchmark(_build_queries, _params_list)
+        assert len(_queries) == len(CARDSEARCH_QUERY_SHAPES) + len(VALUESEARCH_QUERY_SHAPES)
@@ -0,0 +1,104 @@
+from django.test import TestCase
+from primitive_metadata import primitive_rdf as rdf
+
+from share.search.index_strategy.trovesearch_denorm import TrovesearchDenormIndexStrategy
+from tests.trove.factories import create_indexcard, create_supplement, update_indexcard_content
+from trove import digestive_tract
+from trove.vocab.namespaces import BLARG, DCTERMS, FOAF, OSFMAP, OWL, RDF, TROVE
+
+
+_OSFMAP_JSON = TROVE['derive/osfmap_json']
+
+
+def _build_sourcedocs(indexcard) -> dict[str, dict]:
+    _builder = TrovesearchDenormIndexStrategy._SourcedocBuilder(
+        indexcard.latest_resource_description,
+        chunk_timestamp=7,
+    )
+    return {
+        **dict(_builder.build_cardsearch_docs()),
+        **dict(_builder.build_valuesearch_docs()),
+    }
+
+
+def _twopledict(**changes) -> rdf.RdfTwopleDictionary:
+    return {
+        RDF.type: {OSFMAP.Project},
+        DCTERMS.title: {rdf.literal('a project', language='en')},
+        DCTERMS.creator: {BLARG.person},
+        OSFMAP.contains: {BLARG.file},
+        **changes,
+    }
+
+
+def _tripledict(twopledict, **person_changes) -> rdf.RdfTripleDictionary:
+    return {
+        BLARG.project: twopledict,
+        BLARG.person: {
+            RDF.type: {DCTERMS.Agent, FOAF.Person},
+            FOAF.name: {rdf.literal('a person')},
+            **person_changes,
+        },
+        BLARG.file: {
+            RDF.type: {OSFMAP.File},
+            OSFMAP.fileName: {rdf.literal('a_file.txt')},
+        },
+    }
+
+
+class TestTrovesearchDenormSubscription(TestCase):
+    '''trovesearch_denorm subscribes only to osfmap_json -- safe as long as its sourcedocs
+    change only when osfmap_json does (both built from the rdf reachable from the focus,
+    with supplements, less osfmap:contains)
+    '''
+
+    def setUp(self):
+        super().setUp()
+        self.indexcard = create_indexcard(BLARG.project, rdf_tripledict=_tripledict(_twopledict()))
+        digestive_tract.derive_chunk([self.indexcard.pk])
+        self.sourcedocs = _build_sourcedocs(self.indexcard)
+
+    def _assert_subscription_safe(self, *, expect_change: bool):
+        _changes = digestive_tract.derive_chunk([self.indexcard.pk])[self.indexcard.pk]
+        _sourcedocs = _build_sourcedocs(self.indexcard)
+        self.assertEqual(_sourcedocs != self.sourcedocs, expect_change)
+        self.assertEqual(_OSFMAP_JSON in _changes, expect_change)
+        self.assertEqual(
+            TrovesearchDenormIndexStrategy.SUBSCRIBED_DERIVER_IRIS.isdisjoint(_changes),
+            not expect_change,
+        )
+
+    def test_unchanged(self):
+        update_indexcard_content(self.indexcard, BLARG.project, rdf_tripledict=_tripledict(_twopledict()))
+        self._assert_subscription_safe(expect_change=False)
+
+    def test_contained_only(self):
+        # osfmap:contains is neither indexed nor in osfmap_json
+        update_indexcard_content(self.indexcard, BLARG.project, rdf_tripledict=_tripledict(
+            _twopledict(**{OSFMAP.contains: {BLARG.file, BLARG.another_file}}),
+        ))
+        self._assert_subscription_safe(expect_change=False)
+
+    def test_focus_changed(self):
+        update_indexcard_content(self.indexcard, BLARG.project, rdf_tripledict=_tripledict(
+            _twopledict(**{DCTERMS.title: {rdf.literal('another title', language='en')}}),
+        ))
+        self._assert_subscription_safe(expect_change=True)
+
+    def test_nested_changed(self):
+        update_indexcard_content(self.indexcard, BLARG.project, rdf_tripledict=_tripledict(
+            _twopledict(),
+            **{FOAF.name: {rdf.literal('a renamed person')}},
+        ))
+        self._assert_subscription_safe(expect_change=True)
+
+    def test_synonym_changed(self):
+        update_indexcard_content(self.indexcard, BLARG.project, rdf_tripledict=_tripledict(
+            _twopledict(),
+            **{OWL.sameAs: {BLARG.same_person}},
+        ))
+        self._assert_subscription_safe(expect_change=True)
+
+    def test_supplement_changed(self):
+        create_supplement(self.indexcard, BLARG.project, {DCTERMS.subject: {BLARG.a_subject}})
+        self._assert_subscription_safe(expect_change=True)
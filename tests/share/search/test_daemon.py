@@ -1,4 +1,5 @@
 import contextlib
+import multiprocessing
 import pytest
 import threading
 from unittest import mock
@@ -10,7 +11,9 @@ from share.search.daemon import (
     MAXIMUM_BACKOFF_FACTOR,
     UNPRESSURED_TIMEOUT,
     MAXIMUM_BACKOFF_TIMEOUT,
+    KombuMessageConsumer,
     _backoff_wait,
+    _run_daemonprocess,
 )
 from share.search import exceptions
 from share.search import messages
@@ -253,3 +256,86 @@ class TestIndexerDaemon:
             )
             for message in message_list:
                 assert message.acked
+
+
+class TestIndexerDaemonControl:
+    def test_forks_before_any_thread(self):
+        _strategys = [mock.Mock(strategy_name=_name) for _name in ('foo', 'bar', 'baz')]
+        _calls = []
+        _daemon_control = IndexerDaemonControl(celery_app)
+        with (
+            mock.patch('share.search.index_strategy.each_strategy', return_value=iter(_strategys)),
+            mock.patch('share.search.index_strategy.all_strategy_names', return_value=frozenset(('foo', 'bar', 'baz'))),
+            mock.patch.object(_daemon_control, '_fork_daemonprocesses', side_effect=(
+                lambda _strategy, _count: _calls.append(('fork', _strategy.strategy_name, _count)) or [_strategy.strategy_name]
+            )),
+            mock.patch.object(_daemon_control, '_watch_daemonprocesses', side_effect=(
+                lambda _processes: _calls.append(('watch', *_processes))
+            )),
+            mock.patch.object(_daemon_control, 'start_daemonthreads_for_strategy', side_effect=(
+                lambda _strategy: _calls.append(('threads', _strategy.strategy_name))
+            )),
+        ):
+            _daemon_control.start_all_daemonthreads(process_counts={'foo': 2, 'baz': 3})
+        assert _calls == [
+            ('fork', 'foo', 2),
+            ('fork', 'baz', 3),
+            ('watch', 'foo', 'baz'),
+            ('threads', 'bar'),
+        ]
+
+    def test_unknown_strategy_name(self):
+        _daemon_control = IndexerDaemonControl(celery_app)
+        with (
+            mock.patch('share.search.index_strategy.all_strategy_names', return_value=frozenset(('foo',))),
+            mock.patch.object(_daemon_control, 'start_daemonthreads_for_strategy') as _mock_start_threads,
+        ):
+            with pytest.raises(exceptions.IndexStrategyError):
+                _daemon_control.start_all_daemonthreads(process_counts={'fooo': 2})
+        _mock_start_threads.assert_not_called()
+
+    def test_processes_need_multiprocessing_event(self):
+        _daemon_control = IndexerDaemonControl(celery_app)
+        assert isinstance(_daemon_control.stop_event, threading.Event)  # (by default)
+        with (
+            mock.patch('share.search.index_strategy.each_strategy', return_value=iter([mock.Mock(strategy_name='foo')])),
+            mock.patch('share.search.index_strategy.all_strategy_names', return_value=frozenset(('foo',))),
+            mock.patch('multiprocessing.get_context') as _mock_get_context,
+        ):
+            with pytest.raises(ValueError):
+                _daemon_control.start_all_daemonthreads(process_counts={'foo': 2})
+        _mock_get_context.assert_not_called()
+
+    def _start_daemonprocess_thread(self, stop_event):
+        # run the daemonprocess body in a thread (with daemonthreads for a fake strategy,
+        # but no message consumer)
+        _thread = threading.Thread(target=_run_daemonprocess, kwargs={
+            'celery_app': celery_app,
+            'index_strategy': FakeIndexStrategyForSetupOnly(),
+            'stop_event': stop_event,
+            'daemonthread_context': None,
+        })
+        _thread.start()
+        return _thread
+
+    def test_daemonprocess_stops(self):
+        _stop_event = multiprocessing.Event()
+        with mock.patch.object(KombuMessageConsumer, 'run'):
+            _thread = self._start_daemonprocess_thread(_stop_event)
+            _thread.join(timeout=0.1)
+            assert _thread.is_alive()
+            _stop_event.set()
+            _thread.join(timeout=TIMEOUT)
+        assert not _thread.is_alive()
+
+    def test_daemonprocess_stops_without_parent(self):
+        _stop_event = multiprocessing.Event()
+        _dead_parent = mock.Mock(**{'is_alive.return_value': False})
+        with (
+            mock.patch.object(KombuMessageConsumer, 'run'),
+            mock.patch('multiprocessing.parent_process', return_value=_dead_parent),
+        ):
+            _thread = self._start_daemonprocess_thread(_stop_event)
+            _thread.join(timeout=TIMEOUT)
+        assert not _thread.is_alive()
+        assert _stop_event.is_set()
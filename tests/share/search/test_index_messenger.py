@@ -0,0 +1,157 @@
+import contextlib
+import types
+from unittest import mock
+
+from django.db import transaction
+from django.test import TestCase
+
+from share.search import IndexMessenger, MessageType, coalesced_index_messages
+
+
+def _card(pk):
+    return types.SimpleNamespace(pk=pk, source_record_suid_id=(pk + 100))
+
+
+class TestCoalescedIndexMessages(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.strategys = (mock.Mock(strategy_name='foo'), mock.Mock(strategy_name='bar'))
+        self.sent = []  # (strategy names, message type, urgent, target ids) per connection
+        self.enterContext(mock.patch.object(
+            IndexMessenger,
+            '_open_message_queues',
+            autospec=True,
+            side_effect=self._replacement_open_message_queues,
+        ))
+        self.enterContext(mock.patch.object(
+            IndexMessenger,
+            '_put_messages_chunk',
+            autospec=True,
+            side_effect=self._replacement_put_messages_chunk,
+        ))
+
+    @contextlib.contextmanager
+    def _replacement_open_message_queues(self, messenger, message_type, urgent):
+        yield (messenger, urgent)
+
+    def _replacement_put_messages_chunk(self, messenger, messages_chunk, message_queues):
+        (_messenger, _urgent) = message_queues
+        self.sent.append((
+            {_strategy.strategy_name for _strategy in _messenger.index_strategys},
+            messages_chunk.message_type,
+            _urgent,
+            list(messages_chunk.target_ids_chunk),
+        ))
+
+    def _messenger(self, index_strategys=None):
+        return IndexMessenger(index_strategys=(index_strategys or self.strategys))
+
+    @property
+    def _all_names(self):
+        return {_strategy.strategy_name for _strategy in self.strategys}
+
+    def test_not_coalesced(self):
+        self._messenger().notify_indexcard_update([_card(1)])
+        self._messenger().notify_indexcard_update([_card(2)])
+        self.assertEqual(len(self.sent), 4)  # update and suid messages, each time
+
+    def test_coalesced(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            with coalesced_index_messages():
+                self._messenger().notify_indexcard_update([_card(1), _card(2)])
+                self._messenger().notify_indexcard_update([_card(2), _card(3)])
+                self._messenger().notify_indexcard_update([_card(1)], urgent=True)
+                self.assertEqual(self.sent, [])  # held back
+        self.assertEqual(self.sent, [
+            (self._all_names, MessageType.UPDATE_INDEXCARD, False, [1, 2, 3]),
+            (self._all_names, MessageType.INDEX_SUID, False, [101, 102, 103]),
+            (self._all_names, MessageType.UPDATE_INDEXCARD, True, [1]),
+            (self._all_names, MessageType.INDEX_SUID, True, [101]),
+        ])
+
+    def test_by_strategy(self):
+        (_strategy_a, _strategy_b, *_) = self.strategys
+        with self.captureOnCommitCallbacks(execute=True):
+            with coalesced_index_messages():
+                self._messenger([_strategy_a]).notify_suid_update([1, 2])
+                self._messenger([_strategy_b]).notify_suid_update([1, 2])
+                self._messenger([_strategy_b]).notify_suid_update([3])
+        self.assertEqual(self.sent, [
+            ({_strategy_a.strategy_name}, MessageType.INDEX_SUID, False, [1, 2]),
+            ({_strategy_b.strategy_name}, MessageType.INDEX_SUID, False, [1, 2, 3]),
+        ])
+
+    def test_nested(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            with coalesced_index_messages():
+                with coalesced_index_messages():
+                    self._messenger().notify_suid_update([1])
+                    self._messenger().notify_suid_update([2])
+                self.assertEqual(self.sent, [])  # (only the outermost sends)
+        self.assertEqual(self.sent, [
+            (self._all_names, MessageType.INDEX_SUID, False, [1, 2]),
+        ])
+
+    def test_after_commit(self):
+        with self.captureOnCommitCallbacks() as _callbacks:
+            with coalesced_index_messages():
+                self._messenger().notify_suid_update([1])
+        self.assertEqual(self.sent, [])  # not yet committed
+        for _callback in _callbacks:
+            _callback()
+        self.assertEqual(self.sent, [
+            (self._all_names, MessageType.INDEX_SUID, False, [1]),
+        ])
+
+    def test_rollback(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            with self.assertRaises(ZeroDivisionError):
+                with transaction.atomic():
+                    with coalesced_index_messages():
+                        self._messenger().notify_suid_update([1])
+                        raise ZeroDivisionError
+        self.assertEqual(self.sent, [])
+
+    def test_rollback_after(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            with self.assertRaises(ZeroDivisionError):
+                with transaction.atomic():
+                    with coalesced_index_messages():
+                        self._messenger().notify_suid_update([1])
+                    raise ZeroDivisionError  # (after the scope ended normally)
+        self.assertEqual(self.sent, [])
+
+    def test_partial_rollback(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            with coalesced_index_messages():
+                with transaction.atomic():
+                    self._messenger().notify_suid_update([1])
+                with self.assertRaises(ZeroDivisionError):
+                    with transaction.atomic():
+                        self._messenger().notify_suid_update([2])
+                        raise ZeroDivisionError
+                self._messenger().notify_suid_update([3])
+        self.assertEqual(self.sent, [
+            (self._all_names, MessageType.INDEX_SUID, False, [1, 3]),
+        ])
+
+    def test_exception_after_commit(self):
+        # messages for writes already committed are sent, even if an exception follows
+        with self.captureOnCommitCallbacks(execute=True):
+            with self.assertRaises(ZeroDivisionError):
+                with coalesced_index_messages():
+                    with transaction.atomic():
+                        self._messenger().notify_suid_update([1])
+                    with transaction.atomic():
+                        self._messenger().notify_suid_update([2])
+                        raise ZeroDivisionError
+        self.assertEqual(self.sent, [
+            (self._all_names, MessageType.INDEX_SUID, False, [1]),
+        ])
+
+    def test_nothing_to_send(self):
+        with self.captureOnCommitCallbacks(execute=True) as _callbacks:
+            with coalesced_index_messages():
+                self._messenger().notify_suid_update([])
+        self.assertEqual(_callbacks, [])
+        self.assertEqual(self.sent, [])
@@ -0,0 +1,261 @@
+import dataclasses
+import tempfile
+import time
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.test import TestCase, override_settings
+
+from share.checks import check_search_result_cache
+from share.search import search_result_cache
+from trove.trovesearch.page_cursor import OffsetCursor, PageCursor, SearchAfterCursor
+from trove.trovesearch.search_handle import CardsearchHandle, CardsearchResult
+from trove.trovesearch.search_params import CardsearchParams, ValuesearchParams
+
+
+@dataclasses.dataclass(frozen=True)
+class FakeIndexStrategy:
+    strategy_name: str = 'fakefake'
+    strategy_check: str = 'fakecheck'
+
+
+class FakeSearchHandler:
+    def __init__(self):
+        self.call_count = 0
+
+    def __call__(self, search_params):
+        self.call_count += 1
+        return CardsearchHandle(
+            cursor=PageCursor(total_count=self.call_count),
+            search_params=search_params,
+            search_result_page=[
+                CardsearchResult(text_match_evidence=[], card_iri=f'https://foo.example/{self.call_count}'),
+            ],
+        )
+
+
+def _shared_caches_settings():
+    # a file-based cache is shared across processes (like redis or memcached would be)
+    return {
+        'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+        'shared': {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': tempfile.mkdtemp(prefix='search_result_cache'),
+        },
+    }
+
+
+class _BaseSearchResultCacheTests:
+    backend: str  # set on subclasses
+
+    def setUp(self):
+        super().setUp()
+        self.enterContext(override_settings(CACHES=_shared_caches_settings()))
+        cache.clear()
+        search_result_cache.get_search_result_cache.cache_clear()
+        self.enterContext(override_settings(SEARCH_RESULT_CACHE={
+            'BACKEND': self.backend,
+            'TTL_SECONDS': 60,
+            'MAX_ENTRIES': 2,
+            'DJANGO_CACHE_ALIAS': 'default',
+            'SHARED_CACHE_ALIAS': 'shared',
+            'GENERATION_CHECK_SECONDS': 2,
+            'COUNT_FLUSH_SECONDS': 10,
+        }))
+        self.addCleanup(search_result_cache.get_search_result_cache.cache_clear)
+        self.strategy = FakeIndexStrategy()
+        self.raw_handler = FakeSearchHandler()
+        self.handler = search_result_cache.with_search_result_cache(self.strategy, self.raw_handler)
+
+    def test_hit(self):
+        _params = CardsearchParams.from_querystring('cardSearchFilter[resourceType]=Project,Preprint&cardSearchText=hello')
+        _first = self.handler(_params)
+        # same search, differently written
+        _params_again = CardsearchParams.from_querystring('cardSearchText=hello&cardSearchFilter[resourceType]=Preprint,Project')
+        _second = self.handler(_params_again)
+        self.assertEqual(self.raw_handler.call_count, 1)
+        self.assertEqual(_second.cursor, _first.cursor)
+        self.assertEqual(_second.search_result_page, _first.search_result_page)
+        self.assertIs(_second.search_params, _params_again)
+        self.assertIs(_first.search_params, _params)  # (not changed by caching)
+        self.assertEqual(search_result_cache.search_result_cache_counts(), {'hit': 1, 'miss': 1})
+
+    def test_miss(self):
+        self.handler(CardsearchParams.from_querystring('cardSearchText=hello'))
+        self.handler(CardsearchParams.from_querystring('cardSearchText=goodbye'))
+        self.handler(ValuesearchParams.from_querystring('cardSearchText=hello&valueSearchPropertyPath=creator'))
+        self.assertEqual(self.raw_handler.call_count, 3)
+        self.assertEqual(search_result_cache.search_result_cache_counts(), {'hit': 0, 'miss': 3})
+
+    def test_not_cached(self):
+        _params = CardsearchParams.from_querystring('cardSearchText=hello')
+        _next_page_params = dataclasses.replace(_params, page_cursor=OffsetCursor(start_offset=13))
+        _export_params = CardsearchParams.from_querystring('cardSearchText=hello&page[size]=all&withFileName=foo')
+        for _params_not_cached in (_next_page_params, _export_params):
+            self.handler(_params_not_cached)
+            self.handler(_params_not_cached)
+        self.assertEqual(self.raw_handler.call_count, 4)
+        self.assertEqual(search_result_cache.search_result_cache_counts(), {'hit': 0, 'miss': 0})
+
+    def test_no_pit_id_cached(self):
+        _pit_handler = mock.Mock(side_effect=lambda _params: CardsearchHandle(
+            cursor=SearchAfterCursor(total_count=7, search_after=['a'], pit_id='some-pit'),
+            search_params=_params,
+            search_result_page=[],
+        ))
+        _handler = search_result_cache.with_search_result_cache(self.strategy, _pit_handler)
+        _params = CardsearchParams.from_querystring('cardSearchText=hello')
+        self.assertEqual(_handler(_params).cursor.pit_id, 'some-pit')  # miss; as given
+        _cached = _handler(_params)  # hit
+        self.assertEqual(_pit_handler.call_count, 1)
+        self.assertIsNone(_cached.cursor.pit_id)
+        self.assertEqual(_cached.cursor.search_after, ['a'])
+
+    def test_invalidate(self):
+        _params = CardsearchParams.from_querystring('cardSearchText=hello')
+        self.handler(_params)
+        search_result_cache.invalidate_strategy(FakeIndexStrategy(strategy_check='othercheck'))
+        self.handler(_params)
+        self.assertEqual(self.raw_handler.call_count, 1)
+        search_result_cache.invalidate_strategy(self.strategy)
+        self.handler(_params)
+        self.assertEqual(self.raw_handler.call_count, 2)
+        # other strategy checks have separate results
+        _other_handler = search_result_cache.with_search_result_cache(
+            FakeIndexStrategy(strategy_check='othercheck'),
+            self.raw_handler,
+        )
+        _other_handler(_params)
+        self.assertEqual(self.raw_handler.call_count, 3)
+
+    def test_shared_cache_round_trips(self):
+        _params = CardsearchParams.from_querystring('cardSearchText=hello')
+        _shared_cache = search_result_cache._get_shared_cache()
+        with (
+            mock.patch.object(_shared_cache, 'get', wraps=_shared_cache.get) as _mock_get,
+            mock.patch.object(_shared_cache, 'add', wraps=_shared_cache.add) as _mock_add,
+        ):
+            for _ in range(5):
+                self.handler(_params)
+            self.assertEqual(_mock_get.call_count, 1)  # generation checked once
+            _mock_add.assert_not_called()  # counts not yet flushed
+            # invalidated by another process: seen once the generation is checked again
+            search_result_cache._incr_shared(search_result_cache._generation_key(self.strategy), 1)
+            self.handler(_params)
+            self.assertEqual(self.raw_handler.call_count, 1)
+            with mock.patch('time.monotonic', return_value=(time.monotonic() + 11)):
+                self.handler(_params)
+            self.assertEqual(self.raw_handler.call_count, 2)
+            self.assertEqual(_mock_get.call_count, 2)
+            self.assertEqual(  # counts flushed (all at once)
+                {_call.args for _call in _mock_add.call_args_list},
+                {(search_result_cache.HIT_COUNT_CACHE_KEY, 5), (search_result_cache.MISS_COUNT_CACHE_KEY, 2)},
+            )
+
+    def test_cached_aggregations(self):
+        _search = mock.Mock(return_value={'agg_foo': {'buckets': [{'key': {'value_iri': 'foo'}}]}})
+        _query = {'size': 0, 'aggs': {'agg_foo': {'composite': {'size': 3}}}}
+        _first = search_result_cache.with_cached_aggregations(self.strategy, _query, _search)
+        _second = search_result_cache.with_cached_aggregations(
+            self.strategy,
+            {'aggs': {'agg_foo': {'composite': {'size': 3}}}, 'size': 0},  # same, differently ordered
+            _search,
+        )
+        self.assertEqual(_search.call_count, 1)
+        self.assertEqual(_first, _second)
+        # a different page (or any other difference) is cached separately
+        _after_query = {'size': 0, 'aggs': {'agg_foo': {'composite': {'size': 3, 'after': {'value_iri': 'foo'}}}}}
+        search_result_cache.with_cached_aggregations(self.strategy, _after_query, _search)
+        self.assertEqual(_search.call_count, 2)
+        search_result_cache.invalidate_strategy(self.strategy)
+        search_result_cache.with_cached_aggregations(self.strategy, _query, _search)
+        self.assertEqual(_search.call_count, 3)
+
+
+class TestLocmemSearchResultCache(_BaseSearchResultCacheTests, TestCase):
+    backend = 'locmem'
+
+    def test_ttl(self):
+        _params = CardsearchParams.from_querystring('cardSearchText=hello')
+        self.handler(_params)
+        self.handler(_params)
+        self.assertEqual(self.raw_handler.call_count, 1)
+        with mock.patch('time.monotonic', return_value=(time.monotonic() + 61)):
+            self.handler(_params)
+        self.assertEqual(self.raw_handler.call_count, 2)
+
+    def test_lru(self):
+        _a, _b, _c = (
+            CardsearchParams.from_querystring(f'cardSearchText={_text}')
+            for _text in ('a', 'b', 'c')
+        )
+        self.handler(_a)
+        self.handler(_b)
+        self.handler(_a)  # hit; b is least recently used
+        self.handler(_c)  # evicts b (max 2 entries)
+        self.assertEqual(self.raw_handler.call_count, 3)
+        self.handler(_a)
+        self.assertEqual(self.raw_handler.call_count, 3)
+        self.handler(_b)
+        self.assertEqual(self.raw_handler.call_count, 4)
+
+
+class TestDjangoSearchResultCache(_BaseSearchResultCacheTests, TestCase):
+    backend = 'django'
+
+
+class TestSharedCacheRequired(TestCase):
+    def test_system_check(self):
+        search_result_cache.get_search_result_cache.cache_clear()
+        self.addCleanup(search_result_cache.get_search_result_cache.cache_clear)
+        with override_settings(
+            CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}},
+            SEARCH_RESULT_CACHE={**search_result_cache.settings.SEARCH_RESULT_CACHE, 'BACKEND': 'locmem', 'SHARED_CACHE_ALIAS': 'default'},
+        ):
+            self.assertEqual(
+                [_error.id for _error in check_search_result_cache(None)],
+                ['share.search.E002'],
+            )
+
+    def test_locmem_not_shared(self):
+        search_result_cache.get_search_result_cache.cache_clear()
+        self.addCleanup(search_result_cache.get_search_result_cache.cache_clear)
+        _settings = {
+            'BACKEND': 'locmem',
+            'TTL_SECONDS': 60,
+            'MAX_ENTRIES': 2,
+            'DJANGO_CACHE_ALIAS': 'default',
+            'SHARED_CACHE_ALIAS': 'default',
+            'GENERATION_CHECK_SECONDS': 2,
+            'COUNT_FLUSH_SECONDS': 10,
+        }
+        with override_settings(
+            CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}},
+            SEARCH_RESULT_CACHE=_settings,
+        ):
+            with self.assertRaises(ImproperlyConfigured):
+                search_result_cache.get_search_result_cache()
+
+
+class TestNoSearchResultCache(TestCase):
+    def test_no_cache(self):
+        search_result_cache.get_search_result_cache.cache_clear()
+        self.addCleanup(search_result_cache.get_search_result_cache.cache_clear)
+        _handler = FakeSearchHandler()
+        with override_settings(SEARCH_RESULT_CACHE={**search_result_cache.settings.SEARCH_RESULT_CACHE, 'BACKEND': ''}):
+            self.assertIs(search_result_cache.with_search_result_cache(FakeIndexStrategy(), _handler), _handler)
+            _search = mock.Mock(return_value={})
+            search_result_cache.with_cached_aggregations(FakeIndexStrategy(), {}, _search)
+            search_result_cache.with_cached_aggregations(FakeIndexStrategy(), {}, _search)
+            self.assertEqual(_search.call_count, 2)
+
+    def test_no_invalidate(self):
+        search_result_cache.get_search_result_cache.cache_clear()
+        self.addCleanup(search_result_cache.get_search_result_cache.cache_clear)
+        with (
+            override_settings(SEARCH_RESULT_CACHE={**search_result_cache.settings.SEARCH_RESULT_CACHE, 'BACKEND': ''}),
+            mock.patch.object(search_result_cache, '_get_shared_cache') as _mock_get_shared_cache,
+        ):
+            search_result_cache.invalidate_strategy(FakeIndexStrategy())
+        _mock_get_shared_cache.assert_not_called()
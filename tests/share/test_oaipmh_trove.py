@@ -31,7 +31,12 @@ def oai_request(data, request_method, expect_errors=False):
     else:
         raise NotImplementedError
     assert response.status_code == 200
-    parsed = etree.fromstring(response.content, parser=etree.XMLParser(recover=True))
+    _content = (
+        b''.join(response.streaming_content)
+        if response.streaming
+        else response.content
+    )
+    parsed = etree.fromstring(_content, parser=etree.XMLParser(recover=True))
     actual_errors = parsed.xpath('//oai:error', namespaces=NAMESPACES)
     if expect_errors:
         assert actual_errors
@@ -84,6 +89,18 @@ class TestOAIVerbs:
         record_id = 'oai:share.osf.io:{}'.format(oai_indexcard.upriver_indexcard.uuid)
         assert record_id == records[0].xpath('oai:header/oai:identifier', namespaces=NAMESPACES)[0].text
 
+    def test_list_records_streams(self, oai_indexcard):
+        response = Client().get('/oai-pmh/', {'verb': 'ListRecords', 'metadataPrefix': 'oai_dc'})
+        assert response.status_code == 200
+        assert response.streaming
+        assert response['Content-Type'] == 'text/xml'
+        _content = b''.join(response.streaming_content)
+        assert _content.startswith(b"<?xml version='1.0' encoding='utf-8'?>")
+        assert b'<metadata><foo></foo></metadata>' in _content  # derived_text as-is
+        # unchanged: non-list responses
+        response = Client().get('/oai-pmh/', {'verb': 'Identify'})
+        assert not response.streaming
+
     def test_get_record(self, request_method, oai_indexcard):
         ant_id = 'oai:share.osf.io:{}'.format(oai_indexcard.upriver_indexcard.uuid)
         parsed = oai_request({'verb': 'GetRecord', 'metadataPrefix': 'oai_dc', 'identifier': ant_id}, request_method)
@@ -178,7 +195,7 @@ class TestOAILists:
             for _latest_resource_description in _latest_resource_descriptions
         ]
 
-    def test_lists(self, oai_indexcards, monkeypatch):
+    def test_lists(self, oai_indexcards, settings):
         test_params_list = [
             (request_method, verb, page_size)
             for request_method in ['GET', 'POST']
@@ -186,11 +203,44 @@ class TestOAILists:
             for page_size in [7, 13, 101]
         ]
         for request_method, verb, page_size in test_params_list:
-            monkeypatch.setattr('share.oaipmh.indexcard_repository.OaiPmhRepository.PAGE_SIZE', page_size)
+            settings.OAIPMH_PAGE_SIZE = page_size
             self._assert_full_list(verb, {}, request_method, len(oai_indexcards), page_size)
             self._test_filter_date(oai_indexcards, request_method, verb, page_size)
             self._test_filter_set(oai_indexcards, request_method, verb, page_size)
 
+    def test_resumption_tokens(self, oai_indexcards, settings):
+        settings.OAIPMH_PAGE_SIZE = 7
+        parsed = oai_request({'verb': 'ListIdentifiers', 'metadataPrefix': 'oai_dc'}, 'GET')
+        (token,) = parsed.xpath('//oai:resumptionToken', namespaces=NAMESPACES)
+        token = token.text
+        _last_id = trove_db.Indexcard.objects.get(
+            uuid=parsed.xpath('//oai:header/oai:identifier', namespaces=NAMESPACES)[-1].text.split(':')[-1],
+        ).id
+        # opaque
+        assert '|' not in token
+        assert 'oai_dc' not in token
+        # tampered
+        _tampered = token[:-1] + ('A' if token[-1] != 'A' else 'B')
+        _errors = oai_request({'verb': 'ListIdentifiers', 'resumptionToken': _tampered}, 'GET', expect_errors=True)
+        assert {_e.attrib.get('code') for _e in _errors} == {'badResumptionToken'}
+        # keyset: resumed page starts after the last id
+        _next_page = oai_request({'verb': 'ListIdentifiers', 'resumptionToken': token}, 'GET')
+        _next_ids = [
+            _indexcard.id
+            for _indexcard in trove_db.Indexcard.objects.filter(uuid__in=[
+                _identifier.text.split(':')[-1]
+                for _identifier in _next_page.xpath('//oai:header/oai:identifier', namespaces=NAMESPACES)
+            ])
+        ]
+        assert len(_next_ids) == 7
+        assert min(_next_ids) > _last_id
+        # old-style (unsigned) tokens still accepted
+        _legacy_page = oai_request({'verb': 'ListIdentifiers', 'resumptionToken': f'|||oai_dc|{_last_id}'}, 'GET')
+        assert (
+            etree.tostring(_legacy_page.xpath('//oai:ListIdentifiers', namespaces=NAMESPACES)[0])
+            == etree.tostring(_next_page.xpath('//oai:ListIdentifiers', namespaces=NAMESPACES)[0])
+        )
+
     def _test_filter_date(self, oai_indexcards, request_method, verb, page_size):
         _today = datetime.datetime.now()
         _yesterday = _today - datetime.timedelta(days=1)
@@ -250,3 +300,58 @@ class TestOAILists:
 
         assert count == expected_count
         assert pages == math.ceil(expected_count / page_size)
+
+
+class TestOAIHarvestBenchmark:
+    # run with `pytest -o addopts='' -k Benchmark tests/share/test_oaipmh_trove.py`
+    SYNTHETIC_CARD_COUNT = 100_000
+
+    @pytest.mark.django_db
+    def test_harvest_list_records(self, benchmark):
+        _create_synthetic_oai_indexcards(self.SYNTHETIC_CARD_COUNT)
+
+        def _harvest():
+            _count = 0
+            _params: dict[str, str] | None = {'verb': 'ListRecords', 'metadataPrefix': 'oai_dc'}
+            while _params is not None:
+                parsed = oai_request(_params, 'GET')
+                _count += len(parsed.xpath('//oai:record', namespaces=NAMESPACES))
+                (_token,) = parsed.xpath('//oai:resumptionToken', namespaces=NAMESPACES)
+                _params = (
+                    {'verb': 'ListRecords', 'resumptionToken': _token.text}
+                    if _token.text
+                    else None  # done
+                )
+            return _count
+
+        _harvested_count = benchmark.pedantic(_harvest, rounds=1, iterations=1)
+        assert _harvested_count == self.SYNTHETIC_CARD_COUNT
+
+
+def _create_synthetic_oai_indexcards(count):
+    _source_config = factories.SourceConfigFactory()
+    _deriver_identifier = trove_db.ResourceIdentifier.objects.get_or_create_for_iri(str(OAI_DC))
+    _suids = share_db.SourceUniqueIdentifier.objects.bulk_create(
+        share_db.SourceUniqueIdentifier(identifier=f'synthetic-{_i}', source_config=_source_config)
+        for _i in range(count)
+    )
+    _indexcards = trove_db.Indexcard.objects.bulk_create(
+        trove_db.Indexcard(source_record_suid=_suid)
+        for _suid in _suids
+    )
+    trove_db.LatestResourceDescription.objects.bulk_create(
+        trove_db.LatestResourceDescription(
+            indexcard=_indexcard,
+            focus_iri=f'http://test.example/{_indexcard.id}',
+            rdf_as_turtle=f'<http://test.example/{_indexcard.id}> a <http://test.example/Synthetic>',
+        )
+        for _indexcard in _indexcards
+    )
+    trove_db.DerivedIndexcard.objects.bulk_create(
+        trove_db.DerivedIndexcard(
+            upriver_indexcard=_indexcard,
+            deriver_identifier=_deriver_identifier,
+            derived_text=f'<foo>synthetic {_indexcard.id}</foo>',
+        )
+        for _indexcard in _indexcards
+    )
@@ -1,11 +1,16 @@
 import json
+from unittest import mock
+import uuid
 
 from django.test import TestCase
+from primitive_metadata import primitive_rdf as rdf
 
 from tests import factories
+from tests.trove.factories import create_indexcard, update_indexcard_content
 from trove import digestive_tract
 from trove import models as trove_db
-from trove.vocab.namespaces import TROVE, BLARG as _BLARG
+from trove.vocab import mediatypes
+from trove.vocab.namespaces import RDF, TROVE, BLARG as _BLARG
 from trove.util.iris import get_sufficiently_unique_iri
 
 
@@ -56,3 +61,120 @@ blarg:this blarg:unlike blarg:nonthing .
             'blarg:like': [{'@id': 'blarg:that'}],
             'blarg:unlike': [{'@id': 'blarg:nonthing'}],
         })
+
+    def test_derive_parses_once(self):
+        self.latest_resource_description.turtle_checksum_iri = f'urn:checksum:sha-256::{uuid.uuid4().hex}'
+        self.latest_resource_description.save()
+        with mock.patch(
+            'trove.models.resource_description.rdf.tripledict_from_turtle',
+            wraps=rdf.tripledict_from_turtle,
+        ) as _mock_parse:
+            _derived_list = digestive_tract.derive(self.indexcard)
+            self.assertEqual(_mock_parse.call_count, 1)
+            # memoized by checksum; not parsed again
+            _same_derived_list = digestive_tract.derive(self.indexcard)
+            self.assertEqual(_mock_parse.call_count, 1)
+        self.assertEqual(
+            [_derived.derived_text for _derived in _derived_list],
+            [_derived.derived_text for _derived in _same_derived_list],
+        )
+
+    def test_derive_chunk(self):
+        _other_indexcard = create_indexcard(_BLARG.other, {
+            RDF.type: {_BLARG.Thing},
+            _BLARG.like: {_BLARG.this},
+        })
+        _deleted_indexcard = create_indexcard(_BLARG.deleted)
+        _deleted_indexcard.pls_delete(notify_indexes=False)
+        _deriver_iris = [TROVE['derive/osfmap_json_full']]
+        _changes = digestive_tract.derive_chunk(
+            [self.indexcard.id, _other_indexcard.id, _deleted_indexcard.id],
+            deriver_iris=_deriver_iris,
+        )
+        self.assertEqual(_changes, {
+            self.indexcard.id: {TROVE['derive/osfmap_json_full']},
+            _other_indexcard.id: {TROVE['derive/osfmap_json_full']},
+        })
+        _derived_qs = trove_db.DerivedIndexcard.objects.filter(
+            upriver_indexcard_id__in=[self.indexcard.id, _other_indexcard.id, _deleted_indexcard.id],
+        )
+        self.assertEqual(_derived_qs.count(), 2)
+        self.assertEqual(json.loads(_derived_qs.get(upriver_indexcard=_other_indexcard).derived_text), {
+            '@id': 'blarg:other',
+            'resourceType': [{'@id': 'blarg:Thing'}],
+            'blarg:like': [{'@id': 'blarg:this'}],
+        })
+        # again, after an update (same rows, updated in place)
+        _prior_ids = set(_derived_qs.values_list('id', flat=True))
+        update_indexcard_content(_other_indexcard, _BLARG.other, {
+            RDF.type: {_BLARG.Thing},
+            _BLARG.unlike: {_BLARG.this},
+        })
+        _changes = digestive_tract.derive_chunk([self.indexcard.id, _other_indexcard.id], deriver_iris=_deriver_iris)
+        self.assertEqual(_changes, {
+            self.indexcard.id: set(),
+            _other_indexcard.id: {TROVE['derive/osfmap_json_full']},
+        })
+        self.assertEqual(set(_derived_qs.values_list('id', flat=True)), _prior_ids)
+        self.assertEqual(json.loads(_derived_qs.get(upriver_indexcard=_other_indexcard).derived_text), {
+            '@id': 'blarg:other',
+            'resourceType': [{'@id': 'blarg:Thing'}],
+            'blarg:unlike': [{'@id': 'blarg:this'}],
+        })
+
+    def test_derive_chunk_task(self):
+        _other_indexcard = create_indexcard(_BLARG.other)
+        with mock.patch('trove.digestive_tract.IndexMessenger') as _mock_messenger_cls:
+            digestive_tract.task__derive_chunk.apply((
+                [self.indexcard.id, _other_indexcard.id],
+                TROVE['derive/osfmap_json_full'],
+            ))
+        (_notify_call,) = _mock_messenger_cls.return_value.notify_indexcard_update.call_args_list
+        self.assertEqual(
+            {_card.id for _card in _notify_call.args[0]},
+            {self.indexcard.id, _other_indexcard.id},
+        )
+        self.assertEqual(
+            trove_db.DerivedIndexcard.objects
+            .filter(upriver_indexcard_id__in=[self.indexcard.id, _other_indexcard.id])
+            .count(),
+            2,
+        )
+
+    def test_ingest_enqueues_derive_chunks(self):
+        # (like ingest_batch)
+        with mock.patch.object(digestive_tract, '_enqueue_derive_chunks') as _mock_enqueue:
+            digestive_tract.ingest(
+                from_user=factories.ShareUserFactory(),
+                focus_iri=_BLARG.ingested,
+                record_mediatype=mediatypes.TURTLE,
+                raw_record=f'<{_BLARG.ingested}> a <{_BLARG.Thing}> .',
+                urgent=True,
+            )
+        _indexcard = trove_db.Indexcard.objects.get(source_record_suid__identifier=_BLARG.ingested)
+        _mock_enqueue.assert_called_once_with([_indexcard.pk], urgent=True)
+
+    def test_derive_unchanged(self):
+        (_derived,) = digestive_tract.derive(self.indexcard, deriver_iris=[TROVE['derive/osfmap_json_full']])
+        _stored = trove_db.DerivedIndexcard.objects.get(id=_derived.id)
+        _changes = digestive_tract.derive_chunk([self.indexcard.id], deriver_iris=[TROVE['derive/osfmap_json_full']])
+        self.assertEqual(_changes, {self.indexcard.id: set()})
+        self.assertEqual(trove_db.DerivedIndexcard.objects.get(id=_derived.id).modified, _stored.modified)
+        # unchanged, the saved row is returned
+        (_derived_again,) = digestive_tract.derive(self.indexcard, deriver_iris=[TROVE['derive/osfmap_json_full']])
+        self.assertEqual(_derived_again.pk, _derived.pk)
+        self.assertFalse(_derived_again._state.adding)
+        self.assertEqual(_derived_again.modified, _stored.modified)
+        self.assertEqual(_derived_again.derived_text, _stored.derived_text)
+
+    def test_derive_task_notifies_only_on_change(self):
+        _deriver_iri = TROVE['derive/osfmap_json_full']
+        with mock.patch('trove.digestive_tract.IndexMessenger') as _mock_messenger_cls:
+            digestive_tract.task__derive.apply((self.indexcard.id, _deriver_iri))
+            (_notify_call,) = _mock_messenger_cls.return_value.notify_indexcard_update.call_args_list
+            self.assertEqual(_notify_call.args[0], [self.indexcard])
+            self.assertEqual(_notify_call.kwargs['changed_deriver_iris'], {_deriver_iri})
+            _mock_messenger_cls.reset_mock()
+            # again, with nothing changed
+            digestive_tract.task__derive.apply((self.indexcard.id, _deriver_iri))
+            _mock_messenger_cls.return_value.notify_indexcard_update.assert_not_called()
@@ -31,14 +31,16 @@ class TestDigestiveTractExpel(TestCase):
     def setUp(self):
         super().setUp()
         self.notified_indexcard_ids = set()
+        self.notify_call_count = 0
         self.enterContext(mock.patch(
             'share.search.index_messenger.IndexMessenger.notify_indexcard_update',
             new=self._replacement_notify_indexcard_update,
         ))
-        self.mock_derive_task = self.enterContext(mock.patch('trove.digestive_tract.task__derive'))
+        self.mock_derive_task = self.enterContext(mock.patch('trove.digestive_tract.task__derive_chunk'))
 
     def _replacement_notify_indexcard_update(self, indexcards, **kwargs):
         self.notified_indexcard_ids.update(_card.id for _card in indexcards)
+        self.notify_call_count += 1
 
     def test_setup(self):
         self.indexcard_1.refresh_from_db()
@@ -65,10 +67,13 @@ class TestDigestiveTractExpel(TestCase):
         _mock_expel_suid.assert_called_once_with(self.suid_1)
 
     def test_expel_suid(self):
+        _prior_modified = self.indexcard_1.modified
         digestive_tract.expel_suid(self.suid_1)
         self.indexcard_1.refresh_from_db()
         self.indexcard_2.refresh_from_db()
         self.assertIsNotNone(self.indexcard_1.deleted)
+        self.assertEqual(self.indexcard_1.modified, self.indexcard_1.deleted)
+        self.assertGreater(self.indexcard_1.modified, _prior_modified)
         self.assertIsNone(self.indexcard_2.deleted)
         self.assertEqual(share_db.SourceUniqueIdentifier.objects.count(), 3)
         with self.assertRaises(trove_db.LatestResourceDescription.DoesNotExist):
@@ -101,7 +106,7 @@ class TestDigestiveTractExpel(TestCase):
         self.assertEqual(self.indexcard_2.derived_indexcard_set.count(), 1)
         # did not notify indexes of update; did enqueue re-derive
         self.assertEqual(self.notified_indexcard_ids, set())
-        self.mock_derive_task.delay.assert_called_once_with(self.indexcard_1.id)
+        self.mock_derive_task.delay.assert_called_once_with([self.indexcard_1.id], urgent=False)
 
     def test_expel_expired_task(self):
         with mock.patch('trove.digestive_tract.expel_expired_data') as _mock_expel_expired:
@@ -152,4 +157,32 @@ class TestDigestiveTractExpel(TestCase):
         self.assertEqual(self.indexcard_2.derived_indexcard_set.count(), 1)
         # did not notify indexes of update; did enqueue re-derive
         self.assertEqual(self.notified_indexcard_ids, set())
-        self.mock_derive_task.delay.assert_called_once_with(self.indexcard_1.id)
+        self.mock_derive_task.delay.assert_called_once_with([self.indexcard_1.id], urgent=False)
+
+    def test_expel_expired_many(self):
+        _today = datetime.date.today()
+        _cards = [
+            create_indexcard(BLARG[f'many{_i}'], deriver_iris=[TROVE['derive/osfmap_json']])
+            for _i in range(5)
+        ]
+        for _i, _card in enumerate(_cards):
+            create_supplement(_card, BLARG[f'many{_i}'])
+        trove_db.LatestResourceDescription.objects.filter(indexcard__in=_cards).update(expiration_date=_today)
+        trove_db.SupplementaryResourceDescription.objects.update(expiration_date=_today)
+        with mock.patch.object(digestive_tract, 'EXPEL_CHUNK_SIZE', 2):
+            with self.assertNumQueries(32):  # a few per chunk, none per card
+                digestive_tract.expel_expired_data(_today)
+        _card_ids = {_card.id for _card in _cards}
+        self.assertEqual(
+            set(trove_db.Indexcard.objects.filter(deleted__isnull=False).values_list('id', flat=True)),
+            _card_ids,
+        )
+        self.assertFalse(trove_db.LatestResourceDescription.objects.filter(indexcard__in=_cards).exists())
+        self.assertFalse(trove_db.DerivedIndexcard.objects.filter(upriver_indexcard__in=_cards).exists())
+        self.assertFalse(trove_db.SupplementaryResourceDescription.objects.exists())
+        self.assertEqual(trove_db.ArchivedResourceDescription.objects.filter(indexcard__in=_cards).count(), 5)
+        # one index notification per chunk of cards
+        self.assertEqual(self.notified_indexcard_ids, _card_ids)
+        self.assertEqual(self.notify_call_count, 3)
+        # re-derive only the one card not deleted (in one chunk)
+        self.mock_derive_task.delay.assert_called_once_with([self.indexcard_1.id], urgent=False)
@@ -1,5 +1,7 @@
 import datetime
-from django.test import TestCase
+import tempfile
+
+from django.test import TestCase, override_settings
 from primitive_metadata import primitive_rdf as rdf
 
 from tests import factories
@@ -10,6 +12,20 @@ from trove.vocab import mediatypes
 from trove.vocab.namespaces import BLARG as _BLARG
 
 
+def _shared_count_cache_settings():
+    # a file-based cache is shared across processes (like redis or memcached would be)
+    return {
+        'CACHES': {
+            'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+            'ingest_count': {
+                'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+                'LOCATION': tempfile.mkdtemp(prefix='ingest_count'),
+            },
+        },
+        'INGEST_COUNT_CACHE_ALIAS': 'ingest_count',
+    }
+
+
 class TestDigestiveTractExtract(TestCase):
     @classmethod
     def setUpTestData(cls):
@@ -71,6 +87,44 @@ blarg:this blarg:like blarg:another ;
             },
         })
 
+    @override_settings(**_shared_count_cache_settings())
+    def test_extract_unchanged(self):
+        (_indexcard,) = digestive_tract.extract(
+            suid=self.suid,
+            record_mediatype=mediatypes.TURTLE,
+            raw_record=self.raw_turtle,
+        )
+        _prior_modified = _indexcard.latest_resource_description.modified
+        _prior_noop_count = digestive_tract.noop_ingest_count()
+        with (
+            self.assertNumQueries(1),
+            self.assertLogs(digestive_tract.logger, 'DEBUG') as _logs,
+            self.captureOnCommitCallbacks(execute=True),  # (counted once committed)
+        ):
+            _extracted = digestive_tract.extract(
+                suid=self.suid,
+                record_mediatype=mediatypes.TURTLE,
+                raw_record=self.raw_turtle,
+            )
+        self.assertEqual(_extracted, [])
+        self.assertEqual(_logs.output, [
+            f'DEBUG:{digestive_tract.__name__}:skipping unchanged record (suid {self.suid.pk})',
+        ])
+        self.assertEqual(digestive_tract.noop_ingest_count(), _prior_noop_count + 1)
+        self.assertEqual(
+            trove_db.LatestResourceDescription.objects.get(indexcard=_indexcard).modified,
+            _prior_modified,
+        )
+        # not skipped with a different expiration date
+        (_same_indexcard,) = digestive_tract.extract(
+            suid=self.suid,
+            record_mediatype=mediatypes.TURTLE,
+            raw_record=self.raw_turtle,
+            expiration_date=datetime.date.today() + datetime.timedelta(days=3),
+        )
+        self.assertEqual(_same_indexcard.id, _indexcard.id)
+        self.assertEqual(digestive_tract.noop_ingest_count(), _prior_noop_count + 1)
+
     def test_extract_before_expiration(self):
         _expir = datetime.date.today() + datetime.timedelta(days=3)
         (_indexcard,) = digestive_tract.extract(
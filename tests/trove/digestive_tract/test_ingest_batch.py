@@ -0,0 +1,124 @@
+import tempfile
+from unittest import mock
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from tests import factories
+from trove import digestive_tract
+from trove import models as trove_db
+from trove.checks import check_ingest_count_cache
+from trove.exceptions import DigestiveError
+from trove.vocab import mediatypes
+from trove.vocab.namespaces import BLARG
+
+
+def _record(name: str, title: str) -> digestive_tract.RecordToIngest:
+    return digestive_tract.RecordToIngest(
+        focus_iri=BLARG[name],
+        record_mediatype=mediatypes.TURTLE,
+        raw_record=f'<{BLARG[name]}> a <{BLARG.Thing}> ; <{BLARG.title}> "{title}" .',
+    )
+
+
+@override_settings(
+    CACHES={
+        'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+        'ingest_count': {  # (file-based, shared across processes like redis or memcached)
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': tempfile.mkdtemp(prefix='ingest_count'),
+        },
+    },
+    INGEST_COUNT_CACHE_ALIAS='ingest_count',
+)
+class TestDigestiveTractIngestBatch(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = factories.ShareUserFactory()
+
+    def _ingest_batch(self, records) -> list:
+        # returns the queries run (derive tasks not enqueued)
+        with (
+            mock.patch.object(digestive_tract, '_enqueue_derive_chunks'),
+            CaptureQueriesContext(connection) as _queries,
+        ):
+            digestive_tract.ingest_batch(from_user=self.user, records=records)
+        return _queries.captured_queries
+
+    def test_unchanged_skipped(self):
+        _records = [_record(f'thing{_i}', f'title {_i}') for _i in range(5)]
+        self._ingest_batch(_records)
+        self.assertEqual(trove_db.Indexcard.objects.count(), 5)
+        _prior_modified = set(trove_db.LatestResourceDescription.objects.values_list('modified', flat=True))
+        _prior_noop_count = digestive_tract.noop_ingest_count()
+        with mock.patch.object(
+            digestive_tract,
+            '_extract_rdf_and_save',
+            wraps=digestive_tract._extract_rdf_and_save,
+        ) as _mock_extract:
+            with self.captureOnCommitCallbacks(execute=True):  # (counted once committed)
+                _small_batch_queries = self._ingest_batch(_records[:1])
+                _large_batch_queries = self._ingest_batch(_records)
+            _mock_extract.assert_not_called()
+            self.assertEqual(digestive_tract.noop_ingest_count(), _prior_noop_count + 6)
+            # all unchanged records found at once (as many queries for one as for five)
+            self.assertEqual(len(_small_batch_queries), len(_large_batch_queries))
+            self.assertEqual(
+                set(trove_db.LatestResourceDescription.objects.values_list('modified', flat=True)),
+                _prior_modified,
+            )
+            # changed records extracted (only those)
+            self._ingest_batch([*_records[:3], _record('thing3', 'changed title'), _record('thing5', 'new')])
+            self.assertEqual(
+                [_call.kwargs['suid'].focus_identifier.as_iri() for _call in _mock_extract.call_args_list],
+                [BLARG.thing3, BLARG.thing5],
+            )
+        self.assertEqual(trove_db.Indexcard.objects.count(), 6)
+
+    def test_noop_count_only_committed(self):
+        _records = [_record('thing', 'title')]
+        self._ingest_batch(_records)
+        _prior_noop_count = digestive_tract.noop_ingest_count()
+        _unfindable = digestive_tract.RecordToIngest(
+            focus_iri=BLARG.elsewhere,
+            record_mediatype=mediatypes.TURTLE,
+            raw_record=f'<{BLARG.nowhere}> <{BLARG.title}> "nope" .',
+        )
+        with self.captureOnCommitCallbacks(execute=True), self.assertRaises(DigestiveError):
+            self._ingest_batch([*_records, _unfindable])  # (rolled back)
+        self.assertEqual(digestive_tract.noop_ingest_count(), _prior_noop_count)
+
+    def test_noop_count_requires_shared_cache(self):
+        _records = [_record('thing', 'title')]
+        self._ingest_batch(_records)
+        for _cache_alias in ('default', 'nonexistent'):  # (locmem, no cache)
+            with override_settings(INGEST_COUNT_CACHE_ALIAS=_cache_alias):
+                self.assertEqual(
+                    [_error.id for _error in check_ingest_count_cache(None)],
+                    ['trove.E001'],
+                )
+                with self.assertRaises(ImproperlyConfigured):
+                    digestive_tract.get_ingest_count_cache()
+                # not counted, but ingest still works
+                with self.captureOnCommitCallbacks(execute=True):
+                    self._ingest_batch(_records)
+                self.assertIsNone(digestive_tract.noop_ingest_count())
+        self.assertEqual(check_ingest_count_cache(None), [])
+        with override_settings(INGEST_COUNT_CACHE_ALIAS=''):
+            self.assertEqual(check_ingest_count_cache(None), [])
+            self.assertIsNone(digestive_tract.noop_ingest_count())
+
+    def test_noop_count_in_admin(self):
+        _superuser = factories.ShareUserFactory(is_staff=True, is_superuser=True)
+        self.client.force_login(_superuser)
+        _records = [_record('thing', 'title')]
+        self._ingest_batch(_records)
+        with self.captureOnCommitCallbacks(execute=True):
+            self._ingest_batch(_records)
+        _response = self.client.get('/admin/trove/indexcard/')
+        self.assertContains(
+            _response,
+            f'records skipped as unchanged when ingested: {digestive_tract.noop_ingest_count()}',
+        )
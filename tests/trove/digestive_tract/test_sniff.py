@@ -88,3 +88,85 @@ class TestDigestiveTractSniff(TestCase):
                 focus_iri=BLARG.foo,
                 record_identifier='foo-supp',
             )
+
+    def test_sniff_batch(self):
+        _prior_suid = digestive_tract.sniff(
+            from_user=self.user,
+            record_identifier='foo',
+            focus_iri=BLARG.foo,
+        )
+        _suids = digestive_tract.sniff_batch(
+            from_user=self.user,
+            records=[
+                digestive_tract.RecordToIngest(
+                    focus_iri=BLARG.bar,
+                    record_mediatype='text/turtle',
+                    raw_record='',
+                ),
+                digestive_tract.RecordToIngest(
+                    focus_iri=BLARG.foo,
+                    record_identifier='foo',
+                    record_mediatype='text/turtle',
+                    raw_record='',
+                ),
+                digestive_tract.RecordToIngest(
+                    focus_iri=BLARG.foo,
+                    record_identifier='foo-supp',
+                    record_mediatype='text/turtle',
+                    raw_record='',
+                    is_supplementary=True,
+                ),
+            ],
+        )
+        self.assertEqual(share_db.SourceUniqueIdentifier.objects.all().count(), 3)
+        self.assertEqual(share_db.SourceConfig.objects.all().count(), 1)
+        (_bar_suid, _foo_suid, _foo_supp_suid) = _suids
+        self.assertEqual(_bar_suid.identifier, BLARG.bar)
+        self.assertEqual(_bar_suid.focus_identifier.sufficiently_unique_iri, '://blarg.example/vocab/bar')
+        self.assertFalse(_bar_suid.is_supplementary)
+        self.assertEqual(_foo_suid.id, _prior_suid.id)
+        self.assertEqual(_foo_suid.focus_identifier_id, _prior_suid.focus_identifier_id)
+        self.assertEqual(_foo_supp_suid.identifier, 'foo-supp')
+        self.assertEqual(_foo_supp_suid.focus_identifier_id, _prior_suid.focus_identifier_id)
+        self.assertTrue(_foo_supp_suid.is_supplementary)
+        for _suid in _suids:
+            _suid.refresh_from_db()
+            self.assertEqual(_suid.source_config.source.user_id, self.user.id)
+        self.assertEqual(_foo_supp_suid.focus_identifier.sufficiently_unique_iri, '://blarg.example/vocab/foo')
+
+    def test_error_sniff_batch(self):
+        digestive_tract.sniff(
+            from_user=self.user,
+            record_identifier='foo',
+            focus_iri=BLARG.bar,
+        )
+        with self.assertRaises(trove_exceptions.DigestiveError):
+            digestive_tract.sniff_batch(
+                from_user=self.user,
+                records=[
+                    digestive_tract.RecordToIngest(
+                        focus_iri=BLARG.different,
+                        record_identifier='foo',
+                        record_mediatype='text/turtle',
+                        raw_record='',
+                    ),
+                ],
+            )
+        with self.assertRaises(trove_exceptions.DigestiveError):
+            digestive_tract.sniff_batch(
+                from_user=self.user,
+                records=[
+                    digestive_tract.RecordToIngest(
+                        focus_iri=BLARG.zip,
+                        record_identifier='zip',
+                        record_mediatype='text/turtle',
+                        raw_record='',
+                    ),
+                    digestive_tract.RecordToIngest(
+                        focus_iri=BLARG.zap,
+                        record_identifier='zip',
+                        record_mediatype='text/turtle',
+                        raw_record='',
+                    ),
+                ],
+            )
@@ -0,0 +1,192 @@
+import datetime
+import zlib
+
+from django.db import connection
+from django.db.models import F, ProtectedError
+from django.test import TestCase
+from django.utils import timezone
+from primitive_metadata import primitive_rdf as rdf
+
+from tests.trove.factories import create_indexcard, update_indexcard_content
+from trove import digestive_tract
+from trove import models as trove_db
+from trove.models.content_blob import decompressed
+from trove.vocab.namespaces import BLARG, DCTERMS, TROVE
+
+
+_DERIVER_IRI = TROVE['derive/osfmap_json']
+
+
+def _stored_bytes(blob: trove_db.ContentBlob) -> bytes:
+    with connection.cursor() as _cursor:
+        _cursor.execute(f'SELECT content FROM {blob._meta.db_table} WHERE id = %s', [blob.pk])
+        (_stored,) = _cursor.fetchone()
+    return bytes(_stored)
+
+
+class TestTurtleBlob(TestCase):
+    def test_shared_by_checksum(self):
+        _card = create_indexcard(BLARG.a, {DCTERMS.title: {rdf.literal('aaaa')}})
+        _latest = _card.latest_resource_description
+        _archived = _card.archived_description_set.get()
+        # latest and archived descriptions share one blob, stored compressed
+        self.assertEqual(trove_db.TurtleBlob.objects.count(), 1)
+        self.assertEqual(_latest.turtle_blob_id, _archived.turtle_blob_id)
+        self.assertEqual(_latest.turtle_blob.checksum_iri, _latest.turtle_checksum_iri)
+        self.assertIn('aaaa', _latest.rdf_as_turtle)
+        self.assertEqual(zlib.decompress(_stored_bytes(_latest.turtle_blob)).decode(), _latest.rdf_as_turtle)
+        # same turtle on another card, same blob
+        create_indexcard(BLARG.a, {DCTERMS.title: {rdf.literal('aaaa')}})
+        self.assertEqual(trove_db.TurtleBlob.objects.count(), 1)
+        # new turtle, new blob
+        update_indexcard_content(_card, BLARG.a, {DCTERMS.title: {rdf.literal('bbbb')}})
+        self.assertEqual(trove_db.TurtleBlob.objects.count(), 2)
+        self.assertIn('bbbb', _card.latest_resource_description.rdf_as_turtle)
+
+    def test_decompressed_when_read(self):
+        _card = create_indexcard(BLARG.a, {DCTERMS.title: {rdf.literal('aaaa')}})
+        _latest = (
+            trove_db.LatestResourceDescription.objects
+            .select_related('turtle_blob')
+            .get(indexcard=_card)
+        )
+        # loaded compressed...
+        self.assertIsInstance(_latest.turtle_blob.__dict__['content'], (bytes, memoryview))
+        # ...decompressed once read
+        self.assertIn('aaaa', _latest.rdf_as_turtle)
+        self.assertIsInstance(_latest.turtle_blob.__dict__['content'], str)
+        # compressed in `values`
+        (_values_content,) = trove_db.TurtleBlob.objects.values_list('content', flat=True)
+        self.assertEqual(zlib.decompress(_values_content).decode(), _latest.rdf_as_turtle)
+
+    def test_bulk_create(self):
+        _cards = trove_db.Indexcard.objects.bulk_create(
+            trove_db.Indexcard(source_record_suid=create_indexcard().source_record_suid)
+            for _ in range(3)
+        )
+        trove_db.SupplementaryResourceDescription.objects.bulk_create(
+            trove_db.SupplementaryResourceDescription(
+                indexcard=_card,
+                supplementary_suid=_card.source_record_suid,
+                focus_iri=BLARG.a,
+                rdf_as_turtle=f'<{BLARG.a}> <{DCTERMS.title}> "same" .',
+            )
+            for _card in _cards
+        )
+        _blob_ids = set(
+            trove_db.SupplementaryResourceDescription.objects
+            .filter(indexcard__in=_cards)
+            .values_list('turtle_blob_id', flat=True)
+        )
+        self.assertEqual(len(_blob_ids), 1)
+
+    def test_packed_tripledict(self):
+        _card = create_indexcard(BLARG.a, {DCTERMS.title: {rdf.literal('aaaa')}})
+        _latest = trove_db.LatestResourceDescription.objects.get(indexcard=_card)
+        _blob = _latest.turtle_blob
+        _parsed = rdf.tripledict_from_turtle(_latest.rdf_as_turtle)
+        # packed on update, used on read
+        self.assertIsNotNone(_blob.packed_tripledict)
+        self.assertEqual(_latest.as_rdf_tripledict(), _parsed)
+        # without, parsed from turtle
+        trove_db.TurtleBlob.objects.update(packed_tripledict=None)
+        _blob.refresh_from_db()
+        self.assertEqual(_blob.as_rdf_tripledict(), _parsed)
+        _blob.pack_tripledict()
+        _blob.refresh_from_db()
+        self.assertIsNotNone(_blob.packed_tripledict)
+        self.assertEqual(_blob.as_rdf_tripledict(), _parsed)
+        # unknown packing, parsed from turtle
+        trove_db.TurtleBlob.objects.update(packed_tripledict='{"v":999}')
+        _blob.refresh_from_db()
+        self.assertEqual(_blob.as_rdf_tripledict(), _parsed)
+
+    def test_packed_from_turtle(self):
+        _latest = create_indexcard(BLARG.a, {
+            DCTERMS.title: {rdf.literal('aaaa', datatype_iris={BLARG.Type, BLARG.Typo})},
+        }).latest_resource_description
+        self.assertIn('content', _latest.turtle_blob.get_deferred_fields())  # not needed to read rdf
+        self.assertIsNotNone(_latest.turtle_blob.packed_tripledict)
+        self.assertEqual(_latest.as_rdf_tripledict(), rdf.tripledict_from_turtle(_latest.rdf_as_turtle))
+        _dated_latest = create_indexcard(BLARG.b, {
+            DCTERMS.created: {datetime.date(2021, 10, 18)},  # (a python date, not a literal)
+        }).latest_resource_description
+        self.assertIsNotNone(_dated_latest.turtle_blob.packed_tripledict)
+        self.assertEqual(_dated_latest.as_rdf_tripledict(), {
+            BLARG.b: {DCTERMS.created: {rdf.literal(datetime.date(2021, 10, 18))}},
+        })
+
+    def test_packed_without_empties(self):
+        _tripledict = {
+            BLARG.a: {DCTERMS.title: {rdf.literal('aaaa')}, DCTERMS.description: set()},
+            BLARG.b: {},
+            BLARG.c: {DCTERMS.title: set()},
+        }
+        _card = create_indexcard(BLARG.a)
+        _card.update_resource_description(BLARG.a, _tripledict)  # (not via factories, which drop empties)
+        _latest = trove_db.LatestResourceDescription.objects.get(indexcard=_card)
+        self.assertIsNotNone(_latest.turtle_blob.packed_tripledict)
+        self.assertEqual(_latest.as_rdf_tripledict(), rdf.tripledict_from_turtle(_latest.rdf_as_turtle))
+        self.assertEqual(_latest.as_rdf_tripledict(), {BLARG.a: {DCTERMS.title: {rdf.literal('aaaa')}}})
+
+    def test_unreferenced(self):
+        _card = create_indexcard(BLARG.a, {DCTERMS.title: {rdf.literal('aaaa')}})
+        _blob = _card.latest_resource_description.turtle_blob
+        self.assertFalse(trove_db.TurtleBlob.objects.unreferenced().exists())
+        with self.assertRaises(ProtectedError):
+            _blob.delete()
+        _card.pls_delete(notify_indexes=False)  # deletes latest description, not archived
+        self.assertFalse(trove_db.TurtleBlob.objects.unreferenced().exists())
+        _card.archived_description_set.all().delete()
+        self.assertEqual(list(trove_db.TurtleBlob.objects.unreferenced()), [_blob])
+
+
+class TestDerivedTextBlob(TestCase):
+    def test_derived_text(self):
+        _card = create_indexcard(BLARG.a, {DCTERMS.title: {rdf.literal('aaaa')}}, deriver_iris=[_DERIVER_IRI])
+        _derived = _card.derived_indexcard_set.select_related('derived_blob').get()
+        self.assertEqual(_derived.derived_blob.checksum_iri, _derived.derived_checksum_iri)
+        self.assertIn('aaaa', _derived.derived_text)
+        self.assertEqual(zlib.decompress(_stored_bytes(_derived.derived_blob)).decode(), _derived.derived_text)
+        # decompressed also when selected by relation, if asked
+        self.assertEqual(
+            list(_card.derived_indexcard_set.values_list(decompressed(F('derived_blob__content')), flat=True)),
+            [_derived.derived_text],
+        )
+        # unchanged text, same blob
+        _other_card = create_indexcard(BLARG.a, {DCTERMS.title: {rdf.literal('aaaa')}}, deriver_iris=[_DERIVER_IRI])
+        self.assertEqual(
+            _other_card.derived_indexcard_set.get().derived_blob_id,
+            _derived.derived_blob_id,
+        )
+        self.assertEqual(trove_db.DerivedTextBlob.objects.count(), 1)
+
+    def test_delete_unreferenced(self):
+        _card = create_indexcard(BLARG.a, {DCTERMS.title: {rdf.literal('aaaa')}}, deriver_iris=[_DERIVER_IRI])
+        _other_card = create_indexcard(BLARG.b, {DCTERMS.title: {rdf.literal('bbbb')}}, deriver_iris=[_DERIVER_IRI])
+        _blob = _card.derived_indexcard_set.get().derived_blob
+        _card.derived_indexcard_set.all().delete()
+        _a_while_later = timezone.now() + datetime.timedelta(days=2)
+        # not yet old enough
+        digestive_tract.delete_unreferenced_blobs(referenced_before=_blob.last_referenced)
+        self.assertTrue(trove_db.DerivedTextBlob.objects.filter(pk=_blob.pk).exists())
+        digestive_tract.delete_unreferenced_blobs(referenced_before=_a_while_later)
+        self.assertFalse(trove_db.DerivedTextBlob.objects.filter(pk=_blob.pk).exists())
+        # still referenced, still there
+        self.assertEqual(
+            list(trove_db.DerivedTextBlob.objects.all()),
+            [_other_card.derived_indexcard_set.get().derived_blob],
+        )
+        self.assertEqual(trove_db.TurtleBlob.objects.count(), 2)
+
+    def test_reused_not_deleted(self):
+        _card = create_indexcard(BLARG.a, {DCTERMS.title: {rdf.literal('aaaa')}}, deriver_iris=[_DERIVER_IRI])
+        _blob = _card.derived_indexcard_set.get().derived_blob
+        _card.derived_indexcard_set.all().delete()
+        _long_ago = timezone.now() - datetime.timedelta(days=7)
+        trove_db.DerivedTextBlob.objects.filter(pk=_blob.pk).update(created=_long_ago, last_referenced=_long_ago)
+        # an old, unreferenced blob reused (about to be referenced again)
+        _reused = trove_db.DerivedTextBlob.objects.get_or_create_for_text(_blob.content)
+        self.assertEqual(_reused.pk, _blob.pk)
+        digestive_tract.delete_unreferenced_blobs(referenced_before=_long_ago + datetime.timedelta(days=1))
+        self.assertTrue(trove_db.DerivedTextBlob.objects.filter(pk=_blob.pk).exists())
@@ -0,0 +1,39 @@
+from django.test import TestCase
+from primitive_metadata import primitive_rdf as rdf
+
+from tests.trove.factories import create_indexcard, create_supplement
+from trove.models import resource_description
+from trove.vocab.namespaces import BLARG, DCTERMS, RDFS
+
+
+class TestSharedRdfdoc(TestCase):
+    def setUp(self):
+        super().setUp()
+        resource_description._PARSED_TRIPLEDICT_MEMO.clear()
+        self.addCleanup(resource_description._PARSED_TRIPLEDICT_MEMO.clear)
+
+    def test_shared_rdfdoc(self):
+        _card = create_indexcard(BLARG.a, {DCTERMS.title: {rdf.literal('aaaa')}})
+        create_supplement(_card, BLARG.a, {RDFS.comment: {rdf.literal('hello')}})
+        _description = _card.latest_resource_description
+        _shared = _description.as_shared_rdfdoc_with_supplements()
+        self.assertEqual(_shared.tripledict, _description.as_rdfdoc_with_supplements().tripledict)
+        # parsed once, the same (frozen) tripledict shared
+        self.assertIs(_description.as_shared_rdfdoc_with_supplements().tripledict, _shared.tripledict)
+
+    def test_shared_rdfdoc_frozen(self):
+        _card = create_indexcard(BLARG.a, {DCTERMS.title: {rdf.literal('aaaa')}})
+        _shared = _card.latest_resource_description.as_shared_rdfdoc_with_supplements()
+        with self.assertRaises(TypeError):
+            _shared.tripledict[BLARG.b] = {}
+        with self.assertRaises(TypeError):
+            _shared.tripledict[BLARG.a][DCTERMS.description] = set()
+        with self.assertRaises(AttributeError):
+            _shared.tripledict[BLARG.a][DCTERMS.title].add(rdf.literal('bbbb'))
+        with self.assertRaises(AttributeError):
+            _shared.add((BLARG.a, DCTERMS.title, rdf.literal('bbbb')))
+        # unchanged for the next caller
+        self.assertEqual(
+            _card.latest_resource_description.as_shared_rdfdoc_with_supplements().tripledict[BLARG.a][DCTERMS.title],
+            {rdf.literal('aaaa')},
+        )
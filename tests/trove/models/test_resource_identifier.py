@@ -1,5 +1,8 @@
-from django.db import IntegrityError
-from django.test import TestCase
+import threading
+
+from django.core.management.sql import emit_post_migrate_signal
+from django.db import IntegrityError, connection, transaction
+from django.test import TestCase, TransactionTestCase
 
 from trove.models import ResourceIdentifier
 from trove.vocab.namespaces import OWL
@@ -60,6 +63,85 @@ class TestResourceIdentifier(TestCase):
         with self.assertRaises(ResourceIdentifier.DoesNotExist):
             ResourceIdentifier.objects.get_for_iri('wa:ba:pow')
 
+    def test_get_or_create_for_iris(self):
+        _iris = [
+            'bar://wibbleplop.example/la',
+            'foo://wibbleplop.example/la',
+            'http://wibbleplop.example/la',
+            'ha:ba:pow',
+            'https://new.example/la',
+            'http://new.example/la',
+            'new:ba:pow',
+        ]
+        with self.assertNumQueries(1):
+            _identifiers_by_iri = ResourceIdentifier.objects.get_or_create_for_iris(_iris)
+        self.assertEqual(set(_identifiers_by_iri.keys()), set(_iris))
+        _identifier_foo = _identifiers_by_iri['bar://wibbleplop.example/la']
+        self.assertEqual(_identifier_foo.id, self.identifier_foo.id)
+        self.assertIs(_identifiers_by_iri['foo://wibbleplop.example/la'], _identifier_foo)
+        self.assertIs(_identifiers_by_iri['http://wibbleplop.example/la'], _identifier_foo)
+        self.assertEqual(_identifier_foo.scheme_list, ['foo', 'bla', 'bar', 'http'])
+        self.assertEqual(_identifier_foo.raw_iri_list, [
+            'bar://wibbleplop.example/la',
+            'foo://wibbleplop.example/la',
+            'http://wibbleplop.example/la',
+        ])
+        _identifier_ha = _identifiers_by_iri['ha:ba:pow']
+        self.assertEqual(_identifier_ha.id, self.identifier_ha.id)
+        self.assertEqual(_identifier_ha.scheme_list, ['ha'])
+        _identifier_new = _identifiers_by_iri['https://new.example/la']
+        self.assertIs(_identifiers_by_iri['http://new.example/la'], _identifier_new)
+        self.assertEqual(_identifier_new.sufficiently_unique_iri, '://new.example/la')
+        self.assertEqual(_identifier_new.scheme_list, ['https', 'http'])
+        self.assertEqual(_identifier_new.raw_iri_list, ['https://new.example/la', 'http://new.example/la'])
+        self.assertEqual(_identifiers_by_iri['new:ba:pow'].scheme_list, ['new'])
+        # again, with nothing new
+        with self.assertNumQueries(1):
+            _identifiers_by_iri_again = ResourceIdentifier.objects.get_or_create_for_iris(_iris)
+        self.assertEqual(
+            {_iri: _ident.id for _iri, _ident in _identifiers_by_iri_again.items()},
+            {_iri: _ident.id for _iri, _ident in _identifiers_by_iri.items()},
+        )
+        _identifier_foo.refresh_from_db()
+        self.assertEqual(_identifier_foo.scheme_list, ['foo', 'bla', 'bar', 'http'])
+
+    def test_cached_id_for_iri(self):
+        self.addCleanup(ResourceIdentifier.objects.forget_cached_ids)
+        with self.captureOnCommitCallbacks(execute=True):
+            _foo_id = ResourceIdentifier.objects.cached_id_for_iri('foo://wibbleplop.example/la')
+            self.assertIsNone(ResourceIdentifier.objects.cached_id_for_iri('https://new.example/la'))
+        self.assertEqual(_foo_id, self.identifier_foo.id)
+        self.assertFalse(ResourceIdentifier.objects.queryset_for_iri('https://new.example/la').exists())  # read-only
+        with self.assertNumQueries(0):
+            self.assertEqual(ResourceIdentifier.objects.cached_id_for_iri('foo://wibbleplop.example/la'), _foo_id)
+        with self.assertNumQueries(1):  # misses not cached
+            self.assertIsNone(ResourceIdentifier.objects.cached_id_for_iri('https://new.example/la'))
+
+    def test_get_or_create_cached_id_for_iri(self):
+        self.addCleanup(ResourceIdentifier.objects.forget_cached_ids)
+        with self.captureOnCommitCallbacks(execute=True):
+            _foo_id = ResourceIdentifier.objects.get_or_create_cached_id_for_iri('foo://wibbleplop.example/la')
+            _new_id = ResourceIdentifier.objects.get_or_create_cached_id_for_iri('https://new.example/la')
+        self.assertEqual(_foo_id, self.identifier_foo.id)
+        self.assertEqual(_new_id, ResourceIdentifier.objects.get_for_iri('https://new.example/la').id)
+        with self.assertNumQueries(0):
+            self.assertEqual(ResourceIdentifier.objects.get_or_create_cached_id_for_iri('foo://wibbleplop.example/la'), _foo_id)
+            self.assertEqual(ResourceIdentifier.objects.cached_id_for_iri('https://new.example/la'), _new_id)
+        ResourceIdentifier.objects.filter(id=_new_id).get().delete()
+        with self.assertNumQueries(1):  # forgotten on delete
+            self.assertEqual(ResourceIdentifier.objects.get_or_create_cached_id_for_iri('foo://wibbleplop.example/la'), _foo_id)
+
+    def test_cached_ids_forgotten_on_flush(self):
+        self.addCleanup(ResourceIdentifier.objects.forget_cached_ids)
+        with self.captureOnCommitCallbacks(execute=True):
+            _foo_id = ResourceIdentifier.objects.cached_id_for_iri('foo://wibbleplop.example/la')
+        with self.assertNumQueries(0):
+            self.assertEqual(ResourceIdentifier.objects.cached_id_for_iri('foo://wibbleplop.example/la'), _foo_id)
+        # as sent by `flush` (after truncating, which sends no post_delete)
+        emit_post_migrate_signal(verbosity=0, interactive=False, db=connection.alias)
+        with self.assertNumQueries(1):
+            self.assertEqual(ResourceIdentifier.objects.cached_id_for_iri('foo://wibbleplop.example/la'), _foo_id)
+
     def test_check_a(self):
         with self.assertRaises(IntegrityError):
             ResourceIdentifier.objects.create(
@@ -131,3 +213,29 @@ class TestResourceIdentifier(TestCase):
         ]
         for _expected_equivalent, _tripledict in _cases_with_authority:
             self.assertEqual(self.identifier_foo.find_equivalent_iri(_tripledict), _expected_equivalent)
+
+
+class TestConcurrentGetOrCreate(TransactionTestCase):
+    def test_inserted_concurrently(self):
+        _iri = 'https://concurrent.example/la'
+        _inserted = threading.Event()
+        _go_commit = threading.Event()
+        _concurrent_ids = []
+
+        def _insert_elsewhere():  # on another db connection
+            try:
+                with transaction.atomic():
+                    _concurrent_ids.append(ResourceIdentifier.objects.get_or_create_for_iris([_iri])[_iri].id)
+                    _inserted.set()
+                    _go_commit.wait(timeout=10)
+            finally:
+                connection.close()
+
+        _thread = threading.Thread(target=_insert_elsewhere)
+        _thread.start()
+        self.assertTrue(_inserted.wait(timeout=10))
+        # commit once this upsert is waiting on the conflicting (uncommitted) row
+        threading.Timer(0.5, _go_commit.set).start()
+        _identifiers_by_iri = ResourceIdentifier.objects.get_or_create_for_iris([_iri])
+        _thread.join()
+        self.assertEqual(_identifiers_by_iri[_iri].id, _concurrent_ids[0])
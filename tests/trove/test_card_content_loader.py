@@ -0,0 +1,66 @@
+from django.test import TestCase
+from primitive_metadata import primitive_rdf as rdf
+
+from tests.trove.factories import create_indexcard
+from trove.card_content_loader import CardContentLoader
+from trove.vocab.namespaces import BLARG, DCTERMS, FOAF, TROVE
+
+
+_DERIVER_IRI = TROVE['derive/osfmap_json']
+
+
+class TestCardContentLoader(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.card_a = create_indexcard(BLARG.a, {DCTERMS.title: {rdf.literal('aaaa')}}, deriver_iris=[_DERIVER_IRI])
+        cls.card_b = create_indexcard(BLARG.b, {DCTERMS.title: {rdf.literal('bbbb')}}, deriver_iris=[_DERIVER_IRI])
+        cls.card_c = create_indexcard(BLARG.c, {DCTERMS.title: {rdf.literal('cccc')}})  # no derived content
+
+    def setUp(self):
+        super().setUp()
+        self.loader = CardContentLoader()
+
+    def test_load_extracted(self):
+        _card_iris = [self.card_a.get_iri(), self.card_c.get_iri()]
+        with self.assertNumQueries(1):  # focus identifiers included
+            _loaded = self.loader.load_by_card_iris(_card_iris, deriver_iri=None)
+            self.assertEqual(set(_loaded.keys()), set(_card_iris))
+            _loaded_a = _loaded[self.card_a.get_iri()]
+            self.assertEqual(_loaded_a.focus_iris(), [BLARG.a])
+            self.assertEqual(_loaded_a.indexcard, self.card_a)
+        self.assertNotIn('content', _loaded_a.__dict__)  # (built when first used)
+        self.assertIsInstance(_loaded_a.content, rdf.QuotedGraph)
+        self.assertEqual(_loaded_a.content.focus_iri, BLARG.a)
+        self.assertEqual(
+            set(_loaded_a.content.tripledict[BLARG.a][FOAF.isPrimaryTopicOf]),
+            {self.card_a.get_iri()},
+        )
+
+    def test_load_derived(self):
+        _card_iris = [self.card_a.get_iri(), self.card_b.get_iri(), self.card_c.get_iri()]
+        with self.assertNumQueries(1):
+            _loaded = self.loader.load_by_card_iris(_card_iris, deriver_iri=_DERIVER_IRI)
+        self.assertEqual(set(_loaded.keys()), {self.card_a.get_iri(), self.card_b.get_iri()})
+        _content_b = _loaded[self.card_b.get_iri()].content
+        self.assertIsInstance(_content_b, rdf.Literal)
+        self.assertIn('bbbb', _content_b.unicode_value)
+
+    def test_memoized(self):
+        self.loader.load_by_card_iris([self.card_a.get_iri()], deriver_iri=_DERIVER_IRI)
+        with self.assertNumQueries(0):
+            _loaded = self.loader.load_by_card_iris([self.card_a.get_iri()], deriver_iri=_DERIVER_IRI)
+        self.assertEqual(set(_loaded.keys()), {self.card_a.get_iri()})
+        with self.assertNumQueries(1):  # only the card not yet loaded
+            self.loader.load_by_card_iris([self.card_a.get_iri(), self.card_b.get_iri()], deriver_iri=_DERIVER_IRI)
+        with self.assertNumQueries(1):  # memoized by card uuid *and* deriver iri
+            self.loader.load_by_card_iris([self.card_a.get_iri()], deriver_iri=None)
+
+    def test_load_by_focus_iris(self):
+        _first = self.loader.load_by_card_iris([self.card_a.get_iri()], deriver_iri=None)
+        with self.assertNumQueries(1):
+            _loaded = self.loader.load_by_focus_iris([BLARG.a, BLARG.b, BLARG.nothing], deriver_iri=None)
+        self.assertEqual(set(_loaded.keys()), {self.card_a.get_iri(), self.card_b.get_iri()})
+        # already-loaded cards are reused, not loaded again
+        self.assertIs(_loaded[self.card_a.get_iri()], _first[self.card_a.get_iri()])
+        with self.assertNumQueries(0):
+            self.loader.load_by_card_iris([self.card_b.get_iri()], deriver_iri=None)
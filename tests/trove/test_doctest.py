@@ -4,6 +4,7 @@ import trove.util.chainmap
 import trove.util.frozen
 import trove.util.iris
 import trove.util.iter
+import trove.util.packed_rdf
 import trove.util.propertypath
 import trove.vocab.mediatypes
 
@@ -17,6 +18,7 @@ _MODULES_WITH_DOCTESTS = (
     trove.util.frozen,
     trove.util.iris,
     trove.util.iter,
+    trove.util.packed_rdf,
     trove.util.propertypath,
     trove.vocab.mediatypes,
 )
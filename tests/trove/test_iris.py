@@ -0,0 +1,68 @@
+import random
+import re
+import urllib.parse as _urp
+
+import pytest
+
+from trove import exceptions as trove_exceptions
+from trove.util import iris
+
+
+# pieces of iris, valid and not
+_SCHEMES = ('', 'http', 'https', 'HTTPS', 'flipl', 'git+ssh', 'urn', 'namly', '9bad', '_')
+_SEPARATORS = ('://', ':', ':/', '', '/', '%3A//')
+_AUTHORITIES = ('', 'iri.example', 'Iri.Example:8080', 'user@iri.example', 'doi.org')
+_PATHS = ('', '/', '/blarg', '/blarg/', '/blarg//', '/blarg/blerg/', '/a%20b/', '/10.123/ABC')
+_QUERIES = ('', '?', '?a=b', '?a=b&c=', '?/')
+_FRAGMENTS = ('', '#', '#frag', '#/x/')
+
+
+def _baseline_suffuniq_iri_and_scheme(iri: str) -> tuple[str, str]:
+    # frozen copy of `iris.get_sufficiently_unique_iri_and_scheme` from before it was
+    # memoized (the behavior to keep)
+    _scheme_match = re.compile(r'[a-z][a-z0-9+-.]*', flags=re.IGNORECASE).match(iri)
+    if _scheme_match:
+        _scheme = _scheme_match.group().lower()
+        _remainder = iri[_scheme_match.end():]
+        if not _remainder.startswith(':'):
+            raise trove_exceptions.IriInvalid(f'does not look like an iri (got "{iri}")')
+        if not _remainder.startswith('://'):
+            return (iri, _scheme)
+    else:
+        if not iri.startswith('://'):
+            raise trove_exceptions.IriInvalid(f'does not look like an iri (got "{iri}")')
+        _scheme = ''
+        _remainder = iri
+    _split_remainder = _urp.urlsplit(_remainder)
+    _cleaned_remainder = _urp.urlunsplit((
+        '',
+        _split_remainder.netloc,
+        _split_remainder.path.rstrip('/'),
+        _split_remainder.query,
+        _split_remainder.fragment,
+    ))
+    return (_cleaned_remainder, _scheme)
+
+
+def _random_iri(rng: random.Random) -> str:
+    return ''.join(
+        rng.choice(_pieces)
+        for _pieces in (_SCHEMES, _SEPARATORS, _AUTHORITIES, _PATHS, _QUERIES, _FRAGMENTS)
+    )
+
+
+def _outcome(fn, iri):
+    try:
+        return fn(iri)
+    except trove_exceptions.IriInvalid:
+        return trove_exceptions.IriInvalid
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_suffuniq_same_as_baseline(seed):
+    _rng = random.Random(seed)
+    for _iri in (_random_iri(_rng) for _ in range(1000)):
+        _expected = _outcome(_baseline_suffuniq_iri_and_scheme, _iri)
+        assert _outcome(iris.get_sufficiently_unique_iri_and_scheme, _iri) == _expected, _iri
+        # again, from the cache
+        assert _outcome(iris.get_sufficiently_unique_iri_and_scheme, _iri) == _expected, _iri
@@ -0,0 +1,71 @@
+import datetime
+
+import pytest
+from primitive_metadata import primitive_rdf as rdf
+
+from trove.util.packed_rdf import pack_tripledict, unpack_tripledict
+from trove.vocab.namespaces import DCTERMS, FOAF, OSFMAP, OWL, PROV, RDF, DCAT
+from tests.trove.derive._inputs import DERIVER_TEST_DOCS
+
+
+def _large_project_tripledict(contributor_count=300, file_count=500) -> rdf.RdfTripleDictionary:
+    _project = 'https://osf.example/lrgpj'
+    _contributors = [f'https://osf.example/user{_i}' for _i in range(contributor_count)]
+    _files = [f'https://osf.example/file{_i}' for _i in range(file_count)]
+    _tripledict: rdf.RdfTripleDictionary = {
+        _project: {
+            RDF.type: {OSFMAP.Project},
+            DCTERMS.title: {rdf.literal('a large project', language='en')},
+            DCTERMS.created: {rdf.literal(datetime.date(2021, 10, 18))},
+            DCTERMS.creator: set(_contributors),
+            OSFMAP.contains: set(_files),
+            PROV.qualifiedAttribution: {
+                rdf.blanknode({
+                    DCAT.hadRole: {OSFMAP['admin-contributor']},
+                    PROV.agent: {_contributor},
+                })
+                for _contributor in _contributors
+            },
+        },
+    }
+    for _i, _contributor in enumerate(_contributors):
+        _tripledict[_contributor] = {
+            RDF.type: {DCTERMS.Agent, FOAF.Person},
+            FOAF.name: {rdf.literal(f'person {_i}')},
+            OWL.sameAs: {f'https://orcid.example/0000-0000-0000-{_i:04}'},
+        }
+    for _i, _file in enumerate(_files):
+        _tripledict[_file] = {
+            RDF.type: {OSFMAP.File},
+            OSFMAP.fileName: {rdf.literal(f'file_{_i}.txt')},
+            OSFMAP.isContainedBy: {_project},
+        }
+    return _tripledict
+
+
+_TURTLE_BY_NAME = {
+    **{
+        _name: rdf.turtle_from_tripledict(_doc.tripledict, focus=_doc.focus_iri)
+        for _name, _doc in DERIVER_TEST_DOCS.items()
+    },
+    'large-project': rdf.turtle_from_tripledict(_large_project_tripledict()),
+}
+
+
+@pytest.mark.parametrize('name', _TURTLE_BY_NAME.keys())
+def test_roundtrip(name):
+    _tripledict = rdf.tripledict_from_turtle(_TURTLE_BY_NAME[name])
+    assert unpack_tripledict(pack_tripledict(_tripledict)) == _tripledict
+
+
+class TestPackedRdfBenchmark:
+    # run with `pytest -o addopts='' -k Benchmark tests/trove/test_packed_rdf.py`
+
+    @pytest.mark.parametrize('name', ['osfmap-registration', 'large-project'])
+    def test_parse_turtle(self, benchmark, name):
+        benchmark(rdf.tripledict_from_turtle, _TURTLE_BY_NAME[name])
+
+    @pytest.mark.parametrize('name', ['osfmap-registration', 'large-project'])
+    def test_unpack(self, benchmark, name):
+        _packed = pack_tripledict(rdf.tripledict_from_turtle(_TURTLE_BY_NAME[name]))
+        benchmark(unpack_tripledict, _packed)
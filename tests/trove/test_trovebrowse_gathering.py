@@ -0,0 +1,31 @@
+from django.test import TestCase
+from primitive_metadata import gather
+from primitive_metadata import primitive_rdf as rdf
+
+from tests.trove.factories import create_indexcard
+from trove.trovebrowse_gathering import gather_cards_focused_on
+from trove.vocab.namespaces import BLARG, DCTERMS, FOAF, RDF, TROVE
+
+
+class TestGatherCardsFocusedOn(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.card = create_indexcard(BLARG.a, {DCTERMS.title: {rdf.literal('aaaa')}})
+
+    def test_unblended(self):
+        _card_iri = self.card.get_iri()
+        _gathered = list(gather_cards_focused_on(gather.Focus.new(BLARG.a), blend_cards=False))
+        (_topic_triple, _type_triple, (_subj, _pred, _quoted_graph)) = _gathered
+        self.assertEqual(_topic_triple, (BLARG.a, FOAF.isPrimaryTopicOf, _card_iri))
+        self.assertEqual(_type_triple, (_card_iri, RDF.type, TROVE.Indexcard))
+        self.assertEqual((_subj, _pred), (_card_iri, TROVE.resourceMetadata))
+        # the quoted description is just as described (no added card link)
+        self.assertEqual(_quoted_graph.focus_iri, BLARG.a)
+        self.assertEqual(_quoted_graph.tripledict, {
+            BLARG.a: {DCTERMS.title: {rdf.literal('aaaa')}},
+        })
+
+    def test_blended(self):
+        _gathered = set(gather_cards_focused_on(gather.Focus.new(BLARG.a), blend_cards=True))
+        self.assertIn((BLARG.a, DCTERMS.title, rdf.literal('aaaa')), _gathered)
+        self.assertIn((BLARG.a, FOAF.isPrimaryTopicOf, self.card.get_iri()), _gathered)
@@ -2,9 +2,13 @@ from unittest import TestCase
 
 
 from trove.trovesearch.page_cursor import (
+    MANY_MORE,
+    MAX_PAGE_SIZE,
     PageCursor,
     OffsetCursor,
     ReproduciblyRandomSampleCursor,
+    SearchAfterCursor,
+    FirstPageThenSearchAfterCursor,
 )
 
 
@@ -16,6 +20,11 @@ class TestPageCursor(TestCase):
             OffsetCursor(page_size=11, start_offset=22),
             ReproduciblyRandomSampleCursor(page_size=13),
             ReproduciblyRandomSampleCursor(page_size=3, first_page_ids=['a', 'b', 'c']),
+            SearchAfterCursor(page_size=5),
+            SearchAfterCursor(page_size=5, search_after=['1999-12-31', 7], pit_id='pit-id'),
+            SearchAfterCursor(page_size=5, search_before=[7], prev_search_before=[3], pit_id='pit-id', start_offset=10),
+            SearchAfterCursor(page_size=MANY_MORE, search_after=[7], pit_id='pit-id', start_offset=101),
+            FirstPageThenSearchAfterCursor(page_size=5, search_after=['e'], start_offset=10, first_page_bound=[7, 'b']),
         ):
             _qp_value = _original_cursor.as_queryparam_value()
             self.assertIsInstance(_qp_value, str)
@@ -23,3 +32,72 @@ class TestPageCursor(TestCase):
             _cursor_from_qp = PageCursor.from_queryparam_value(_qp_value)
             self.assertIsInstance(_cursor_from_qp, type(_original_cursor))
             self.assertEqual(_cursor_from_qp, _original_cursor)
+
+    def test_search_after_cursor(self):
+        _first = SearchAfterCursor(page_size=5, next_search_after=['1999-12-31', 7], pit_id='pit-id')
+        self.assertTrue(_first.is_first_page())
+        self.assertIsNone(_first.prev_cursor())
+        _second = _first.next_cursor()
+        self.assertIsNotNone(_second)
+        self.assertFalse(_second.is_first_page())
+        self.assertEqual(_second.search_after, ['1999-12-31', 7])
+        self.assertEqual(_second.pit_id, 'pit-id')
+        self.assertIsNone(_second.next_cursor())  # last page (no next_search_after)
+        self.assertEqual(_second.first_cursor(), SearchAfterCursor(page_size=5))
+
+    def test_search_after_cursor_prev(self):
+        _third = SearchAfterCursor(page_size=5, search_after=[9], pit_id='pit-id', start_offset=10)
+        self.assertIsNone(_third.prev_cursor())  # not yet searched
+        _third.prev_search_before = [7]
+        _second = _third.prev_cursor()
+        self.assertFalse(_second.is_first_page())
+        self.assertTrue(_second.is_paging_back())
+        self.assertEqual(_second.search_before, [7])
+        self.assertIsNone(_second.search_after)
+        self.assertEqual(_second.start_offset, 5)
+        self.assertEqual(_second.pit_id, 'pit-id')
+        # back to the first page
+        _second.prev_search_before = [3]
+        self.assertEqual(_second.prev_cursor(), SearchAfterCursor(page_size=5))
+        # and forward again
+        _second.next_search_after = [6]
+        _third_again = _second.next_cursor()
+        self.assertFalse(_third_again.is_paging_back())
+        self.assertEqual(_third_again.search_after, [6])
+        self.assertEqual(_third_again.start_offset, 10)
+
+    def test_search_after_cursor_streaming(self):
+        _first = SearchAfterCursor(page_size=150, next_search_after=[7])
+        self.assertFalse(_first.is_complete_page)
+        self.assertEqual(_first.bounded_page_size, MAX_PAGE_SIZE)
+        _second = _first.next_cursor()
+        self.assertEqual(_second.start_offset, MAX_PAGE_SIZE)
+        self.assertEqual(_second.bounded_page_size, 150 - MAX_PAGE_SIZE)
+        _second.next_search_after = [17]
+        self.assertIsNone(_second.next_cursor())  # got all 150
+        # unbounded: keep streaming until there's no next page
+        _all = SearchAfterCursor(page_size=MANY_MORE, next_search_after=[7], start_offset=10 ** 6)
+        self.assertEqual(_all.bounded_page_size, MAX_PAGE_SIZE)
+        self.assertIsNotNone(_all.next_cursor())
+
+    def test_first_page_then_search_after_cursor(self):
+        _first = FirstPageThenSearchAfterCursor(page_size=2, first_page_bound=[7, 'a'], next_search_after=[])
+        self.assertTrue(_first.is_first_page())
+        self.assertIsNone(_first.prev_cursor())
+        _second = _first.next_cursor()
+        self.assertFalse(_second.is_first_page())
+        self.assertEqual(_second.search_after, [])  # from the start of the rest
+        self.assertEqual(_second.first_page_bound, [7, 'a'])
+        _second.next_search_after = ['d']
+        _second.prev_search_before = ['b']
+        self.assertEqual(_second.prev_cursor(), FirstPageThenSearchAfterCursor(page_size=2))
+        _third = _second.next_cursor()
+        self.assertEqual(_third.search_after, ['d'])
+        self.assertEqual(_third.first_page_bound, [7, 'a'])
+        self.assertEqual(_third.first_cursor(), FirstPageThenSearchAfterCursor(page_size=2))
+        _third.prev_search_before = ['e']
+        _back_to_second = _third.prev_cursor()
+        self.assertTrue(_back_to_second.is_paging_back())
+        self.assertEqual(_back_to_second.search_before, ['e'])
+        self.assertEqual(_back_to_second.start_offset, 2)
+        self.assertEqual(_back_to_second.first_page_bound, [7, 'a'])
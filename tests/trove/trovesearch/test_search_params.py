@@ -2,7 +2,10 @@ import urllib
 
 from django.test import SimpleTestCase
 
+from trove import exceptions as trove_exceptions
+from trove.trovesearch.page_cursor import MANY_MORE
 from trove.trovesearch.search_params import (
+    CardsearchParams,
     SearchText,
     SearchFilter, DEFAULT_PROPERTYPATH_SET,
 )
@@ -117,3 +120,20 @@ class TestSearchFilterPath(SimpleTestCase):
                 _paramvalue,
             )
             self.assertEqual(_expectedfilter, _actualfilter)
+
+
+class TestCardsearchPageSize(SimpleTestCase):
+    def test_page_size(self):
+        _params = CardsearchParams.from_querystring('page[size]=7')
+        self.assertEqual(_params.page_cursor.page_size, 7)
+        self.assertEqual(_params.to_querydict()['page[size]'], '7')
+        with self.assertRaises(trove_exceptions.InvalidQueryParamValue):
+            CardsearchParams.from_querystring('page[size]=seven')
+
+    def test_export_page_size(self):
+        _params = CardsearchParams.from_querystring('page[size]=all&withFileName=foo')
+        self.assertEqual(_params.page_cursor.page_size, MANY_MORE)
+        self.assertTrue(_params.page_cursor.has_unbounded_page_size())
+        self.assertEqual(_params.to_querydict()['page[size]'], 'all')
+        with self.assertRaises(trove_exceptions.InvalidQueryParamValue):
+            CardsearchParams.from_querystring('page[size]=all')  # only for downloads
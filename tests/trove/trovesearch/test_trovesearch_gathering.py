@@ -0,0 +1,52 @@
+from unittest import mock
+
+from django.test import TestCase
+from primitive_metadata import primitive_rdf as rdf
+
+from tests.trove.factories import create_indexcard
+from trove.trovesearch.page_cursor import MANY_MORE, OffsetCursor
+from trove.trovesearch.search_handle import CardsearchHandle, CardsearchResult
+from trove.trovesearch.search_params import CardsearchParams
+from trove.trovesearch.trovesearch_gathering import CardsearchFocus, gather_cardsearch_page
+from trove.vocab.namespaces import BLARG, DCTERMS, TROVE
+
+
+_DERIVER_IRI = TROVE['derive/osfmap_json']
+
+
+class TestGatherCardsearchPage(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.cards = [
+            create_indexcard(BLARG[f'i{_i}'], {DCTERMS.title: {rdf.literal(f'i{_i}')}}, deriver_iris=[_DERIVER_IRI])
+            for _i in range(6)
+        ]
+
+    def _streaming_handle(self, start_offset: int = 0) -> CardsearchHandle:
+        _cursor = OffsetCursor(page_size=MANY_MORE, total_count=len(self.cards), start_offset=start_offset)
+        return CardsearchHandle(
+            cursor=_cursor,
+            search_params=CardsearchParams.from_querystring(''),
+            search_result_page=[
+                CardsearchResult(text_match_evidence=[], card_iri=_card.get_iri())
+                for _card in self.cards[start_offset:(start_offset + _cursor.bounded_page_size)]
+            ],
+            handler=lambda _params: self._streaming_handle(_params.page_cursor.start_offset),
+        )
+
+    @mock.patch('trove.trovesearch.page_cursor.MAX_PAGE_SIZE', 2)
+    def test_one_query_per_page(self):
+        _handle = self._streaming_handle()
+        _focus = CardsearchFocus.new(
+            iris=BLARG.search,
+            search_params=_handle.search_params,
+            search_handle=_handle,
+        )
+        _pages = []
+        with self.assertNumQueries(3):  # one per page of two, no more
+            for (_subj, _pred, _obj) in gather_cardsearch_page(_focus, deriver_iri=_DERIVER_IRI, blend_cards=False):
+                if (_subj, _pred) == (BLARG.search, TROVE.searchResultPage):
+                    _pages.append(list(rdf.container_objects(_obj)))
+        self.assertEqual([len(_page) for _page in _pages], [2, 2, 2])
+        # the focus's own loader holds only the first page (each streamed page gets its own)
+        self.assertEqual(len(_focus.card_loader._loaded), 2)
@@ -1,5 +1,6 @@
 import datetime
 from http import HTTPStatus
+import json
 from unittest import mock
 from urllib.parse import urlencode
 
@@ -8,6 +9,7 @@ from django.test import TestCase
 from share.models.feature_flag import FeatureFlag
 from tests import factories
 from tests._testutil import patch_feature_flag
+from trove.digestive_tract import RecordToIngest
 
 
 class TestIngest(TestCase):
@@ -190,3 +192,61 @@ class TestIngest(TestCase):
             )
         self.assertEqual(_resp.status_code, HTTPStatus.BAD_REQUEST)
         self.assertFalse(_mock_tract.ingest.called)
+
+    def test_post_batch(self):
+        _ndjson = '\n'.join((
+            json.dumps({
+                'focus_iri': 'https://foo.example/blarg',
+                'record_identifier': 'blarg',
+                'raw_record': 'turtleturtleturtle',
+            }),
+            json.dumps({
+                'focus_iri': 'https://foo.example/blarg',
+                'record_identifier': 'blarg-supp',
+                'raw_record': 'turtleturtle',
+                'is_supplementary': True,
+                'expiration_date': '2055-05-05',
+            }),
+            '',
+        ))
+        with mock.patch('trove.views.ingest.digestive_tract') as _mock_tract:
+            _resp = self.client.post(
+                '/trove/ingest?nonurgent',
+                content_type='application/x-ndjson',
+                data=_ndjson,
+                HTTP_AUTHORIZATION=self.user.authorization(),
+            )
+            self.assertEqual(_resp.status_code, HTTPStatus.CREATED)
+            _mock_tract.ingest.assert_not_called()
+            _mock_tract.ingest_batch.assert_called_once_with(
+                from_user=self.user,
+                records=[
+                    RecordToIngest(
+                        focus_iri='https://foo.example/blarg',
+                        record_identifier='blarg',
+                        record_mediatype='text/turtle',
+                        raw_record='turtleturtleturtle',
+                    ),
+                    RecordToIngest(
+                        focus_iri='https://foo.example/blarg',
+                        record_identifier='blarg-supp',
+                        record_mediatype='text/turtle',
+                        raw_record='turtleturtle',
+                        is_supplementary=True,
+                        expiration_date=datetime.date(2055, 5, 5),
+                    ),
+                ],
+                urgent=False,
+                restore_deleted=True,
+            )
+
+    def test_post_batch_invalid(self):
+        with mock.patch('trove.views.ingest.digestive_tract') as _mock_tract:
+            _resp = self.client.post(
+                '/trove/ingest',
+                content_type='application/x-ndjson',
+                data='{"focus_iri": "https://foo.example/blarg"}\n',
+                HTTP_AUTHORIZATION=self.user.authorization(),
+            )
+        self.assertEqual(_resp.status_code, HTTPStatus.BAD_REQUEST)
+        self.assertFalse(_mock_tract.ingest_batch.called)
@@ -6,6 +6,7 @@ from django.utils.html import format_html
 from share.admin import admin_site
 from share.admin.util import TimeLimitedPaginator, linked_fk, linked_many
 from share.search.index_messenger import IndexMessenger
+from trove import digestive_tract
 from trove.models import (
     ArchivedResourceDescription,
     DerivedIndexcard,
@@ -32,9 +33,9 @@ class ResourceIdentifierAdmin(admin.ModelAdmin):
 
 
 @admin.register(Indexcard, site=admin_site)
-@linked_many('archived_description_set', defer=('rdf_as_turtle',))
-@linked_many('supplementary_description_set', defer=('rdf_as_turtle',))
-@linked_many('derived_indexcard_set', defer=('derived_text',))
+@linked_many('archived_description_set')
+@linked_many('supplementary_description_set')
+@linked_many('derived_indexcard_set')
 @linked_fk('latest_resource_description')
 @linked_fk('source_record_suid')
 @linked_many('focustype_identifier_set')
@@ -53,6 +54,13 @@ class IndexcardAdmin(admin.ModelAdmin):
     list_select_related = ('source_record_suid',)
     list_filter = ('deleted', 'source_record_suid__source_config')
     actions = ('_freshen_index',)
+    change_list_template = 'admin/trove/indexcard/change_list.html'
+
+    def changelist_view(self, request: Any, extra_context: dict | None = None) -> Any:
+        return super().changelist_view(request, extra_context={
+            **(extra_context or {}),
+            'noop_ingest_count': digestive_tract.noop_ingest_count(),
+        })
 
     def _freshen_index(self, queryset: list[Indexcard]) -> None:
         IndexMessenger().notify_indexcard_update(queryset)
@@ -69,7 +77,7 @@ class LatestResourceDescriptionAdmin(admin.ModelAdmin):
         'focus_iri',
         'rdf_as_turtle__pre',
     )
-    exclude = ('rdf_as_turtle',)
+    exclude = ('turtle_blob',)
     paginator = TimeLimitedPaginator
     list_display = ('indexcard', 'created', 'modified')
     list_select_related = ('indexcard',)
@@ -90,7 +98,7 @@ class ArchivedResourceDescriptionAdmin(admin.ModelAdmin):
         'focus_iri',
         'rdf_as_turtle__pre',
     )
-    exclude = ('rdf_as_turtle',)
+    exclude = ('turtle_blob',)
     paginator = TimeLimitedPaginator
     list_display = ('id', 'indexcard', 'created', 'modified')
     list_select_related = ('indexcard',)
@@ -112,7 +120,7 @@ class SupplementaryResourceDescriptionAdmin(admin.ModelAdmin):
         'focus_iri',
         'rdf_as_turtle__pre',
     )
-    exclude = ('rdf_as_turtle',)
+    exclude = ('turtle_blob',)
     paginator = TimeLimitedPaginator
     list_display = ('id', 'indexcard', 'created', 'modified')
     list_select_related = ('indexcard',)
@@ -130,7 +138,10 @@ class DerivedIndexcardAdmin(admin.ModelAdmin):
     readonly_fields = (
         'created',
         'modified',
+        'derived_checksum_iri',
+        'derived_text',
     )
+    exclude = ('derived_blob',)
     paginator = TimeLimitedPaginator
     list_display = ('id', 'upriver_indexcard', 'deriver_identifier',)
     list_select_related = ('upriver_indexcard',)
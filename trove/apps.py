@@ -1,6 +1,11 @@
 from django.apps import AppConfig
+from django.core import checks
+from trove.checks import check_ingest_count_cache
 
 
 class TroveConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'trove'
+
+    def ready(self):
+        checks.register(check_ingest_count_cache)
@@ -0,0 +1,244 @@
+'''load index-card contents in bulk, remembering what's been loaded
+
+a "dataloader" for one request (or one streamed response): ask for many cards at once
+(by card iri or by focus iri) and get each card's content -- derived by the given
+deriver, or (with no deriver) its latest extracted rdf -- in a single query, focus
+identifiers included; cards already loaded (by card uuid and deriver iri) are not
+loaded again
+'''
+from __future__ import annotations
+from collections.abc import Iterable
+import dataclasses
+import functools
+
+from django.contrib.postgres.expressions import ArraySubquery
+from django.db.models import OuterRef, QuerySet
+from django.db.models.functions import JSONObject
+from primitive_metadata import primitive_rdf as rdf
+
+from trove import models as trove_db
+from trove.util.iris import get_sufficiently_unique_iri
+from trove.vocab.namespaces import FOAF
+from trove.vocab.trove import trove_indexcard_namespace
+
+
+__all__ = ('CardContentLoader', 'LoadedCard')
+
+
+@dataclasses.dataclass(frozen=True)
+class LoadedCard:
+    indexcard: trove_db.Indexcard
+    # focus identifiers (unsaved, with just enough for `as_iri` and `sufficiently_unique_iri`)
+    focus_identifiers: tuple[trove_db.ResourceIdentifier, ...]
+    # latest extracted description (only when loaded without deriver)
+    resource_description: trove_db.LatestResourceDescription | None = None
+    # derived content (only when loaded with a deriver)
+    derived_content: rdf.Literal | None = None
+
+    @property
+    def card_iri(self) -> str:
+        return self.indexcard.get_iri()
+
+    @functools.cached_property
+    def content(self) -> rdf.Literal | rdf.QuotedGraph:
+        '''the derived content or, without deriver, the latest description (linked to its card)
+
+        built when first used, not for every loaded card
+        '''
+        if self.resource_description is None:
+            assert self.derived_content is not None
+            return self.derived_content
+        _quoted_graph = self.resource_description.as_quoted_graph()
+        _quoted_graph.add(
+            (_quoted_graph.focus_iri, FOAF.isPrimaryTopicOf, self.card_iri),
+        )
+        return _quoted_graph
+
+    def focus_iris(self) -> list[str]:
+        return [_identifier.as_iri() for _identifier in self.focus_identifiers]
+
+
+class CardContentLoader:
+    '''bulk loader for index-card contents, memoized by (card uuid, deriver iri)
+
+    meant to live as long as a single request (or one page of a streamed response,
+    so memory stays bounded) -- not shared across requests, to avoid serving stale content
+    '''
+
+    def __init__(self) -> None:
+        self._loaded: dict[tuple[str, str | None], LoadedCard] = {}
+        # the same loaded cards, by (focus suffuniq iri, deriver iri) then card uuid
+        self._loaded_by_focus: dict[tuple[str, str | None], dict[str, LoadedCard]] = {}
+
+    def load_by_card_iris(
+        self,
+        card_iris: Iterable[str],
+        *,
+        deriver_iri: str | None,
+    ) -> dict[str, LoadedCard]:
+        '''get loaded cards by card iri (omitting any not found)'''
+        _card_namespace = trove_indexcard_namespace()
+        _card_uuids = {
+            rdf.iri_minus_namespace(_card_iri, namespace=_card_namespace)
+            for _card_iri in card_iris
+        }
+        _uuids_to_load = {
+            _uuid
+            for _uuid in _card_uuids
+            if (_uuid, deriver_iri) not in self._loaded
+        }
+        if _uuids_to_load:  # one query for all not yet loaded
+            self._load(deriver_iri, card_uuids=_uuids_to_load)
+        return self._by_card_iri(
+            self._loaded[_uuid, deriver_iri]
+            for _uuid in _card_uuids
+            if (_uuid, deriver_iri) in self._loaded
+        )
+
+    def load_by_focus_iris(
+        self,
+        focus_iris: Iterable[str],
+        *,
+        deriver_iri: str | None,
+    ) -> dict[str, LoadedCard]:
+        '''get loaded cards focused on any of the given iris, by card iri'''
+        _suffuniq_iris = {get_sufficiently_unique_iri(_iri) for _iri in focus_iris}
+        _already_loaded: dict[str, LoadedCard] = {}
+        for _suffuniq_iri in _suffuniq_iris:
+            _already_loaded.update(self._loaded_by_focus.get((_suffuniq_iri, deriver_iri), {}))
+        # one query for any others (excluding those already loaded)
+        _newly_loaded = self._load(
+            deriver_iri,
+            focus_suffuniq_iris=_suffuniq_iris,
+            exclude_uuids=_already_loaded.keys(),
+        )
+        return self._by_card_iri([*_already_loaded.values(), *_newly_loaded])
+
+    def _by_card_iri(self, loaded_cards: Iterable[LoadedCard]) -> dict[str, LoadedCard]:
+        return {
+            _loaded_card.card_iri: _loaded_card
+            for _loaded_card in loaded_cards
+        }
+
+    def _load(
+        self,
+        deriver_iri: str | None,
+        *,
+        card_uuids: Iterable[str] | None = None,
+        focus_suffuniq_iris: Iterable[str] | None = None,
+        exclude_uuids: Iterable[str] = (),
+    ) -> list[LoadedCard]:
+        _loaded_cards = (
+            self._load_extracted(card_uuids, focus_suffuniq_iris, exclude_uuids)
+            if deriver_iri is None
+            else self._load_derived(deriver_iri, card_uuids, focus_suffuniq_iris, exclude_uuids)
+        )
+        for _loaded_card in _loaded_cards:
+            _uuid = str(_loaded_card.indexcard.uuid)
+            self._loaded[_uuid, deriver_iri] = _loaded_card
+            for _identifier in _loaded_card.focus_identifiers:
+                _by_uuid = self._loaded_by_focus.setdefault((_identifier.sufficiently_unique_iri, deriver_iri), {})
+                _by_uuid[_uuid] = _loaded_card
+        return _loaded_cards
+
+    def _load_extracted(
+        self,
+        card_uuids: Iterable[str] | None,
+        focus_suffuniq_iris: Iterable[str] | None,
+        exclude_uuids: Iterable[str],
+    ) -> list[LoadedCard]:
+        _resource_description_qs = _filter_cards(
+            (
+                trove_db.LatestResourceDescription.objects
+                .select_related('indexcard', 'turtle_blob')
+                .defer('turtle_blob__content')  # (rdf read pre-parsed, when packed)
+                .annotate(focus_identifier_list=_focus_identifier_list('indexcard_id'))
+            ),
+            'indexcard',
+            card_uuids,
+            focus_suffuniq_iris,
+            exclude_uuids,
+        )
+        _loaded_cards = {}
+        for _resource_description in _resource_description_qs:
+            _card = _resource_description.indexcard
+            _loaded_cards[_card.pk] = LoadedCard(
+                indexcard=_card,
+                focus_identifiers=_focus_identifiers(_resource_description.focus_identifier_list),
+                resource_description=_resource_description,
+            )
+        return list(_loaded_cards.values())
+
+    def _load_derived(
+        self,
+        deriver_iri: str,
+        card_uuids: Iterable[str] | None,
+        focus_suffuniq_iris: Iterable[str] | None,
+        exclude_uuids: Iterable[str],
+    ) -> list[LoadedCard]:
+        # include pre-formatted data from a DerivedIndexcard
+        _derived_indexcard_qs = _filter_cards(
+            (
+                trove_db.DerivedIndexcard.objects
+                .filter(  # (on the deriver identifier already joined, for no extra query)
+                    deriver_identifier__sufficiently_unique_iri=get_sufficiently_unique_iri(deriver_iri),
+                )
+                .select_related('upriver_indexcard', 'deriver_identifier', 'derived_blob')
+                .annotate(focus_identifier_list=_focus_identifier_list('upriver_indexcard_id'))
+            ),
+            'upriver_indexcard',
+            card_uuids,
+            focus_suffuniq_iris,
+            exclude_uuids,
+        )
+        _loaded_cards = {}
+        for _derived in _derived_indexcard_qs:
+            _loaded_cards[_derived.upriver_indexcard_id] = LoadedCard(
+                indexcard=_derived.upriver_indexcard,
+                focus_identifiers=_focus_identifiers(_derived.focus_identifier_list),
+                derived_content=_derived.as_rdf_literal(),
+            )
+        return list(_loaded_cards.values())
+
+
+###
+# local helpers
+
+def _filter_cards(
+    queryset: QuerySet,
+    indexcard_field: str,
+    card_uuids: Iterable[str] | None,
+    focus_suffuniq_iris: Iterable[str] | None,
+    exclude_uuids: Iterable[str],
+) -> QuerySet:
+    if card_uuids is not None:
+        queryset = queryset.filter(**{f'{indexcard_field}__uuid__in': card_uuids})
+    if focus_suffuniq_iris is not None:
+        queryset = queryset.filter(**{
+            f'{indexcard_field}__focus_identifier_set__sufficiently_unique_iri__in': focus_suffuniq_iris,
+        })
+    if exclude_uuids:
+        queryset = queryset.exclude(**{f'{indexcard_field}__uuid__in': exclude_uuids})
+    return queryset
+
+
+def _focus_identifier_list(indexcard_id_field: str) -> ArraySubquery:
+    # a card's focus identifiers, in the same query (instead of a prefetch)
+    return ArraySubquery(
+        trove_db.ResourceIdentifier.objects
+        .filter(indexcard_set=OuterRef(indexcard_id_field))
+        .values(_json=JSONObject(
+            sufficiently_unique_iri='sufficiently_unique_iri',
+            scheme_list='scheme_list',
+        ))
+    )
+
+
+def _focus_identifiers(focus_identifier_list: list[dict]) -> tuple[trove_db.ResourceIdentifier, ...]:
+    return tuple(
+        trove_db.ResourceIdentifier(
+            sufficiently_unique_iri=_identifier['sufficiently_unique_iri'],
+            scheme_list=_identifier['scheme_list'],
+        )
+        for _identifier in focus_identifier_list
+    )
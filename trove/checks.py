@@ -0,0 +1,17 @@
+from django.core import checks
+
+
+def check_ingest_count_cache(app_configs, **kwargs):
+    from django.core.exceptions import ImproperlyConfigured
+    from trove.digestive_tract import get_ingest_count_cache
+    try:
+        get_ingest_count_cache()
+    except ImproperlyConfigured as exception:
+        return [
+            checks.Error(
+                'Ingest count cache is not a shared cache!',
+                hint=str(exception),
+                id='trove.E001',
+            )
+        ]
+    return []
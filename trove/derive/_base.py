@@ -10,10 +10,18 @@ class IndexcardDeriver(abc.ABC):
     focus_iri: str
     data: primitive_rdf.RdfGraph
 
-    def __init__(self, upstream_description: ResourceDescription):
+    def __init__(
+        self,
+        upstream_description: ResourceDescription,
+        rdfdoc: primitive_rdf.RdfGraph | None = None,  # parsed upstream_description, if already on hand
+    ):
         self.upstream_description = upstream_description
         self.focus_iri = upstream_description.focus_iri
-        self.data = upstream_description.as_rdfdoc_with_supplements()
+        self.data = (
+            upstream_description.as_rdfdoc_with_supplements()
+            if rdfdoc is None
+            else primitive_rdf.RdfGraph(rdfdoc.tripledict)  # own wrapper around shared rdf
+        )
 
     def q(self, pathset: Any) -> Any:
         # convenience for querying self.data on self.focus_iri
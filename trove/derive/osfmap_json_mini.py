@@ -5,6 +5,7 @@ from trove.vocab import namespaces as ns
 from trove.derive.osfmap_json import OsfmapJsonFullDeriver
 from trove.vocab.namespaces import TROVE
 if TYPE_CHECKING:
+    from primitive_metadata import primitive_rdf as rdf
     from trove.models.resource_description import ResourceDescription
 
 EXCLUDED_PREDICATE_SET = frozenset({
@@ -13,8 +14,12 @@ EXCLUDED_PREDICATE_SET = frozenset({
 
 
 class OsfmapJsonMiniDeriver(OsfmapJsonFullDeriver):
-    def __init__(self, upstream_description: ResourceDescription):
-        super().__init__(upstream_description)
+    def __init__(
+        self,
+        upstream_description: ResourceDescription,
+        rdfdoc: rdf.RdfGraph | None = None,
+    ):
+        super().__init__(upstream_description, rdfdoc)
         self.convert_tripledict()
 
     @staticmethod
@@ -6,20 +6,41 @@ sniff: set up identifiers about a record
 extract: gather rdf graph from a record; store as index card(s)
 derive: build other representations from latest card version(s)
 '''
-__all__ = ('sniff', 'extract', 'derive', 'expel', 'ingest')
+__all__ = (
+    'sniff',
+    'sniff_batch',
+    'extract',
+    'derive',
+    'derive_chunk',
+    'expel',
+    'ingest',
+    'ingest_batch',
+    'noop_ingest_count',
+    'get_ingest_count_cache',
+    'RecordToIngest',
+)
 
+from collections.abc import Sequence
 import copy
+import dataclasses
 import datetime
 import logging
 from typing import Iterable
 
 import celery
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.base import BaseCache
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.exceptions import ImproperlyConfigured
 from django.db import transaction
-from django.db.models import QuerySet
+from django.db.models import Prefetch, QuerySet
+from django.utils import timezone
 from primitive_metadata import primitive_rdf
 
 from share import models as share_db
-from share.search import IndexMessenger
+from share.search import IndexMessenger, coalesced_index_messages
 from share.util.checksum_iri import ChecksumIri
 from trove import models as trove_db
 from trove.exceptions import (
@@ -28,13 +49,46 @@ from trove.exceptions import (
 )
 from trove.extract import get_rdf_extractor_class
 from trove.derive import get_deriver_classes
+from trove.util.django import pk_chunked
 from trove.util.iris import smells_like_iri
+from trove.util.iter import iter_unique
 from trove.vocab.namespaces import RDFS, RDF, OWL
 
 
 logger = logging.getLogger(__name__)
 
+# how many index cards to derive per `task__derive_chunk`
+DERIVE_CHUNK_SIZE = 101
+
+# how many index cards (or supplements) to expel at once -- each chunk deleted
+# in a few queries, with one index notification
+EXPEL_CHUNK_SIZE = 1000
+
+# how long since an unreferenced blob was last referenced (created or reused) before
+# it's deleted (a blob referenced more recently may be about to be referenced again,
+# by rows not yet committed)
+UNREFERENCED_BLOB_MINIMUM_AGE = datetime.timedelta(days=1)
+
+# count of records skipped as unchanged (see `noop_ingest_count`)
+NOOP_INGEST_COUNT_CACHE_KEY = f'{__name__}--noop_ingest_count'
+
 
+@dataclasses.dataclass(frozen=True)
+class RecordToIngest:
+    '''one metadata record (with its per-record params) for `ingest_batch`'''
+    focus_iri: str
+    record_mediatype: str
+    raw_record: str
+    record_identifier: str | None = None  # default focus_iri
+    is_supplementary: bool = False
+    expiration_date: datetime.date | None = None  # default "never"
+
+    @property
+    def suid_identifier(self) -> str:
+        return self.record_identifier or self.focus_iri
+
+
+@coalesced_index_messages()
 def ingest(
     *,  # all keyword-args
     from_user: share_db.ShareUser,
@@ -64,8 +118,63 @@ def ingest(
             restore_deleted=restore_deleted,
             expiration_date=expiration_date,
         )
-        for _card in _extracted_cards:
-            task__derive.delay(_card.pk, urgent=urgent)
+        _enqueue_derive_chunks([_card.pk for _card in _extracted_cards], urgent=urgent)
+
+
+@coalesced_index_messages()
+def ingest_batch(
+    *,  # all keyword-args
+    from_user: share_db.ShareUser,
+    records: Sequence[RecordToIngest],
+    restore_deleted: bool = False,
+    urgent: bool = False,
+) -> None:
+    '''ingest_batch: like `ingest`, but for many records in one go
+
+    sniffs all records together (see `sniff_batch`) and extracts them all
+    in a single transaction -- if any record raises `DigestiveError`,
+    none in the batch are saved
+
+    set-based are only the sniff and the check for records unchanged since last
+    extracted (in one query, for the whole batch); the rest are extracted one by one
+    (see `extract` -- parsing, identifiers, and description writes per record)
+    '''
+    with transaction.atomic():
+        _suids = sniff_batch(from_user=from_user, records=records)
+        _records_to_extract = []
+        for _record, _suid in zip(records, _suids):
+            if _suid.source_config.disabled or _suid.source_config.source.is_deleted:
+                expel_suid(_suid)
+            else:
+                _raise_if_expired(_suid, _record.expiration_date)
+                _records_to_extract.append((
+                    _record,
+                    _suid,
+                    _raw_record_checksum_iri(_record.record_mediatype, _record.raw_record),
+                ))
+        _unchanged_suid_ids = _unchanged_raw_record_suid_ids(
+            (_suid, _checksum_iri, _record.expiration_date)
+            for _record, _suid, _checksum_iri in _records_to_extract
+        )
+        _count_noop_ingests(len(_unchanged_suid_ids))
+        _extracted_indexcard_ids: list[int] = []
+        for _record, _suid, _checksum_iri in _records_to_extract:
+            if _suid.pk in _unchanged_suid_ids:
+                _log_unchanged_record(_suid)
+            else:
+                _extracted_indexcard_ids.extend(
+                    _card.pk
+                    for _card in _extract_rdf_and_save(
+                        suid=_suid,
+                        record_mediatype=_record.record_mediatype,
+                        raw_record=_record.raw_record,
+                        raw_record_checksum_iri=_checksum_iri,
+                        restore_deleted=restore_deleted,
+                        expiration_date=_record.expiration_date,
+                    )
+                )
+    # enqueue derive only after the transaction commits
+    _enqueue_derive_chunks(list(iter_unique(_extracted_indexcard_ids)), urgent=urgent)
 
 
 @transaction.atomic
@@ -88,12 +197,12 @@ def sniff(
     for a given `(from_user, record_identifier)` pair, `focus_iri` and `is_supplementary`
     must not change -- raises `DigestiveError` if called again with different values
     '''
-    if not smells_like_iri(focus_iri):
-        raise DigestiveError(f'invalid focus_iri "{focus_iri}"')
-    if is_supplementary and not record_identifier:
-        raise DigestiveError(f'supplementary records must have non-empty record_identifier! focus_iri={focus_iri} from_user={from_user}')
-    if is_supplementary and (record_identifier == focus_iri):
-        raise DigestiveError(f'supplementary records must have record_identifier distinct from their focus! focus_iri={focus_iri} record_identifier={record_identifier} from_user={from_user}')
+    _check_sniffable(
+        from_user=from_user,
+        focus_iri=focus_iri,
+        record_identifier=record_identifier,
+        is_supplementary=is_supplementary,
+    )
     _source_config = share_db.SourceConfig.objects.get_or_create_push_config(from_user)
     _suid, _suid_created = share_db.SourceUniqueIdentifier.objects.get_or_create(
         source_config=_source_config,
@@ -114,6 +223,90 @@ def sniff(
     return _suid
 
 
+@transaction.atomic
+def sniff_batch(
+    *,  # all keyword-args
+    from_user: share_db.ShareUser,
+    records: Sequence[RecordToIngest],
+) -> list[share_db.SourceUniqueIdentifier]:
+    '''sniff_batch: like `sniff`, but for many records at once, with set-based queries
+
+    returns a `SourceUniqueIdentifier` for each given record, in the same order
+
+    records in one batch must have distinct record identifiers
+    '''
+    _seen_suid_identifiers: set[str] = set()
+    for _record in records:
+        _check_sniffable(
+            from_user=from_user,
+            focus_iri=_record.focus_iri,
+            record_identifier=_record.record_identifier,
+            is_supplementary=_record.is_supplementary,
+        )
+        if _record.suid_identifier in _seen_suid_identifiers:
+            raise DigestiveError(f'duplicate record_identifier in batch: "{_record.suid_identifier}"')
+        _seen_suid_identifiers.add(_record.suid_identifier)
+    if not records:
+        return []
+    _source_config = share_db.SourceConfig.objects.get_or_create_push_config(from_user)
+    share_db.SourceUniqueIdentifier.objects.bulk_create(
+        [
+            share_db.SourceUniqueIdentifier(
+                source_config=_source_config,
+                identifier=_record.suid_identifier,
+                is_supplementary=_record.is_supplementary,
+            )
+            for _record in records
+        ],
+        ignore_conflicts=True,
+    )
+    _suids_by_identifier = {
+        _suid.identifier: _suid
+        for _suid in share_db.SourceUniqueIdentifier.objects.filter(
+            source_config=_source_config,
+            identifier__in=_seen_suid_identifiers,
+        )
+    }
+    _focus_identifiers_by_iri = trove_db.ResourceIdentifier.objects.get_or_create_for_iris(
+        _record.focus_iri
+        for _record in records
+    )
+    _suids = []
+    _suids_to_update = []
+    for _record in records:
+        _suid = _suids_by_identifier[_record.suid_identifier]
+        _suid.source_config = _source_config  # avoid a query per suid
+        if bool(_suid.is_supplementary) != _record.is_supplementary:
+            raise DigestiveError(f'suid is_supplementary should not change! suid={_suid}, is_supplementary changed from {bool(_suid.is_supplementary)} to {_record.is_supplementary}')
+        _focus_identifier = _focus_identifiers_by_iri[_record.focus_iri]
+        if _suid.focus_identifier_id is None:
+            _suid.focus_identifier = _focus_identifier
+            _suids_to_update.append(_suid)
+        elif _suid.focus_identifier_id != _focus_identifier.pk:
+            raise DigestiveError(f'suid focus_identifier should not change! suid={_suid}, focus changed from {_suid.focus_identifier} to {_focus_identifier}')
+        else:
+            _suid.focus_identifier = _focus_identifier
+        _suids.append(_suid)
+    if _suids_to_update:
+        share_db.SourceUniqueIdentifier.objects.bulk_update(_suids_to_update, ['focus_identifier'])
+    return _suids
+
+
+def _check_sniffable(
+    *,
+    from_user: share_db.ShareUser,
+    focus_iri: str,
+    record_identifier: str | None,
+    is_supplementary: bool,
+) -> None:
+    if not smells_like_iri(focus_iri):
+        raise DigestiveError(f'invalid focus_iri "{focus_iri}"')
+    if is_supplementary and not record_identifier:
+        raise DigestiveError(f'supplementary records must have non-empty record_identifier! focus_iri={focus_iri} from_user={from_user}')
+    if is_supplementary and (record_identifier == focus_iri):
+        raise DigestiveError(f'supplementary records must have record_identifier distinct from their focus! focus_iri={focus_iri} record_identifier={record_identifier} from_user={from_user}')
+
+
 def extract(
     suid: share_db.SourceUniqueIdentifier,
     record_mediatype: str,
@@ -132,9 +325,35 @@ def extract(
         SupplementaryResourceDescription (all extracted metadata, if supplementary)
     may delete:
         LatestResourceDescription (previously extracted from the record, but no longer present)
+
+    does nothing (and returns an empty list) if the raw record is identical to the one
+    each of the suid's index cards was last extracted from
     '''
-    if (expiration_date is not None) and (expiration_date <= datetime.date.today()):
-        raise CannotDigestExpiredDatum(suid, expiration_date)
+    _raise_if_expired(suid, expiration_date)
+    _checksum_iri = _raw_record_checksum_iri(record_mediatype, raw_record)
+    if _unchanged_raw_record_suid_ids([(suid, _checksum_iri, expiration_date)]):
+        _count_noop_ingests(1)
+        _log_unchanged_record(suid)
+        return []
+    return _extract_rdf_and_save(
+        suid=suid,
+        record_mediatype=record_mediatype,
+        raw_record=raw_record,
+        raw_record_checksum_iri=_checksum_iri,
+        restore_deleted=restore_deleted,
+        expiration_date=expiration_date,
+    )
+
+
+def _extract_rdf_and_save(
+    *,
+    suid: share_db.SourceUniqueIdentifier,
+    record_mediatype: str,
+    raw_record: str,
+    raw_record_checksum_iri: str,
+    restore_deleted: bool,
+    expiration_date: datetime.date | None,
+) -> list[trove_db.Indexcard]:
     _tripledicts_by_focus_iri = {}
     _extractor = get_rdf_extractor_class(record_mediatype)()
     # TODO normalize (or just validate) tripledict:
@@ -173,9 +392,110 @@ def extract(
         rdf_tripledicts_by_focus_iri=_tripledicts_by_focus_iri,
         restore_deleted=restore_deleted,
         expiration_date=expiration_date,
+        raw_record_checksum_iri=raw_record_checksum_iri,
+    )
+
+
+def _raise_if_expired(suid: share_db.SourceUniqueIdentifier, expiration_date: datetime.date | None) -> None:
+    if (expiration_date is not None) and (expiration_date <= datetime.date.today()):
+        raise CannotDigestExpiredDatum(suid, expiration_date)
+
+
+def _raw_record_checksum_iri(record_mediatype: str, raw_record: str) -> str:
+    return str(ChecksumIri.digest('sha-256', salt=record_mediatype, data=raw_record))
+
+
+def _log_unchanged_record(suid: share_db.SourceUniqueIdentifier) -> None:
+    logger.debug('skipping unchanged record (suid %s)', suid.pk)
+
+
+def noop_ingest_count() -> int | None:
+    '''how many ingested records were skipped as unchanged (see `extract`)
+
+    as counted (once committed) in the django cache `settings.INGEST_COUNT_CACHE_ALIAS`,
+    shared across processes -- None if that setting is empty or invalid (not counted)
+    '''
+    _count_cache = _get_ingest_count_cache()
+    return (
+        None
+        if _count_cache is None
+        else _count_cache.get(NOOP_INGEST_COUNT_CACHE_KEY, 0)
     )
 
 
+def _count_noop_ingests(count: int) -> None:
+    # (once per batch, not per record -- and only if the batch is committed)
+    if not count:
+        return
+    _count_cache = _get_ingest_count_cache()
+    if _count_cache is not None:
+        def _incr() -> None:
+            if not _count_cache.add(NOOP_INGEST_COUNT_CACHE_KEY, count, timeout=None):
+                _count_cache.incr(NOOP_INGEST_COUNT_CACHE_KEY, count)
+        transaction.on_commit(_incr)
+
+
+def _get_ingest_count_cache() -> BaseCache | None:
+    # a misconfigured count cache fails the `trove.E001` system check, but is
+    # not worth failing an ingest (or the admin) for -- just not counted
+    try:
+        return get_ingest_count_cache()
+    except ImproperlyConfigured:
+        return None
+
+
+def get_ingest_count_cache() -> BaseCache | None:
+    '''the django cache for counting skipped ingests (see `noop_ingest_count`), if any
+
+    raises ImproperlyConfigured if `settings.INGEST_COUNT_CACHE_ALIAS` names
+    no cache, or a cache not shared across processes
+    '''
+    _cache_alias = settings.INGEST_COUNT_CACHE_ALIAS
+    if not _cache_alias:
+        return None
+    _count_cache = caches[_cache_alias]
+    if isinstance(_count_cache, (LocMemCache, DummyCache)):
+        raise ImproperlyConfigured(
+            f'INGEST_COUNT_CACHE_ALIAS ("{_cache_alias}") must name a django cache shared'
+            ' across processes (e.g. redis or memcached), so records are counted from every'
+            ' worker -- or be empty, to not count',
+        )
+    return _count_cache
+
+
+def _unchanged_raw_record_suid_ids(
+    suids_with_checksums: Iterable[tuple[share_db.SourceUniqueIdentifier, str, datetime.date | None]],
+) -> set[int]:
+    '''ids of the given (non-supplementary) suids whose index cards were each last extracted
+    from the same raw record (by checksum), with the same expiration date -- in one query
+    '''
+    # TODO: also short-circuit supplementary records (tho a repeated supplement
+    #       may still supplement index cards created since it was last seen)
+    _expected_by_suid_id = {
+        _suid.pk: (_checksum_iri, _expiration_date)
+        for _suid, _checksum_iri, _expiration_date in suids_with_checksums
+        if not _suid.is_supplementary
+    }
+    if not _expected_by_suid_id:
+        return set()
+    _unchanged_suid_ids = set(_expected_by_suid_id.keys())
+    _seen_suid_ids = set()
+    for _suid_id, _deleted, _checksum_iri, _expiration_date in (
+        trove_db.Indexcard.objects
+        .filter(source_record_suid_id__in=_expected_by_suid_id.keys())
+        .values_list(
+            'source_record_suid_id',
+            'deleted',
+            'trove_latestresourcedescription_set__raw_record_checksum_iri',
+            'trove_latestresourcedescription_set__expiration_date',
+        )
+    ):
+        _seen_suid_ids.add(_suid_id)
+        if (_deleted is not None) or ((_checksum_iri, _expiration_date) != _expected_by_suid_id[_suid_id]):
+            _unchanged_suid_ids.discard(_suid_id)
+    return _unchanged_suid_ids.intersection(_seen_suid_ids)  # (suids without cards are new)
+
+
 def derive(indexcard: trove_db.Indexcard, deriver_iris: Iterable[str] | None = None) -> list[trove_db.DerivedIndexcard]:
     '''derive: build other kinds of index cards from the extracted rdf
 
@@ -188,30 +508,112 @@ def derive(indexcard: trove_db.Indexcard, deriver_iris: Iterable[str] | None = N
         _latest_resource_description = indexcard.latest_resource_description
     except trove_db.LatestResourceDescription.DoesNotExist:
         return []
-    _derived_list = []
-    for _deriver_class in get_deriver_classes(deriver_iris):
-        _deriver = _deriver_class(upstream_description=_latest_resource_description)
-        _deriver_identifier = trove_db.ResourceIdentifier.objects.get_or_create_for_iri(_deriver.deriver_iri())
-        if _deriver.should_skip():
-            trove_db.DerivedIndexcard.objects.filter(
-                upriver_indexcard=indexcard,
-                deriver_identifier=_deriver_identifier,
-            ).delete()
-        else:
-            _derived_text = _deriver.derive_card_as_text()
-            _derived_checksum_iri = ChecksumIri.digest('sha-256', salt='', data=_derived_text)
-            _derived, _ = trove_db.DerivedIndexcard.objects.update_or_create(
-                upriver_indexcard=indexcard,
-                deriver_identifier=_deriver_identifier,
-                defaults={
-                    'derived_text': _derived_text,
-                    'derived_checksum_iri': _derived_checksum_iri,
-                },
-            )
-            _derived_list.append(_derived)
+    _derived_list, _ = _derive_from_descriptions([_latest_resource_description], deriver_iris)
     return _derived_list
 
 
+def derive_chunk(
+    indexcard_ids: Iterable[int],
+    deriver_iris: Iterable[str] | None = None,
+) -> dict[int, frozenset[str]]:
+    '''derive_chunk: like `derive`, but for many index cards at once, with set-based queries
+
+    returns the iris of derivers whose output changed, keyed by id of each index card
+    derived (index cards deleted or lacking a latest description are omitted)
+    '''
+    _latest_resource_description_qs = (
+        trove_db.LatestResourceDescription.objects
+        .filter(indexcard_id__in=indexcard_ids)
+        .filter(indexcard__deleted__isnull=True)
+        .select_related('indexcard', 'turtle_blob')
+        .defer('turtle_blob__content')  # (rdf read pre-parsed, when packed)
+        .prefetch_related(Prefetch(
+            'indexcard__supplementary_description_set__turtle_blob',
+            queryset=trove_db.TurtleBlob.objects.defer('content'),
+        ))
+    )
+    _, _changed_deriver_iris_by_indexcard_id = _derive_from_descriptions(
+        _latest_resource_description_qs,
+        deriver_iris,
+    )
+    return _changed_deriver_iris_by_indexcard_id
+
+
+def _derive_from_descriptions(
+    latest_resource_descriptions: Iterable[trove_db.LatestResourceDescription],
+    deriver_iris: Iterable[str] | None,
+) -> tuple[list[trove_db.DerivedIndexcard], dict[int, frozenset[str]]]:
+    _latest_resource_descriptions = list(latest_resource_descriptions)
+    _deriver_classes = get_deriver_classes(deriver_iris)
+    _deriver_iris_by_id = {
+        trove_db.ResourceIdentifier.objects.get_or_create_cached_id_for_iri(_deriver_class.deriver_iri()): _deriver_class.deriver_iri()
+        for _deriver_class in _deriver_classes
+    }
+    # compare against stored checksums, to skip writes that would change nothing
+    _prior_derived = {
+        (_derived.upriver_indexcard_id, _derived.deriver_identifier_id): _derived
+        for _derived in trove_db.DerivedIndexcard.objects.filter(
+            upriver_indexcard_id__in=[_desc.indexcard_id for _desc in _latest_resource_descriptions],
+            deriver_identifier_id__in=_deriver_iris_by_id.keys(),
+        )
+    }
+    _derived_list = []
+    _changed_derived_list = []
+    _changed_deriver_ids_by_indexcard_id: dict[int, set[int]] = {}
+    _skipped_indexcard_ids_by_deriver_id: dict[int, list[int]] = {}
+    for _resource_description in _latest_resource_descriptions:
+        _indexcard_id = _resource_description.indexcard_id
+        _changed_deriver_ids = _changed_deriver_ids_by_indexcard_id.setdefault(_indexcard_id, set())
+        # parse once, share among derivers
+        _rdfdoc = _resource_description.as_shared_rdfdoc_with_supplements()
+        for _deriver_class in _deriver_classes:
+            _deriver = _deriver_class(upstream_description=_resource_description, rdfdoc=_rdfdoc)
+            _deriver_identifier_id = trove_db.ResourceIdentifier.objects.get_or_create_cached_id_for_iri(_deriver.deriver_iri())
+            _prior = _prior_derived.get((_indexcard_id, _deriver_identifier_id))
+            if _deriver.should_skip():
+                if _prior is not None:
+                    _changed_deriver_ids.add(_deriver_identifier_id)
+                    (
+                        _skipped_indexcard_ids_by_deriver_id
+                        .setdefault(_deriver_identifier_id, [])
+                        .append(_indexcard_id)
+                    )
+            else:
+                _derived_text = _deriver.derive_card_as_text()
+                _derived_checksum_iri = str(ChecksumIri.digest('sha-256', salt='', data=_derived_text))
+                if (_prior is not None) and (_prior.derived_checksum_iri == _derived_checksum_iri):
+                    _prior.upriver_indexcard = _resource_description.indexcard
+                    _derived_list.append(_prior)  # unchanged; already saved
+                else:
+                    _derived = trove_db.DerivedIndexcard(
+                        upriver_indexcard=_resource_description.indexcard,
+                        deriver_identifier_id=_deriver_identifier_id,
+                        derived_text=_derived_text,
+                        derived_checksum_iri=_derived_checksum_iri,
+                    )
+                    _derived_list.append(_derived)
+                    _changed_deriver_ids.add(_deriver_identifier_id)
+                    _changed_derived_list.append(_derived)
+    for _deriver_identifier_id, _skipped_indexcard_ids in _skipped_indexcard_ids_by_deriver_id.items():
+        trove_db.DerivedIndexcard.objects.filter(
+            upriver_indexcard_id__in=_skipped_indexcard_ids,
+            deriver_identifier_id=_deriver_identifier_id,
+        ).delete()
+    if _changed_derived_list:
+        trove_db.DerivedIndexcard.objects.bulk_create(
+            _changed_derived_list,
+            update_conflicts=True,
+            unique_fields=['upriver_indexcard', 'deriver_identifier'],
+            update_fields=['derived_blob', 'derived_checksum_iri', 'modified'],
+        )
+    _changed_deriver_iris_by_indexcard_id = {
+        _indexcard_id: frozenset(_deriver_iris_by_id[_id] for _id in _changed_deriver_ids)
+        for _indexcard_id, _changed_deriver_ids in _changed_deriver_ids_by_indexcard_id.items()
+    }
+    return _derived_list, _changed_deriver_iris_by_indexcard_id
+
+
+@coalesced_index_messages()
 def expel(from_user: share_db.ShareUser, record_identifier: str) -> None:
     _suid_qs = share_db.SourceUniqueIdentifier.objects.filter(
         source_config__source__user=from_user,
@@ -221,9 +623,9 @@ def expel(from_user: share_db.ShareUser, record_identifier: str) -> None:
         expel_suid(_suid)
 
 
+@coalesced_index_messages()
 def expel_suid(suid: share_db.SourceUniqueIdentifier) -> None:
-    for _indexcard in trove_db.Indexcard.objects.filter(source_record_suid=suid):
-        _indexcard.pls_delete()
+    _expel_indexcards(trove_db.Indexcard.objects.filter(source_record_suid=suid))
     _expel_supplementary_descriptions(
         trove_db.SupplementaryResourceDescription.objects.filter(supplementary_suid=suid),
     )
@@ -231,25 +633,55 @@ def expel_suid(suid: share_db.SourceUniqueIdentifier) -> None:
 
 def expel_expired_data(today: datetime.date) -> None:
     # mark indexcards deleted if their latest update has now expired
-    for _indexcard in trove_db.Indexcard.objects.filter(
+    _expel_indexcards(trove_db.Indexcard.objects.filter(
         trove_latestresourcedescription_set__expiration_date__lte=today,
-    ):
-        _indexcard.pls_delete()
+    ))
     # delete expired supplementary metadata
     _expel_supplementary_descriptions(
         trove_db.SupplementaryResourceDescription.objects.filter(expiration_date__lte=today),
     )
 
 
+def delete_unreferenced_blobs(referenced_before: datetime.datetime) -> None:
+    # content blobs (derived text, turtle) no longer referenced, e.g. after expelling
+    for _blob_model in (trove_db.DerivedTextBlob, trove_db.TurtleBlob):
+        _deleted_count = _blob_model.objects.delete_unreferenced(referenced_before=referenced_before)
+        logger.info('deleted %d unreferenced %s', _deleted_count, _blob_model.__name__)
+
+
+def _expel_indexcards(indexcard_queryset: QuerySet[trove_db.Indexcard]) -> None:
+    # set-based `Indexcard.pls_delete`, in chunks (each announced to indexes once deleted
+    # -- held back until committed, within `coalesced_index_messages`)
+    _index_messenger = IndexMessenger()
+    for _indexcard_ids in pk_chunked(indexcard_queryset, EXPEL_CHUNK_SIZE):
+        trove_db.Indexcard.objects.pls_delete_ids(_indexcard_ids)
+        _index_messenger.notify_indexcard_update(list(
+            trove_db.Indexcard.objects
+            .filter(id__in=_indexcard_ids)
+            .only('id', 'source_record_suid_id')
+        ))
+
+
 def _expel_supplementary_descriptions(supplementary_rdf_queryset: QuerySet[trove_db.SupplementaryResourceDescription]) -> None:
-    # delete expired supplementary metadata
-    _affected_indexcards = set()
-    for _supplement in supplementary_rdf_queryset.select_related('indexcard'):
-        if not _supplement.indexcard.deleted:
-            _affected_indexcards.add(_supplement.indexcard)
-        _supplement.delete()
-    for _indexcard in _affected_indexcards:
-        task__derive.delay(_indexcard.pk)
+    # delete supplementary metadata in chunks, then re-derive affected (non-deleted) indexcards
+    _affected_indexcard_ids: set[int] = set()
+    for _supplement_ids in pk_chunked(supplementary_rdf_queryset, EXPEL_CHUNK_SIZE):
+        _chunk_qs = trove_db.SupplementaryResourceDescription.objects.filter(id__in=_supplement_ids)
+        _affected_indexcard_ids.update(
+            _chunk_qs
+            .filter(indexcard__deleted__isnull=True)
+            .values_list('indexcard_id', flat=True)
+        )
+        _chunk_qs.delete()
+    _enqueue_derive_chunks(sorted(_affected_indexcard_ids))
+
+
+def _enqueue_derive_chunks(indexcard_ids: Sequence[int], *, urgent: bool = False) -> None:
+    for _chunk_start in range(0, len(indexcard_ids), DERIVE_CHUNK_SIZE):
+        task__derive_chunk.delay(
+            list(indexcard_ids[_chunk_start:(_chunk_start + DERIVE_CHUNK_SIZE)]),
+            urgent=urgent,
+        )
 
 
 ### BEGIN celery tasks
@@ -262,40 +694,86 @@ def task__derive(
     notify_index: bool = True,
     urgent: bool = False,
 ) -> None:
-    _indexcard = trove_db.Indexcard.objects.get(id=indexcard_id)
-    derive(
-        _indexcard,
+    _changed_deriver_iris_by_indexcard_id = derive_chunk(
+        [indexcard_id],
+        deriver_iris=(None if deriver_iri is None else [deriver_iri]),
+    )
+    if notify_index:
+        _notify_index_of_changes(
+            IndexMessenger(celery_app=task.app),
+            [indexcard_id],
+            _changed_deriver_iris_by_indexcard_id,
+            urgent=urgent,
+        )
+
+
+@celery.shared_task(acks_late=True, bind=True)
+def task__derive_chunk(
+    task: celery.Task,
+    indexcard_ids: list[int],
+    deriver_iri: str | None = None,
+    notify_index: bool = True,
+    urgent: bool = False,
+) -> None:
+    _changed_deriver_iris_by_indexcard_id = derive_chunk(
+        indexcard_ids,
         deriver_iris=(None if deriver_iri is None else [deriver_iri]),
     )
-    # TODO: avoid unnecessary work; let IndexStrategy subscribe to a specific
-    # IndexcardDeriver (perhaps by deriver-specific MessageType?)
     if notify_index:
-        IndexMessenger(celery_app=task.app).notify_indexcard_update([_indexcard], urgent=urgent)
+        _notify_index_of_changes(
+            IndexMessenger(celery_app=task.app),
+            indexcard_ids,
+            _changed_deriver_iris_by_indexcard_id,
+            urgent=urgent,
+        )
+
+
+@coalesced_index_messages()
+def _notify_index_of_changes(
+    index_messenger: IndexMessenger,
+    indexcard_ids: Iterable[int],
+    changed_deriver_iris_by_indexcard_id: dict[int, frozenset[str]],
+    *,
+    urgent: bool,
+) -> None:
+    # group index cards by what changed, so each index strategy hears only of
+    # changes to derivers it subscribes to -- cards with nothing changed are
+    # skipped; cards not derived (e.g. deleted) are sent to every strategy
+    _indexcard_ids_by_changes: dict[frozenset[str] | None, list[int]] = {}
+    for _indexcard_id in indexcard_ids:
+        _changes = changed_deriver_iris_by_indexcard_id.get(_indexcard_id)
+        if _changes is None or _changes:
+            _indexcard_ids_by_changes.setdefault(_changes, []).append(_indexcard_id)
+    for _changes, _indexcard_ids in _indexcard_ids_by_changes.items():
+        index_messenger.notify_indexcard_update(
+            list(trove_db.Indexcard.objects.filter(id__in=_indexcard_ids)),
+            urgent=urgent,
+            changed_deriver_iris=_changes,
+        )
 
 
 @celery.shared_task(acks_late=True)
 def task__schedule_derive_for_source_config(source_config_id: int, notify_index: bool = False) -> None:
-    _indexcard_id_qs = (
-        trove_db.Indexcard.objects
-        .filter(source_record_suid__source_config_id=source_config_id)
-        .values_list('id', flat=True)
+    _indexcard_qs = trove_db.Indexcard.objects.filter(
+        source_record_suid__source_config_id=source_config_id,
     )
-    for _indexcard_id in _indexcard_id_qs.iterator():
-        task__derive.delay(_indexcard_id, notify_index=notify_index)
+    for _indexcard_ids in pk_chunked(_indexcard_qs, DERIVE_CHUNK_SIZE):
+        task__derive_chunk.delay(_indexcard_ids, notify_index=notify_index)
 
 
 @celery.shared_task(acks_late=True)
 def task__schedule_all_for_deriver(deriver_iri: str, notify_index: bool = False) -> None:
     if not get_deriver_classes([deriver_iri]):
         raise DigestiveError(f'unknown deriver_iri: {deriver_iri}')
-    _indexcard_id_qs = (
-        trove_db.Indexcard.objects
-        .values_list('id', flat=True)
-    )
-    for _indexcard_id in _indexcard_id_qs.iterator():
-        task__derive.apply_async((_indexcard_id, deriver_iri, notify_index))
+    for _indexcard_ids in pk_chunked(trove_db.Indexcard.objects.all(), DERIVE_CHUNK_SIZE):
+        task__derive_chunk.apply_async((_indexcard_ids, deriver_iri, notify_index))
 
 
 @celery.shared_task(acks_late=True)
 def task__expel_expired_data() -> None:
     expel_expired_data(datetime.date.today())
+
+
+@celery.shared_task(acks_late=True)
+def task__delete_unreferenced_blobs() -> None:
+    delete_unreferenced_blobs(timezone.now() - UNREFERENCED_BLOB_MINIMUM_AGE)
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 19:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trove', '0011_upgrade_django_5_2'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='latestresourcedescription',
+            name='raw_record_checksum_iri',
+            field=models.TextField(blank=True, default=''),
+        ),
+    ]
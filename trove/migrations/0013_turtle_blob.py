@@ -0,0 +1,59 @@
+# Generated by Django 5.2.18 on 2026-10-18 20:12
+
+from django.db import migrations, models
+import django.db.models.deletion
+import trove.models.content_blob
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trove', '0012_latest_raw_record_checksum'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TurtleBlob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', models.DateTimeField(auto_now_add=True)),
+                ('checksum_iri', models.TextField(unique=True)),
+                ('content', trove.models.content_blob.CompressedTextField()),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        # nullable for now -- filled by 0014_fill_turtle_blobs, required from 0015
+        # (and `rdf_as_turtle` nullable until removed in 0015, to allow reversing)
+        migrations.AddField(
+            model_name='archivedresourcedescription',
+            name='turtle_blob',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='trove.turtleblob'),
+        ),
+        migrations.AddField(
+            model_name='latestresourcedescription',
+            name='turtle_blob',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='trove.turtleblob'),
+        ),
+        migrations.AddField(
+            model_name='supplementaryresourcedescription',
+            name='turtle_blob',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='trove.turtleblob'),
+        ),
+        migrations.AlterField(
+            model_name='archivedresourcedescription',
+            name='rdf_as_turtle',
+            field=models.TextField(null=True),
+        ),
+        migrations.AlterField(
+            model_name='latestresourcedescription',
+            name='rdf_as_turtle',
+            field=models.TextField(null=True),
+        ),
+        migrations.AlterField(
+            model_name='supplementaryresourcedescription',
+            name='rdf_as_turtle',
+            field=models.TextField(null=True),
+        ),
+    ]
@@ -0,0 +1,113 @@
+# Generated by Django 5.2.18 on 2026-10-18 20:15
+
+import hashlib
+from typing import Any
+import zlib
+
+from django.db import migrations
+
+
+_CHUNK_SIZE = 1000
+_DESCRIPTION_MODEL_NAMES = (
+    'ArchivedResourceDescription',
+    'LatestResourceDescription',
+    'SupplementaryResourceDescription',
+)
+
+
+def _checksum_iri(rdf_as_turtle: str) -> str:
+    # (same as `trove.models.content_blob.text_checksum_iri`, frozen here)
+    return f'urn:checksum:sha-256::{hashlib.sha256(rdf_as_turtle.encode()).hexdigest()}'
+
+
+def fill_turtle_blobs(apps: Any, schema_editor: Any) -> None:
+    # in chunks, each committed on its own (non-atomic migration) -- may be stopped
+    # and run again, picking up where it left off
+    TurtleBlob = apps.get_model('trove', 'TurtleBlob')
+    for _model_name in _DESCRIPTION_MODEL_NAMES:
+        _description_model = apps.get_model('trove', _model_name)
+        _last_pk = 0
+        while True:
+            _chunk = list(
+                _description_model.objects
+                .filter(pk__gt=_last_pk, turtle_blob__isnull=True)
+                .order_by('pk')
+                .values_list('pk', 'rdf_as_turtle')
+                [:_CHUNK_SIZE]
+            )
+            if not _chunk:
+                break
+            _last_pk = _chunk[-1][0]
+            _checksum_by_pk = {
+                _pk: _checksum_iri(_turtle)
+                for _pk, _turtle in _chunk
+            }
+            _turtle_by_checksum = {
+                _checksum_by_pk[_pk]: _turtle
+                for _pk, _turtle in _chunk
+            }
+            TurtleBlob.objects.bulk_create(
+                [
+                    TurtleBlob(checksum_iri=_checksum, content=_turtle)  # (compressed by the field)
+                    for _checksum, _turtle in _turtle_by_checksum.items()
+                ],
+                ignore_conflicts=True,
+            )
+            _blob_id_by_checksum = dict(
+                TurtleBlob.objects
+                .filter(checksum_iri__in=_turtle_by_checksum.keys())
+                .values_list('checksum_iri', 'id')
+            )
+            _description_model.objects.bulk_update(
+                [
+                    _description_model(pk=_pk, turtle_blob_id=_blob_id_by_checksum[_checksum])
+                    for _pk, _checksum in _checksum_by_pk.items()
+                ],
+                ['turtle_blob'],
+            )
+
+
+def unfill_turtle_blobs(apps: Any, schema_editor: Any) -> None:
+    # (for reversing 0015 -- turtle back to each description, in chunks)
+    TurtleBlob = apps.get_model('trove', 'TurtleBlob')
+    for _model_name in _DESCRIPTION_MODEL_NAMES:
+        _description_model = apps.get_model('trove', _model_name)
+        _last_pk = 0
+        while True:
+            _chunk = list(
+                _description_model.objects
+                .filter(pk__gt=_last_pk)
+                .order_by('pk')
+                .values_list('pk', 'turtle_blob_id')
+                [:_CHUNK_SIZE]
+            )
+            if not _chunk:
+                break
+            _last_pk = _chunk[-1][0]
+            _turtle_by_blob_id = {
+                _blob_id: zlib.decompress(_compressed).decode()
+                for _blob_id, _compressed in (
+                    TurtleBlob.objects
+                    .filter(id__in={_blob_id for _, _blob_id in _chunk})
+                    .values_list('id', 'content')  # (compressed)
+                )
+            }
+            _description_model.objects.bulk_update(
+                [
+                    _description_model(pk=_pk, rdf_as_turtle=_turtle_by_blob_id[_blob_id])
+                    for _pk, _blob_id in _chunk
+                ],
+                ['rdf_as_turtle'],
+            )
+
+
+class Migration(migrations.Migration):
+    atomic = False  # commit each chunk (without locking whole tables for the duration)
+
+    dependencies = [
+        ('trove', '0013_turtle_blob'),
+    ]
+
+    operations = [
+        migrations.RunPython(fill_turtle_blobs, unfill_turtle_blobs),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.18 on 2026-10-18 20:19
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trove', '0014_fill_turtle_blobs'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='archivedresourcedescription',
+            name='rdf_as_turtle',
+        ),
+        migrations.RemoveField(
+            model_name='latestresourcedescription',
+            name='rdf_as_turtle',
+        ),
+        migrations.RemoveField(
+            model_name='supplementaryresourcedescription',
+            name='rdf_as_turtle',
+        ),
+        migrations.AlterField(
+            model_name='archivedresourcedescription',
+            name='turtle_blob',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='+', to='trove.turtleblob'),
+        ),
+        migrations.AlterField(
+            model_name='latestresourcedescription',
+            name='turtle_blob',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='+', to='trove.turtleblob'),
+        ),
+        migrations.AlterField(
+            model_name='supplementaryresourcedescription',
+            name='turtle_blob',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='+', to='trove.turtleblob'),
+        ),
+    ]
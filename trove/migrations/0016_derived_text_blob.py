@@ -0,0 +1,39 @@
+# Generated by Django 5.2.18 on 2026-10-18 20:22
+
+from django.db import migrations, models
+import django.db.models.deletion
+import trove.models.content_blob
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trove', '0015_turtle_blob_required'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DerivedTextBlob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', models.DateTimeField(auto_now_add=True)),
+                ('checksum_iri', models.TextField(unique=True)),
+                ('content', trove.models.content_blob.CompressedTextField()),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        # nullable for now -- filled by 0017_fill_derived_text_blobs, required from 0018
+        # (and `derived_text` nullable until removed in 0018, to allow reversing)
+        migrations.AddField(
+            model_name='derivedindexcard',
+            name='derived_blob',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='trove.derivedtextblob'),
+        ),
+        migrations.AlterField(
+            model_name='derivedindexcard',
+            name='derived_text',
+            field=models.TextField(null=True),
+        ),
+    ]
@@ -0,0 +1,98 @@
+# Generated by Django 5.2.18 on 2026-10-18 20:24
+
+import hashlib
+from typing import Any
+import zlib
+
+from django.db import migrations
+
+
+_CHUNK_SIZE = 1000
+
+
+def _checksum_iri(text: str) -> str:
+    # (same as `trove.models.content_blob.text_checksum_iri`, frozen here)
+    return f'urn:checksum:sha-256::{hashlib.sha256(text.encode()).hexdigest()}'
+
+
+def fill_derived_text_blobs(apps: Any, schema_editor: Any) -> None:
+    # in chunks, each committed on its own (non-atomic migration) -- may be stopped
+    # and run again, picking up where it left off
+    DerivedIndexcard = apps.get_model('trove', 'DerivedIndexcard')
+    DerivedTextBlob = apps.get_model('trove', 'DerivedTextBlob')
+    _last_pk = 0
+    while True:
+        _chunk = list(
+            DerivedIndexcard.objects
+            .filter(pk__gt=_last_pk, derived_blob__isnull=True)
+            .order_by('pk')
+            .values_list('pk', 'derived_text')
+            [:_CHUNK_SIZE]
+        )
+        if not _chunk:
+            break
+        _last_pk = _chunk[-1][0]
+        _checksum_by_pk = {
+            _pk: _checksum_iri(_text)
+            for _pk, _text in _chunk
+        }
+        _text_by_checksum = {
+            _checksum_by_pk[_pk]: _text
+            for _pk, _text in _chunk
+        }
+        DerivedTextBlob.objects.bulk_create(
+            [
+                # (the field compresses text -- even in historical models)
+                DerivedTextBlob(checksum_iri=_checksum, content=_text)
+                for _checksum, _text in _text_by_checksum.items()
+            ],
+            ignore_conflicts=True,
+        )
+        _blob_id_by_checksum = dict(
+            DerivedTextBlob.objects
+            .filter(checksum_iri__in=_text_by_checksum.keys())
+            .values_list('checksum_iri', 'id')
+        )
+        DerivedIndexcard.objects.bulk_update(
+            [
+                DerivedIndexcard(pk=_pk, derived_blob_id=_blob_id_by_checksum[_checksum])
+                for _pk, _checksum in _checksum_by_pk.items()
+            ],
+            ['derived_blob'],
+        )
+
+
+def unfill_derived_text_blobs(apps: Any, schema_editor: Any) -> None:
+    # (for reversing 0018 -- text back to each derived indexcard, in chunks)
+    DerivedIndexcard = apps.get_model('trove', 'DerivedIndexcard')
+    _last_pk = 0
+    while True:
+        _chunk = list(
+            DerivedIndexcard.objects
+            .filter(pk__gt=_last_pk)
+            .order_by('pk')
+            .values_list('pk', 'derived_blob__content')  # (compressed)
+            [:_CHUNK_SIZE]
+        )
+        if not _chunk:
+            break
+        _last_pk = _chunk[-1][0]
+        DerivedIndexcard.objects.bulk_update(
+            [
+                DerivedIndexcard(pk=_pk, derived_text=zlib.decompress(_compressed).decode())
+                for _pk, _compressed in _chunk
+            ],
+            ['derived_text'],
+        )
+
+
+class Migration(migrations.Migration):
+    atomic = False  # commit each chunk (without locking whole tables for the duration)
+
+    dependencies = [
+        ('trove', '0016_derived_text_blob'),
+    ]
+
+    operations = [
+        migrations.RunPython(fill_derived_text_blobs, unfill_derived_text_blobs),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-18 20:27
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trove', '0017_fill_derived_text_blobs'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='derivedindexcard',
+            name='derived_text',
+        ),
+        migrations.AlterField(
+            model_name='derivedindexcard',
+            name='derived_blob',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='+', to='trove.derivedtextblob'),
+        ),
+    ]
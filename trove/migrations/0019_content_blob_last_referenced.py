@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trove', '0018_derived_text_blob_required'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='derivedtextblob',
+            name='last_referenced',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name='turtleblob',
+            name='last_referenced',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-18 20:31
+
+import trove.models.content_blob
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trove', '0019_content_blob_last_referenced'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='turtleblob',
+            name='packed_tripledict',
+            field=trove.models.content_blob.CompressedTextField(null=True),
+        ),
+    ]
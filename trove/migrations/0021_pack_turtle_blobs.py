@@ -0,0 +1,88 @@
+# Generated by Django 5.2.18 on 2026-10-19 10:02
+
+import json
+from typing import Any
+import zlib
+
+from django.db import migrations
+from primitive_metadata import primitive_rdf as rdf
+
+
+_CHUNK_SIZE = 1000
+
+
+class _PackingError(ValueError):
+    pass
+
+
+def _pack_tripledict(tripledict: rdf.RdfTripleDictionary) -> str:
+    # (same as `trove.util.packed_rdf.pack_tripledict` at version 1, frozen here)
+    _iri_indexes: dict[str, int] = {}
+
+    def _iri(iri: str) -> int:
+        try:
+            return _iri_indexes[iri]
+        except KeyError:
+            _iri_indexes[iri] = _index = len(_iri_indexes)
+            return _index
+
+    def _obj(obj: rdf.RdfObject) -> int | list[Any] | dict[str, Any]:
+        if isinstance(obj, str):
+            return _iri(obj)
+        if isinstance(obj, rdf.Literal):
+            return [obj.unicode_value, sorted(map(_iri, obj.datatype_iris))]
+        if isinstance(obj, frozenset):  # blanknode
+            return {'b': [[_iri(_pred), _obj(_nested_obj)] for _pred, _nested_obj in obj]}
+        raise _PackingError(f'cannot pack {obj!r} (of type {type(obj).__name__})')
+
+    _graph = [
+        [_iri(_subj), [
+            [_iri(_pred), [_obj(_o) for _o in _objs]]
+            for _pred, _objs in _twopledict.items()
+        ]]
+        for _subj, _twopledict in tripledict.items()
+    ]
+    return json.dumps(
+        {'v': 1, 'iris': list(_iri_indexes.keys()), 'graph': _graph},
+        separators=(',', ':'),
+    )
+
+
+def pack_turtle_blobs(apps: Any, schema_editor: Any) -> None:
+    # store pre-parsed rdf for every blob without it (so reads never need turtle);
+    # in chunks, each committed on its own (non-atomic migration) -- may be stopped
+    # and run again, picking up where it left off
+    TurtleBlob = apps.get_model('trove', 'TurtleBlob')
+    _last_pk = 0
+    while True:
+        _chunk = list(
+            TurtleBlob.objects
+            .filter(pk__gt=_last_pk, packed_tripledict__isnull=True)
+            .order_by('pk')
+            .values_list('pk', 'content')  # (compressed)
+            [:_CHUNK_SIZE]
+        )
+        if not _chunk:
+            break
+        _last_pk = _chunk[-1][0]
+        _packed_blobs = []
+        for _pk, _compressed in _chunk:
+            _turtle = zlib.decompress(_compressed).decode()
+            try:
+                _packed = _pack_tripledict(rdf.tripledict_from_turtle(_turtle))
+            except _PackingError:
+                continue  # just turtle, then
+            _packed_blobs.append(TurtleBlob(pk=_pk, packed_tripledict=_packed))  # (compressed by the field)
+        TurtleBlob.objects.bulk_update(_packed_blobs, ['packed_tripledict'])
+
+
+class Migration(migrations.Migration):
+    atomic = False  # commit each chunk (without locking the whole table for the duration)
+
+    dependencies = [
+        ('trove', '0020_turtle_blob_packed_tripledict'),
+    ]
+
+    operations = [
+        migrations.RunPython(pack_turtle_blobs, migrations.RunPython.noop),
+    ]
@@ -1,12 +1,16 @@
 __all__ = (
     'ArchivedResourceDescription',
+    'ContentBlob',
     'DerivedIndexcard',
+    'DerivedTextBlob',
     'Indexcard',
     'LatestResourceDescription',
     'ResourceDescription',
     'ResourceIdentifier',
     'SupplementaryResourceDescription',
+    'TurtleBlob',
 )
+from .content_blob import ContentBlob, DerivedTextBlob, TurtleBlob
 from .derived_indexcard import DerivedIndexcard
 from .indexcard import Indexcard
 from .resource_description import (
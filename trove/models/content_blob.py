@@ -0,0 +1,259 @@
+'''content-addressed, compressed storage for (possibly large, often repeated) text
+
+a `ContentBlob` holds text compressed, stored once by checksum, and shared by every
+row that references it -- models with a foreign key to a blob may expose its text with
+`blob_text_property` (readable and settable like a text field; new text is stored
+as a blob on `save` or `bulk_create`, if the model inherits `BlobTextModel`)
+'''
+from __future__ import annotations
+from collections.abc import Collection, Iterable
+import datetime
+from typing import Any
+import zlib
+
+from django.db import models, transaction
+from django.db.models.query_utils import DeferredAttribute
+from primitive_metadata import primitive_rdf as rdf
+
+from share.util.checksum_iri import ChecksumIri
+from trove.util.django import pk_chunked
+from trove.util.packed_rdf import PackingError, pack_tripledict, unpack_tripledict
+
+__all__ = (
+    'ContentBlob',
+    'DerivedTextBlob',
+    'TurtleBlob',
+)
+
+
+def text_checksum_iri(text: str) -> str:
+    return str(ChecksumIri.digest('sha-256', salt='', data=text))
+
+
+def decompress_text(compressed: bytes | memoryview) -> str:
+    return zlib.decompress(compressed).decode()
+
+
+class _LazilyDecompressedAttribute(DeferredAttribute):
+    # decompress a `CompressedTextField` value when first read from the instance
+    def __get__(self, instance, cls=None):
+        if instance is None:
+            return self
+        _value = super().__get__(instance, cls)
+        if isinstance(_value, (bytes, memoryview)):
+            _value = instance.__dict__[self.field.attname] = decompress_text(_value)
+        return _value
+
+
+class CompressedTextField(models.BinaryField):
+    '''text, stored zlib-compressed
+
+    loaded compressed, and decompressed only when first read from the model instance
+    (so a blob joined with `select_related` costs nothing until its text is used) --
+    `values` and annotations get the compressed bytes (see `decompressed`)
+    '''
+    descriptor_class = _LazilyDecompressedAttribute
+
+    def get_db_prep_value(self, value, connection, prepared=False):
+        if isinstance(value, str):
+            value = zlib.compress(value.encode())
+        return super().get_db_prep_value(value, connection, prepared)
+
+    def to_python(self, value: bytes | memoryview | str | None) -> str | None:
+        if isinstance(value, (bytes, memoryview)):
+            return decompress_text(value)
+        return value  # already text (or None)
+
+    def value_to_string(self, obj):
+        return self.value_from_object(obj)
+
+
+class _DecompressingField(models.BinaryField):
+    def from_db_value(self, value: bytes | memoryview | None, expression: Any, connection: Any) -> str | None:
+        return None if value is None else decompress_text(value)
+
+
+def decompressed(expression: Any) -> models.Expression:
+    '''the text of a `CompressedTextField` (e.g. across a relation) in `values` or
+    an annotation, decompressed when loaded
+    '''
+    return models.ExpressionWrapper(expression, output_field=_DecompressingField())
+
+
+class ContentBlobManager(models.Manager):
+    def get_or_create_for_text(self, text: str) -> ContentBlob:
+        return self.get_or_create_for_texts([text])[text]
+
+    def get_or_create_for_texts(self, texts: Iterable[str]) -> dict[str, ContentBlob]:
+        '''like `get_or_create_for_text` for many at once (in one query), keyed by text
+
+        an already-stored blob is marked as referenced again (see `delete_unreferenced`)
+        and locked until the end of the transaction (in which it's presumably referenced)
+        '''
+        _text_by_checksum_iri = {
+            text_checksum_iri(_text): _text
+            for _text in texts
+        }
+        _blobs = self.bulk_create(
+            [  # (in a consistent order, so concurrent upserts lock rows in the same order)
+                self.model(checksum_iri=_checksum_iri, content=_text_by_checksum_iri[_checksum_iri])
+                for _checksum_iri in sorted(_text_by_checksum_iri)
+            ],
+            update_conflicts=True,  # already stored
+            unique_fields=['checksum_iri'],
+            update_fields=['last_referenced'],
+        )
+        return {
+            _text_by_checksum_iri[_blob.checksum_iri]: _blob
+            for _blob in _blobs
+        }
+
+    def unreferenced(self) -> models.QuerySet:
+        '''blobs no longer referenced by any row (safe to delete)'''
+        _queryset = self.all()
+        for _relation in self.model._meta.get_fields(include_hidden=True):
+            if not _relation.one_to_many:  # (reverse foreign keys only)
+                continue
+            _queryset = _queryset.exclude(models.Exists(
+                _relation.related_model._base_manager.filter(**{
+                    _relation.field.attname: models.OuterRef('pk'),
+                }),
+            ))
+        return _queryset
+
+    def delete_unreferenced(self, *, referenced_before: datetime.datetime, chunk_size: int = 1000) -> int:
+        '''delete blobs no longer referenced, in chunks; returns how many deleted
+
+        only blobs last referenced (created or reused) before `referenced_before` --
+        a blob referenced since may be about to be referenced again, by a row not
+        yet saved (or not yet committed)
+        '''
+        _deleted_count = 0
+        _unreferenced = self.unreferenced().filter(last_referenced__lt=referenced_before)
+        for _pk_chunk in pk_chunked(_unreferenced, chunk_size):
+            with transaction.atomic():
+                # (filtered again, in case referenced since -- skipping any blob
+                # locked by a transaction about to reference it)
+                _deletable_pks = list(
+                    _unreferenced
+                    .filter(pk__in=_pk_chunk)
+                    .select_for_update(skip_locked=True)
+                    .values_list('pk', flat=True)
+                )
+                (_chunk_deleted_count, _) = self.filter(pk__in=_deletable_pks).delete()
+            _deleted_count += _chunk_deleted_count
+        return _deleted_count
+
+
+class ContentBlob(models.Model):
+    objects = ContentBlobManager()
+
+    # auto:
+    created = models.DateTimeField(auto_now_add=True)
+    last_referenced = models.DateTimeField(auto_now=True)  # (updated when reused)
+
+    # required:
+    checksum_iri = models.TextField(unique=True)  # sha-256 of the (uncompressed) text
+    content: str = CompressedTextField()
+
+    class Meta:
+        abstract = True
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__qualname__}({self.pk}, "{self.checksum_iri}")'
+
+    def __str__(self) -> str:
+        return repr(self)
+
+
+class TurtleBlob(ContentBlob):
+    # rdf as turtle, for resource descriptions
+
+    # optional: the same rdf, pre-parsed (see `trove.util.packed_rdf`) -- quicker
+    # to read than turtle, which remains the source of truth
+    packed_tripledict: str | None = CompressedTextField(null=True)
+
+    def as_rdf_tripledict(self) -> rdf.RdfTripleDictionary:
+        if self.packed_tripledict is not None:
+            try:
+                return unpack_tripledict(self.packed_tripledict)
+            except PackingError:
+                pass  # packed some other way (e.g. by a later version); parse turtle instead
+        return rdf.tripledict_from_turtle(self.content)  # (loads `content`, if deferred)
+
+    def pack_tripledict(self) -> None:
+        '''store the pre-parsed rdf (if not already), as parsed from this blob's turtle'''
+        if self.packed_tripledict is not None:
+            return
+        try:
+            self.packed_tripledict = pack_tripledict(rdf.tripledict_from_turtle(self.content))
+        except PackingError:
+            return  # just turtle, then
+        self.save(update_fields=['packed_tripledict'])
+
+
+class DerivedTextBlob(ContentBlob):
+    # derived text (e.g. json or xml), for derived indexcards
+    pass
+
+
+###
+# for models that reference blobs
+
+def blob_text_property(blob_field_name: str, *, doc: str = '') -> property:
+    '''a property for the text of the blob referenced by the given foreign key'''
+    def _get(instance: BlobTextModel) -> str:
+        _unsaved = instance._unsaved_blob_texts.get(blob_field_name)
+        if _unsaved is not None:
+            return _unsaved
+        return getattr(instance, blob_field_name).content
+
+    def _set(instance: BlobTextModel, text: str) -> None:
+        instance._unsaved_blob_texts[blob_field_name] = text
+
+    return property(_get, _set, doc=doc)
+
+
+class BlobTextQuerySet(models.QuerySet):
+    def bulk_create(self, objs, *args, **kwargs):
+        _objs = list(objs)
+        store_unsaved_blob_texts(_objs)
+        return super().bulk_create(_objs, *args, **kwargs)
+
+
+class BlobTextModel(models.Model):
+    objects = BlobTextQuerySet.as_manager()
+
+    class Meta:
+        abstract = True
+
+    @property
+    def _unsaved_blob_texts(self) -> dict[str, str]:  # by blob field name
+        return self.__dict__.setdefault('_unsaved_blob_text_dict', {})
+
+    def save(self, *args, **kwargs) -> None:
+        _stored_fields = store_unsaved_blob_texts([self])
+        if _stored_fields and kwargs.get('update_fields') is not None:
+            kwargs['update_fields'] = {*kwargs['update_fields'], *_stored_fields}
+        super().save(*args, **kwargs)
+
+
+def store_unsaved_blob_texts(instances: Collection[BlobTextModel]) -> set[str]:
+    '''store any text set on the given instances (of one model) as blobs (in bulk, by field)
+
+    returns the names of blob fields newly set
+    '''
+    _unsaved_by_field: dict[str, list[BlobTextModel]] = {}
+    for _instance in instances:
+        for _field_name in _instance._unsaved_blob_texts:
+            _unsaved_by_field.setdefault(_field_name, []).append(_instance)
+    for _field_name, _unsaved_instances in _unsaved_by_field.items():
+        _model = type(_unsaved_instances[0])
+        _blob_model = _model._meta.get_field(_field_name).related_model
+        _blobs = _blob_model.objects.get_or_create_for_texts(
+            _instance._unsaved_blob_texts[_field_name]
+            for _instance in _unsaved_instances
+        )
+        for _instance in _unsaved_instances:
+            setattr(_instance, _field_name, _blobs[_instance._unsaved_blob_texts.pop(_field_name)])
+    return set(_unsaved_by_field.keys())
@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING
 from django.db import models
 from primitive_metadata import primitive_rdf as rdf
 
+from trove.models.content_blob import BlobTextModel, blob_text_property
 from trove.models.resource_identifier import ResourceIdentifier
 if TYPE_CHECKING:
     from trove.derive._base import IndexcardDeriver
@@ -11,7 +12,7 @@ if TYPE_CHECKING:
 __all__ = ('DerivedIndexcard',)
 
 
-class DerivedIndexcard(models.Model):
+class DerivedIndexcard(BlobTextModel):
     # auto:
     created = models.DateTimeField(auto_now_add=True)
     modified = models.DateTimeField(auto_now=True)
@@ -24,7 +25,11 @@ class DerivedIndexcard(models.Model):
     )
     deriver_identifier = models.ForeignKey(ResourceIdentifier, on_delete=models.PROTECT, related_name='+')
     derived_checksum_iri = models.TextField()
-    derived_text = models.TextField()  # TODO: store elsewhere by checksum
+    derived_blob = models.ForeignKey(  # see `derived_text`
+        'trove.DerivedTextBlob',
+        on_delete=models.PROTECT,
+        related_name='+',
+    )
 
     class Meta:
         constraints = [
@@ -34,6 +39,11 @@ class DerivedIndexcard(models.Model):
             ),
         ]
 
+    derived_text = blob_text_property(
+        'derived_blob',
+        doc='the derived text (stored compressed, once per checksum, in a `DerivedTextBlob`)',
+    )
+
     def __repr__(self) -> str:
         return f'<{self.__class__.__qualname__}({self.pk}, {self.upriver_indexcard.uuid}, "{self.deriver_identifier.sufficiently_unique_iri}")'
 
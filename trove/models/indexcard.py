@@ -1,4 +1,5 @@
 from __future__ import annotations
+from collections.abc import Collection
 import datetime
 import uuid
 from typing import Any
@@ -9,7 +10,6 @@ from django.utils import timezone
 from primitive_metadata import primitive_rdf as rdf
 
 from share import models as share_db  # TODO: break this dependency
-from share.util.checksum_iri import ChecksumIri
 from trove.exceptions import DigestiveError
 from trove.models.derived_indexcard import DerivedIndexcard
 from trove.models.resource_description import (
@@ -19,6 +19,7 @@ from trove.models.resource_description import (
     SupplementaryResourceDescription,
 )
 from trove.models.resource_identifier import ResourceIdentifier
+from trove.models.content_blob import text_checksum_iri
 from trove.vocab.namespaces import RDF
 from trove.vocab.trove import trove_indexcard_iri, trove_indexcard_namespace
 
@@ -31,6 +32,20 @@ class IndexcardManager(models.Manager['Indexcard']):
         _uuid = rdf.iri_minus_namespace(iri, namespace=trove_indexcard_namespace())
         return self.get(uuid=_uuid)
 
+    @transaction.atomic
+    def pls_delete_ids(self, indexcard_ids: Collection[int]) -> None:
+        '''like `Indexcard.pls_delete` for many index cards at once, in a few queries
+
+        (does not notify indexes -- that's up to the caller)
+        '''
+        _now = timezone.now()
+        (  # (`update` skips `auto_now`, so set `modified` too, as `save` would)
+            self.filter(id__in=indexcard_ids, deleted__isnull=True)
+            .update(deleted=_now, modified=_now)
+        )
+        LatestResourceDescription.objects.filter(indexcard_id__in=indexcard_ids).delete()
+        DerivedIndexcard.objects.filter(upriver_indexcard_id__in=indexcard_ids).delete()
+
     @transaction.atomic
     def save_indexcards_from_tripledicts(
         self, *,
@@ -38,6 +53,7 @@ class IndexcardManager(models.Manager['Indexcard']):
         rdf_tripledicts_by_focus_iri: dict[str, rdf.RdfTripleDictionary],
         restore_deleted: bool = False,
         expiration_date: datetime.date | None = None,
+        raw_record_checksum_iri: str = '',
     ) -> list['Indexcard']:
         assert not suid.is_supplementary
         _indexcards = []
@@ -49,6 +65,7 @@ class IndexcardManager(models.Manager['Indexcard']):
                 focus_iri=_focus_iri,
                 restore_deleted=restore_deleted,
                 expiration_date=expiration_date,
+                raw_record_checksum_iri=raw_record_checksum_iri,
             )
             _focus_identifier_ids = {str(_fid.pk) for _fid in _indexcard.focus_identifier_set.all()}
             if not _seen_focus_identifier_ids.isdisjoint(_focus_identifier_ids):
@@ -105,16 +122,18 @@ class IndexcardManager(models.Manager['Indexcard']):
         focus_iri: str,
         restore_deleted: bool = False,
         expiration_date: datetime.date | None = None,
+        raw_record_checksum_iri: str = '',
     ) -> Indexcard:
         assert not suid.is_supplementary
         _focus_identifier_set = (
             ResourceIdentifier.objects
             .save_equivalent_identifier_set(rdf_tripledict, focus_iri)
         )
-        _focustype_identifier_set = [  # TODO: require non-zero?
-            ResourceIdentifier.objects.get_or_create_for_iri(_iri)
-            for _iri in rdf_tripledict[focus_iri].get(RDF.type, ())
-        ]
+        _focustype_identifier_set = list(  # TODO: require non-zero?
+            ResourceIdentifier.objects
+            .get_or_create_for_iris(rdf_tripledict[focus_iri].get(RDF.type, ()))
+            .values()
+        )
         _indexcard: Indexcard | None = Indexcard.objects.filter(
             source_record_suid=suid,
             focus_identifier_set__in=_focus_identifier_set,
@@ -126,7 +145,12 @@ class IndexcardManager(models.Manager['Indexcard']):
             _indexcard.save()
         _indexcard.focus_identifier_set.set(_focus_identifier_set)
         _indexcard.focustype_identifier_set.set(_focustype_identifier_set)
-        _indexcard.update_resource_description(focus_iri, rdf_tripledict, expiration_date=expiration_date)
+        _indexcard.update_resource_description(
+            focus_iri,
+            rdf_tripledict,
+            expiration_date=expiration_date,
+            raw_record_checksum_iri=raw_record_checksum_iri,
+        )
         return _indexcard
 
     @transaction.atomic
@@ -191,7 +215,12 @@ class Indexcard(models.Model):
     def latest_resource_description(self) -> LatestResourceDescription:
         '''convenience for the "other side" of LatestResourceDescription.indexcard
         '''
-        return self.trove_latestresourcedescription_set.get()  # may raise DoesNotExist
+        return (  # may raise DoesNotExist
+            self.trove_latestresourcedescription_set
+            .select_related('turtle_blob')
+            .defer('turtle_blob__content')  # (rdf read pre-parsed, when packed)
+            .get()
+        )
 
     @property
     def archived_description_set(self) -> Any:
@@ -244,6 +273,7 @@ class Indexcard(models.Model):
         focus_iri: str,
         rdf_tripledict: rdf.RdfTripleDictionary,
         expiration_date: datetime.date | None = None,
+        raw_record_checksum_iri: str = '',
     ) -> ResourceDescription:
         if focus_iri not in rdf_tripledict:
             raise DigestiveError(f'expected {focus_iri} in {set(rdf_tripledict.keys())}')
@@ -259,6 +289,7 @@ class Indexcard(models.Model):
         )
         if (not _archived_created) and (_archived.rdf_as_turtle != _rdf_as_turtle):
             raise DigestiveError(f'hash collision? {_archived}\n===\n{_rdf_as_turtle}')
+        _archived.turtle_blob.pack_tripledict()  # for quicker reading
         if not self.deleted:
             _latest_resource_description, _created = LatestResourceDescription.objects.update_or_create(
                 indexcard=self,
@@ -267,6 +298,7 @@ class Indexcard(models.Model):
                     'rdf_as_turtle': _rdf_as_turtle,
                     'focus_iri': focus_iri,
                     'expiration_date': expiration_date,
+                    'raw_record_checksum_iri': raw_record_checksum_iri,
                 },
             )
             return _latest_resource_description
@@ -293,6 +325,7 @@ class Indexcard(models.Model):
                 'expiration_date': expiration_date,
             },
         )
+        _supplement_rdf.turtle_blob.pack_tripledict()  # for quicker reading
         return _supplement_rdf
 
 
@@ -302,7 +335,4 @@ class Indexcard(models.Model):
 def _turtlify(rdf_tripledict: rdf.RdfTripleDictionary) -> tuple[str, str]:
     '''return turtle serialization and checksum iri of that serialization'''
     _rdf_as_turtle = rdf.turtle_from_tripledict(rdf_tripledict)
-    _turtle_checksum_iri = str(
-        ChecksumIri.digest('sha-256', salt='', data=_rdf_as_turtle),
-    )
-    return (_rdf_as_turtle, _turtle_checksum_iri)
+    return (_rdf_as_turtle, text_checksum_iri(_rdf_as_turtle))
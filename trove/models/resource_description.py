@@ -1,9 +1,14 @@
 from __future__ import annotations
+import collections
 import datetime
+import threading
+import types
 
 from django.db import models
 from primitive_metadata import primitive_rdf as rdf
 
+from trove.models.content_blob import BlobTextModel, blob_text_property
+
 __all__ = (
     'ArchivedResourceDescription',
     'ResourceDescription',
@@ -12,7 +17,15 @@ __all__ = (
 )
 
 
-class ResourceDescription(models.Model):
+# process-local memo of parsed rdf, keyed by turtle checksums of a description and its
+# supplements (see `ResourceDescription.as_shared_rdfdoc_with_supplements`)
+# (each deeply frozen, since shared)
+_PARSED_TRIPLEDICT_MEMO: collections.OrderedDict[tuple[str, ...], rdf.RdfTripleDictionary] = collections.OrderedDict()
+_PARSED_TRIPLEDICT_MEMO_MAXSIZE = 64
+_PARSED_TRIPLEDICT_MEMO_LOCK = threading.Lock()
+
+
+class ResourceDescription(BlobTextModel):
     # auto:
     created = models.DateTimeField(auto_now_add=True)
     modified = models.DateTimeField(auto_now=True)
@@ -25,7 +38,11 @@ class ResourceDescription(models.Model):
     )
     turtle_checksum_iri = models.TextField(db_index=True)
     focus_iri = models.TextField()  # exact iri used in rdf_as_turtle
-    rdf_as_turtle = models.TextField()  # TODO: store elsewhere by checksum
+    turtle_blob = models.ForeignKey(  # see `rdf_as_turtle`
+        'trove.TurtleBlob',
+        on_delete=models.PROTECT,
+        related_name='+',
+    )
 
     # optional:
     expiration_date = models.DateField(
@@ -37,6 +54,11 @@ class ResourceDescription(models.Model):
     class Meta:
         abstract = True
 
+    rdf_as_turtle = blob_text_property(
+        'turtle_blob',
+        doc='the described rdf, as turtle (stored compressed, once per checksum, in a `TurtleBlob`)',
+    )
+
     @property
     def is_expired(self) -> bool:
         return (
@@ -45,7 +67,9 @@ class ResourceDescription(models.Model):
         )
 
     def as_rdf_tripledict(self) -> rdf.RdfTripleDictionary:
-        return rdf.tripledict_from_turtle(self.rdf_as_turtle)
+        if 'turtle_blob' in self._unsaved_blob_texts:  # not yet stored
+            return rdf.tripledict_from_turtle(self.rdf_as_turtle)
+        return self.turtle_blob.as_rdf_tripledict()  # pre-parsed, if possible
 
     def as_quoted_graph(self) -> rdf.QuotedGraph:
         return rdf.QuotedGraph(
@@ -55,8 +79,37 @@ class ResourceDescription(models.Model):
 
     def as_rdfdoc_with_supplements(self) -> rdf.RdfGraph:
         '''build an rdf graph composed of this rdf and all current card supplements'''
+        return self._build_rdfdoc_with_supplements(
+            self.indexcard.supplementary_description_set.all(),
+        )
+
+    def as_shared_rdfdoc_with_supplements(self) -> rdf.RdfGraph:
+        '''like `as_rdfdoc_with_supplements`, but parsed only once per process for the
+        same turtle checksums -- the returned graph is shared, so read-only (its tripledict
+        deeply frozen: mappings are read-only proxies and object sets are frozensets)
+        '''
+        _supplements = list(self.indexcard.supplementary_description_set.all())
+        _memo_key = (
+            self.turtle_checksum_iri,
+            *sorted(_supplement.turtle_checksum_iri for _supplement in _supplements),
+        )
+        if not all(_memo_key):  # missing checksums; cannot share
+            return self._build_rdfdoc_with_supplements(_supplements)
+        with _PARSED_TRIPLEDICT_MEMO_LOCK:
+            _tripledict = _PARSED_TRIPLEDICT_MEMO.get(_memo_key)
+            if _tripledict is not None:
+                _PARSED_TRIPLEDICT_MEMO.move_to_end(_memo_key)
+        if _tripledict is None:
+            _tripledict = _frozen_tripledict(self._build_rdfdoc_with_supplements(_supplements).tripledict)
+            with _PARSED_TRIPLEDICT_MEMO_LOCK:
+                _PARSED_TRIPLEDICT_MEMO[_memo_key] = _tripledict
+                while len(_PARSED_TRIPLEDICT_MEMO) > _PARSED_TRIPLEDICT_MEMO_MAXSIZE:
+                    _PARSED_TRIPLEDICT_MEMO.popitem(last=False)
+        return rdf.RdfGraph(_tripledict)
+
+    def _build_rdfdoc_with_supplements(self, supplements) -> rdf.RdfGraph:
         _rdfdoc = rdf.RdfGraph(self.as_rdf_tripledict())
-        for _supplement in self.indexcard.supplementary_description_set.all():
+        for _supplement in supplements:
             _rdfdoc.add_tripledict(_supplement.as_rdf_tripledict())
         return _rdfdoc
 
@@ -67,8 +120,23 @@ class ResourceDescription(models.Model):
         return repr(self)
 
 
+def _frozen_tripledict(tripledict: rdf.RdfTripleDictionary) -> rdf.RdfTripleDictionary:
+    return types.MappingProxyType({
+        _subject: types.MappingProxyType({
+            _predicate: frozenset(_objects)
+            for _predicate, _objects in _twopledict.items()
+        })
+        for _subject, _twopledict in tripledict.items()
+    })
+
+
 class LatestResourceDescription(ResourceDescription):
     # just the most recent version of this indexcard
+
+    # checksum of the raw record this was extracted from (empty if unknown)
+    # -- lets an identical re-push skip extraction entirely
+    raw_record_checksum_iri = models.TextField(blank=True, default='')
+
     class Meta:
         constraints = [
             models.UniqueConstraint(
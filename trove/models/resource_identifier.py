@@ -1,11 +1,15 @@
 from __future__ import annotations
+import json
 import typing
 
 from django.core.exceptions import ValidationError
 from django.contrib.postgres.fields import ArrayField
 from django.db import models
+from django.db import transaction
 from django.db.models import QuerySet
 from django.db.models.functions import Substr, StrIndex
+from django.db.models.signals import post_delete, post_migrate
+from django.dispatch import receiver
 from primitive_metadata import primitive_rdf
 
 from trove import exceptions as trove_exceptions
@@ -53,6 +57,58 @@ def validate_sufficiently_unique_iri(suffuniq_iri: str) -> None:
         raise ValidationError('need more iri beyond a scheme')
 
 
+# process-local cache of primary keys for a few constant iris
+# (see `ResourceIdentifierManager.get_or_create_cached_id_for_iri`)
+# -- cleared on delete and after migrate/flush (see receivers below), but
+#    not after rows are removed otherwise (e.g. raw sql, truncate)
+_CACHED_IDS_BY_IRI: dict[str, int] = {}
+
+
+# upsert many identifiers in one statement, given a json list of
+# {"suffuniq_iri": str, "scheme_list": [str], "raw_iri_list": [str]}
+# -- new schemes and raw iris are appended (in order) to existing identifiers,
+#    which are only written if there's something new to append
+# -- returns all identifiers (including unchanged ones) for the given iris
+_UPSERT_IDENTIFIERS_SQL = '''
+WITH _input AS (
+    SELECT
+        _in.suffuniq_iri,
+        ARRAY(SELECT jsonb_array_elements_text(_in.scheme_list)) AS scheme_list,
+        ARRAY(SELECT jsonb_array_elements_text(_in.raw_iri_list)) AS raw_iri_list
+    FROM jsonb_to_recordset(%s::jsonb) AS _in(suffuniq_iri text, scheme_list jsonb, raw_iri_list jsonb)
+), _upserted AS (
+    INSERT INTO {table} AS _ident (created, modified, sufficiently_unique_iri, scheme_list, raw_iri_list)
+    SELECT now(), now(), suffuniq_iri, scheme_list, raw_iri_list
+    FROM _input
+    ORDER BY suffuniq_iri  -- consistent lock order, to avoid deadlocks
+    ON CONFLICT (sufficiently_unique_iri) DO UPDATE SET
+        modified = EXCLUDED.modified,
+        scheme_list = _ident.scheme_list || ARRAY(
+            SELECT _scheme
+            FROM unnest(EXCLUDED.scheme_list) WITH ORDINALITY AS _new(_scheme, _ord)
+            WHERE _scheme <> ALL(_ident.scheme_list)
+            ORDER BY _ord
+        ),
+        raw_iri_list = _ident.raw_iri_list || ARRAY(
+            SELECT _raw_iri
+            FROM unnest(EXCLUDED.raw_iri_list) WITH ORDINALITY AS _new(_raw_iri, _ord)
+            WHERE _raw_iri <> ALL(_ident.raw_iri_list)
+            ORDER BY _ord
+        )
+    WHERE NOT (
+        EXCLUDED.scheme_list <@ _ident.scheme_list
+        AND EXCLUDED.raw_iri_list <@ _ident.raw_iri_list
+    )
+    RETURNING _ident.*
+)
+SELECT * FROM _upserted
+UNION ALL
+SELECT * FROM {table}
+WHERE sufficiently_unique_iri IN (SELECT suffuniq_iri FROM _input)
+    AND sufficiently_unique_iri NOT IN (SELECT sufficiently_unique_iri FROM _upserted)
+'''
+
+
 class ResourceIdentifierManager(models.Manager["ResourceIdentifier"]):
     def queryset_for_iri(self, iri: str) -> QuerySet[ResourceIdentifier]:
         return self.queryset_for_iris((iri,))
@@ -88,18 +144,108 @@ class ResourceIdentifierManager(models.Manager["ResourceIdentifier"]):
             _identifier.save()
         return _identifier
 
+    def get_or_create_for_iris(self, iris: typing.Iterable[str]) -> dict[str, ResourceIdentifier]:
+        '''like `get_or_create_for_iri`, but for many iris at once (in one query)
+
+        returns a dictionary with each given iri as key, its ResourceIdentifier as value
+        '''
+        # may raise if invalid
+        _suffuniq_iri_by_iri: dict[str, str] = {}
+        _schemes_and_iris_by_suffuniq_iri: dict[str, tuple[list[str], list[str]]] = {}
+        for _iri in iris:
+            if _iri in _suffuniq_iri_by_iri:
+                continue
+            (_suffuniq_iri, _scheme) = get_sufficiently_unique_iri_and_scheme(_iri)
+            _suffuniq_iri_by_iri[_iri] = _suffuniq_iri
+            (_schemes, _raw_iris) = _schemes_and_iris_by_suffuniq_iri.setdefault(_suffuniq_iri, ([], []))
+            if _scheme not in _schemes:
+                _schemes.append(_scheme)
+            _raw_iris.append(_iri)
+        if not _suffuniq_iri_by_iri:
+            return {}
+        _input_json = json.dumps([
+            {'suffuniq_iri': _suffuniq_iri, 'scheme_list': _schemes, 'raw_iri_list': _raw_iris}
+            for _suffuniq_iri, (_schemes, _raw_iris) in _schemes_and_iris_by_suffuniq_iri.items()
+        ])
+        _identifiers_by_suffuniq_iri = {
+            _identifier.sufficiently_unique_iri: _identifier
+            for _identifier in self.raw(
+                _UPSERT_IDENTIFIERS_SQL.format(table=self.model._meta.db_table),
+                [_input_json],
+            )
+        }
+        # an identifier inserted concurrently (committed while this upsert waited on it)
+        # is neither returned by the upsert (if it needed no update) nor visible within
+        # that statement's snapshot -- select again, in a new statement that can see it
+        _missing_suffuniq_iris = _schemes_and_iris_by_suffuniq_iri.keys() - _identifiers_by_suffuniq_iri.keys()
+        if _missing_suffuniq_iris:
+            _identifiers_by_suffuniq_iri.update(
+                (_identifier.sufficiently_unique_iri, _identifier)
+                for _identifier in self.filter(sufficiently_unique_iri__in=_missing_suffuniq_iris)
+            )
+        return {
+            _iri: _identifiers_by_suffuniq_iri[_suffuniq_iri]
+            for _iri, _suffuniq_iri in _suffuniq_iri_by_iri.items()
+        }
+
+    def cached_id_for_iri(self, iri: str) -> int | None:
+        '''get the primary key of the ResourceIdentifier for the given iri, or None if there is none
+
+        read-only; see `get_or_create_cached_id_for_iri` for caveats
+        '''
+        try:
+            return _CACHED_IDS_BY_IRI[iri]
+        except KeyError:
+            pass
+        _id = (
+            self.queryset_for_iri(iri)
+            .order_by('id')  # (at most one, given unique `sufficiently_unique_iri`)
+            .values_list('id', flat=True)
+            .first()
+        )
+        if _id is not None:
+            self._cache_id_on_commit(iri, _id)
+        return _id
+
+    def get_or_create_cached_id_for_iri(self, iri: str) -> int:
+        '''get the primary key of the ResourceIdentifier for the given iri, creating if need be
+
+        cached in-process once committed -- meant for a handful of constant iris
+        used in hot paths (like deriver iris), not for arbitrary iris
+
+        the cache is forgotten when any ResourceIdentifier is deleted in this process
+        (or after `migrate` or `flush`, as between TransactionTestCase tests), but not
+        in other processes, nor when rows are removed some other way (raw sql, truncate)
+        -- identifiers for these constant iris are not expected to be deleted; if one
+        is, restart processes that may have cached it (or call `forget_cached_ids`),
+        lest they reference an id that no longer exists
+        '''
+        _id = self.cached_id_for_iri(iri)
+        if _id is None:
+            _id = self.get_or_create_for_iris([iri])[iri].pk
+            self._cache_id_on_commit(iri, _id)
+        return _id
+
+    def forget_cached_ids(self) -> None:
+        _CACHED_IDS_BY_IRI.clear()
+
+    def _cache_id_on_commit(self, iri: str, id_: int) -> None:
+        # only cache once committed, lest a rollback leave a bogus id in the cache
+        transaction.on_commit(lambda: _CACHED_IDS_BY_IRI.__setitem__(iri, id_))
+
     def save_equivalent_identifier_set(
         self,
         tripledict: primitive_rdf.RdfTripleDictionary,
         focus_iri: str,
     ) -> list['ResourceIdentifier']:
-        _identifier_set = [self.get_or_create_for_iri(focus_iri)]
-        _identifier_set.extend(
-            self.get_or_create_for_iri(_sameas_iri)
+        _equivalent_iris = [focus_iri]
+        _equivalent_iris.extend(
+            _sameas_iri
             for _sameas_iri in tripledict[focus_iri].get(OWL.sameAs, ())
             if _sameas_iri != focus_iri
         )
-        return _identifier_set
+        _identifiers_by_iri = self.get_or_create_for_iris(_equivalent_iris)
+        return [_identifiers_by_iri[_iri] for _iri in _equivalent_iris]
 
 
 class ResourceIdentifier(models.Model):
@@ -198,3 +344,14 @@ class ResourceIdentifier(models.Model):
             if _is_equivalent:
                 return _iri
         raise trove_exceptions.IriMismatch(f'could not find "{_identifier_iri}" or equivalent in {set(tripledict.keys())}')
+
+
+@receiver(post_delete, sender=ResourceIdentifier, dispatch_uid='trove.models.resource_identifier.forget_cached_ids')
+def _forget_cached_ids_on_delete(sender, **kwargs) -> None:
+    ResourceIdentifier.objects.forget_cached_ids()
+
+
+@receiver(post_migrate, dispatch_uid='trove.models.resource_identifier.forget_cached_ids_on_migrate')
+def _forget_cached_ids_on_migrate(sender, **kwargs) -> None:
+    # (sent after `migrate`, and after `flush` truncates every table)
+    ResourceIdentifier.objects.forget_cached_ids()
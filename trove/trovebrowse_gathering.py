@@ -4,7 +4,7 @@ from typing import Any
 from primitive_metadata import gather
 from primitive_metadata import primitive_rdf as rdf
 
-from trove import models as trove_db
+from trove.card_content_loader import CardContentLoader
 from trove.util.iris import get_sufficiently_unique_iri
 from trove.vocab import namespaces as ns
 from trove.vocab import static_vocab
@@ -37,23 +37,20 @@ trovebrowse = gather.GatheringOrganizer(
 
 @trovebrowse.gatherer(ns.FOAF.isPrimaryTopicOf)
 def gather_cards_focused_on(focus: gather.Focus, *, blend_cards: bool) -> GathererGenerator:
-    _identifier_qs = trove_db.ResourceIdentifier.objects.queryset_for_iris(focus.iris)
-    _indexcard_qs = trove_db.Indexcard.objects.filter(focus_identifier_set__in=_identifier_qs)
-    _lrd_qs = (
-        trove_db.LatestResourceDescription.objects
-        .filter(indexcard__in=_indexcard_qs)
-        .select_related('indexcard')
-    )
+    _loaded_cards = CardContentLoader().load_by_focus_iris(focus.iris, deriver_iri=None)
     if blend_cards:
-        for _resource_description in _lrd_qs:
-            yield from rdf.iter_tripleset(_resource_description.as_rdfdoc_with_supplements().tripledict)
-            yield (ns.FOAF.isPrimaryTopicOf, _resource_description.indexcard.get_iri())
+        for _loaded_card in _loaded_cards.values():
+            assert _loaded_card.resource_description is not None
+            # (parsed once per process for the same descriptions; only read here)
+            yield from rdf.iter_tripleset(_loaded_card.resource_description.as_shared_rdfdoc_with_supplements().tripledict)
+            yield (ns.FOAF.isPrimaryTopicOf, _loaded_card.card_iri)
     else:
-        for _resource_description in _lrd_qs:
-            _card_iri = _resource_description.indexcard.get_iri()
+        for _card_iri, _loaded_card in _loaded_cards.items():
+            assert _loaded_card.resource_description is not None
             yield (ns.FOAF.isPrimaryTopicOf, _card_iri)
             yield (_card_iri, ns.RDF.type, ns.TROVE.Indexcard)
-            yield (_card_iri, ns.TROVE.resourceMetadata, _resource_description.as_quoted_graph())
+            # (just the description, without the card link `content` adds for search results)
+            yield (_card_iri, ns.TROVE.resourceMetadata, _loaded_card.resource_description.as_quoted_graph())
 
 
 @trovebrowse.gatherer(ns.TROVE.thesaurusEntry)
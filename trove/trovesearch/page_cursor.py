@@ -9,7 +9,13 @@ import typing
 from trove.exceptions import InvalidPageCursorValue
 from typing import Any
 
-__all__ = ('PageCursor', 'OffsetCursor', 'ReproduciblyRandomSampleCursor')
+__all__ = (
+    'PageCursor',
+    'OffsetCursor',
+    'ReproduciblyRandomSampleCursor',
+    'SearchAfterCursor',
+    'FirstPageThenSearchAfterCursor',
+)
 
 
 MANY_MORE = math.inf
@@ -66,6 +72,9 @@ class PageCursor:
             self.total_count == MANY_MORE or self.total_count >= 0
         )
 
+    def has_unbounded_page_size(self) -> bool:
+        return self.page_size == MANY_MORE
+
     def has_many_more(self) -> bool:
         return self.total_count == MANY_MORE
 
@@ -146,44 +155,113 @@ class ReproduciblyRandomSampleCursor(OffsetCursor):
 
 @dataclasses.dataclass
 class SearchAfterCursor(PageCursor):
+    '''cursor for paging through sorted results, at constant cost per page
+
+    forward after the sort values of the last result on the previous page; back before
+    the sort values of the first result on the next page (searching in reverse order)
+    '''
     # page_size: int (from PageCursor)
     # total_count: int (from PageCursor)
     search_after: list[Any] | None = None
     next_search_after: list[Any] | None = None
-    prev_search_after: list[Any] | None = None
+    pit_id: str | None = None  # for consistent results across pages (a "point in time")
+    start_offset: int = 0  # count of results on previous pages (not used in the search)
+    search_before: list[Any] | None = None  # (instead of `search_after`, paging back)
+    prev_search_before: list[Any] | None = None
+
+    @property
+    def bounded_page_size(self) -> int:
+        # overrides PageCursor
+        _bounded_page_size = super().bounded_page_size
+        if (_bounded_page_size < self.page_size < MANY_MORE):  # streaming a limited count
+            _remaining = self.page_size - self.start_offset
+            _bounded_page_size = int(min(_bounded_page_size, _remaining))
+        return _bounded_page_size
+
+    def is_valid(self) -> bool:
+        return super().is_valid() and (
+            self.page_size <= MAX_PAGE_SIZE
+            or self.start_offset < self.page_size
+        )
 
     def is_first_page(self) -> bool:
-        return self.search_after is None
+        return self.search_after is None and self.search_before is None
+
+    def is_paging_back(self) -> bool:
+        return self.search_before is not None
 
-    def next_cursor(self) -> SearchAfterCursor | None:
+    def next_cursor(self) -> typing.Self | None:
+        if self.next_search_after is None:
+            return None  # last page
         _next = dataclasses.replace(
             self,
             search_after=self.next_search_after,
             next_search_after=None,
+            search_before=None,
+            prev_search_before=None,
+            start_offset=(self.start_offset + self.bounded_page_size),
         )
         return _next if _next.is_valid() else None
 
-    def prev_cursor(self) -> SearchAfterCursor | None:
+    def prev_cursor(self) -> typing.Self | None:
+        if self.prev_search_before is None or not self.is_complete_page:
+            return None  # first page (or streaming)
+        _prev_start_offset = self.start_offset - self.bounded_page_size
+        if _prev_start_offset <= 0:
+            return self.first_cursor()
         _prev = dataclasses.replace(
             self,
-            search_after=self.prev_search_after,
-            next_search_after=self.search_after,
+            search_after=None,
+            next_search_after=None,
+            search_before=self.prev_search_before,
+            prev_search_before=None,
+            start_offset=_prev_start_offset,
         )
         return _prev if _prev.is_valid() else None
 
-    def first_cursor(self) -> SearchAfterCursor | None:
+    def first_cursor(self) -> typing.Self | None:
         _first = dataclasses.replace(
             self,
             search_after=None,
             next_search_after=None,
-            prev_search_after=None,
+            pit_id=None,
+            start_offset=0,
+            search_before=None,
+            prev_search_before=None,
         )
         return _first if _first.is_valid() else None
 
 
+@dataclasses.dataclass
+class FirstPageThenSearchAfterCursor(SearchAfterCursor):
+    '''cursor for a first page in one order (e.g. most common first), then paging
+    through the rest in another (excluding those on the first page)
+    '''
+    # page_size: int (from PageCursor)
+    # total_count: int (from PageCursor)
+    # search_after: list | None (from SearchAfterCursor; empty for the second page)
+    # next_search_after: list | None (from SearchAfterCursor)
+    # pit_id: str | None (from SearchAfterCursor)
+    # start_offset: int (from SearchAfterCursor)
+    # search_before: list | None (from SearchAfterCursor)
+    # prev_search_before: list | None (from SearchAfterCursor)
+    # sort values of the last result on the first page (in first-page order), to exclude
+    # the first page (and nothing more) from the rest
+    first_page_bound: list[Any] = dataclasses.field(default_factory=list)
+
+    def is_first_page(self) -> bool:
+        # overrides SearchAfterCursor
+        return self.start_offset == 0
+
+    def first_cursor(self) -> typing.Self | None:
+        _first = super().first_cursor()
+        return None if _first is None else dataclasses.replace(_first, first_page_bound=[])
+
+
 class _PageCursorTypes(enum.Enum):
     '''registry of cursor types into which cursor values can be deserialized'''
     PC = PageCursor
     OC = OffsetCursor
     RRSC = ReproduciblyRandomSampleCursor
     SAC = SearchAfterCursor
+    FPSAC = FirstPageThenSearchAfterCursor
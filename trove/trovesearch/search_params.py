@@ -17,6 +17,7 @@ from django.http import QueryDict
 from trove import exceptions as trove_exceptions
 from trove.trovesearch.page_cursor import (
     DEFAULT_PAGE_SIZE,
+    MANY_MORE,
     PageCursor,
 )
 from trove.util.frozen import freeze
@@ -55,6 +56,9 @@ DOUBLE_QUOTATION_MARK = '"'
 # optional prefix for "sort" values
 DESCENDING_SORT_PREFIX = '-'
 
+# special "page[size]" value, for downloading every result (requires "withFileName")
+EXPORT_PAGE_SIZE = 'all'
+
 DEFAULT_PROPERTYPATH_SET: PropertypathSet = frozenset([ONE_GLOB_PROPERTYPATH])
 
 DEFAULT_INCLUDES_BY_TYPE: Mapping[str, frozenset[Propertypath]] = freeze({
@@ -298,10 +302,10 @@ class SearchFilter:
             osfmap.osfmap_propertypath_set_key(self.propertypath_set),
             self.operator.to_shortname(),
         ))
-        _qp_value = join_queryparam_value(
+        _qp_value = join_queryparam_value(sorted(  # sorted, for a stable querystring
             osfmap.osfmap_json_shorthand().compact_iri(_value)
             for _value in self.value_set
-        )
+        ))
         return str(_qp_name), _qp_value
 
 
@@ -435,6 +439,8 @@ class CardsearchParams(TrovesearchParams):
             _querydict.appendlist(_qp_name, _qp_value)
         if not self.page_cursor.is_basic():
             _querydict['page[cursor]'] = self.page_cursor.as_queryparam_value()
+        elif self.page_cursor.has_unbounded_page_size():
+            _querydict['page[size]'] = EXPORT_PAGE_SIZE
         elif self.page_cursor.page_size != DEFAULT_PAGE_SIZE:
             _querydict['page[size]'] = str(self.page_cursor.page_size)
         for _filter in self.cardsearch_filter_set:
@@ -535,6 +541,11 @@ def _get_page_cursor(queryparams: QueryparamDict) -> PageCursor:
     _size_value = get_single_value(queryparams, QueryparamName('page', ('size',)))
     if _size_value is None:
         return PageCursor()
+    if _size_value == EXPORT_PAGE_SIZE:
+        # every result, streamed page-by-page -- only for downloads
+        if 'withFileName' not in queryparams:
+            raise trove_exceptions.InvalidQueryParamValue('page[size]')
+        return PageCursor(page_size=MANY_MORE)
     try:
         _size = int(_size_value)
     except ValueError:
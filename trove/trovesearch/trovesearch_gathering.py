@@ -8,6 +8,7 @@ from primitive_metadata import gather
 from primitive_metadata import primitive_rdf as rdf
 
 from trove import models as trove_db
+from trove.card_content_loader import CardContentLoader, LoadedCard
 from trove.derive.osfmap_json import _RdfOsfmapJsonldRenderer
 from trove.links import cardsearch_feed_links
 from trove.util.iris import get_sufficiently_unique_iri
@@ -18,10 +19,7 @@ from trove.vocab.jsonapi import (
     JSONAPI_MEMBERNAME,
 )
 from trove.vocab import osfmap
-from trove.vocab.trove import (
-    TROVE_API_THESAURUS,
-    trove_indexcard_namespace,
-)
+from trove.vocab.trove import TROVE_API_THESAURUS
 if TYPE_CHECKING:
     from collections.abc import Iterator, Iterable, Generator
     from trove.trovesearch.page_cursor import PageCursor
@@ -100,6 +98,7 @@ class CardsearchFocus(_TypedFocus):
     # additional dataclass fields
     search_params: CardsearchParams = dataclasses.field(compare=False)
     search_handle: CardsearchHandle = dataclasses.field(compare=False)
+    card_loader: CardContentLoader = dataclasses.field(compare=False, default_factory=CardContentLoader, repr=False)
 
 
 @dataclasses.dataclass(frozen=True)
@@ -109,6 +108,7 @@ class ValuesearchFocus(_TypedFocus):
     # additional dataclass fields
     search_params: ValuesearchParams = dataclasses.field(compare=False)
     search_handle: ValuesearchHandle = dataclasses.field(compare=False)
+    card_loader: CardContentLoader = dataclasses.field(compare=False, default_factory=CardContentLoader, repr=False)
 
 
 @dataclasses.dataclass(frozen=True)
@@ -119,6 +119,15 @@ class IndexcardFocus(_TypedFocus):
     # additional dataclass fields
     indexcard: trove_db.Indexcard = dataclasses.field(compare=False)
     resourceMetadata: Any = dataclasses.field(compare=False, default=None, repr=False)
+    focus_identifiers: Iterable[trove_db.ResourceIdentifier] | None = dataclasses.field(compare=False, default=None, repr=False)
+    card_loader: CardContentLoader = dataclasses.field(compare=False, default_factory=CardContentLoader, repr=False)
+
+    def get_focus_identifiers(self) -> Iterable[trove_db.ResourceIdentifier]:
+        return (
+            self.indexcard.focus_identifier_set.all()
+            if self.focus_identifiers is None
+            else self.focus_identifiers
+        )
 
 
 # TODO: per-field text search in rdf
@@ -156,10 +165,12 @@ def gather_count(focus: CardsearchFocus, **kwargs: Any) -> GathererGenerator:
 def gather_cardsearch_page(focus: CardsearchFocus, *, deriver_iri: str, blend_cards: bool, **kwargs: Any) -> GathererGenerator:
     # each searchResultPage a sequence of search results
     _current_handle: CardsearchHandle | None = focus.search_handle
+    _card_loader = focus.card_loader
     while _current_handle is not None:
         _result_page = []
-        _card_foci = _load_cards_and_contents(
-            card_iris=(_result.card_iri for _result in _current_handle.search_result_page),
+        _card_foci = _load_cards_and_contents(  # one query per page
+            _card_loader,
+            card_iris=[_result.card_iri for _result in _current_handle.search_result_page],
             deriver_iri=deriver_iri,
         )
         for _result in _current_handle.search_result_page or ():
@@ -175,6 +186,7 @@ def gather_cardsearch_page(focus: CardsearchFocus, *, deriver_iri: str, blend_ca
             yield from _triples
         yield (TROVE.searchResultPage, rdf.sequence(_result_page))
         _current_handle = _current_handle.get_next_streaming_handle()
+        _card_loader = CardContentLoader()  # a fresh memo each page (bounded memory when streaming)
 
 
 def _blended_card(card_focus: IndexcardFocus) -> tuple[rdf.RdfObject, Iterable[rdf.RdfTriple]]:
@@ -217,7 +229,7 @@ def _unblended_card_triples(_result: CardsearchResult, _card_focus: IndexcardFoc
     _card_twoples = _unblended_indexcard_twoples(
         focus_identifiers=[
             _identifier.as_iri()
-            for _identifier in _card_focus.indexcard.focus_identifier_set.all()
+            for _identifier in _card_focus.get_focus_identifiers()
         ],
         resource_metadata=_card_focus.resourceMetadata,
     )
@@ -268,13 +280,13 @@ def gather_valuesearch_page(focus: ValuesearchFocus, *, deriver_iri: str, blend_
         if _result.value_iri
     }
     if _value_iris:
-        _card_foci = _load_cards_and_contents(value_iris=_value_iris, deriver_iri=deriver_iri)
+        _card_foci = _load_cards_and_contents(focus.card_loader, value_iris=_value_iris, deriver_iri=deriver_iri)
     else:
         _card_foci = {}
     _card_foci_by_suffuniq_iri: dict[str, IndexcardFocus] = {
         _identifier.sufficiently_unique_iri: _focus
         for _focus in _card_foci.values()
-        for _identifier in _focus.indexcard.focus_identifier_set.all()
+        for _identifier in _focus.get_focus_identifiers()
     }
     for _result in focus.search_handle.search_result_page or ():
         _indexcard_obj: rdf.Blanknode | None = None
@@ -290,7 +302,7 @@ def gather_valuesearch_page(focus: ValuesearchFocus, *, deriver_iri: str, blend_
                 _card_twoples = _unblended_indexcard_twoples(
                     focus_identifiers=[
                         _identifier.as_iri()
-                        for _identifier in _card_focus.indexcard.focus_identifier_set.all()
+                        for _identifier in _card_focus.get_focus_identifiers()
                     ],
                     resource_metadata=_card_focus.resourceMetadata,
                 )
@@ -358,7 +370,7 @@ def gather_card_modified(focus: IndexcardFocus, **kwargs: Any) -> GathererGenera
     focustype_iris={TROVE.Indexcard},
 )
 def gather_primary_topic(focus: IndexcardFocus, **kwargs: Any) -> GathererGenerator:
-    for _identifier in focus.indexcard.focus_identifier_set.all():
+    for _identifier in focus.get_focus_identifiers():
         _iri = _identifier.as_iri()
         yield (FOAF.primaryTopic, _iri)
         yield (TROVE.focusIdentifier, rdf.literal(_iri))
@@ -373,105 +385,37 @@ def gather_card_contents(focus: IndexcardFocus, *, deriver_iri: str, **kwargs: A
         yield (TROVE.resourceMetadata, focus.resourceMetadata)
     else:
         _iri = focus.single_iri()
-        _loaded_foci = _load_cards_and_contents(card_iris=[_iri], deriver_iri=deriver_iri)
+        _loaded_foci = _load_cards_and_contents(focus.card_loader, card_iris=[_iri], deriver_iri=deriver_iri)
         _loaded_metadata = _loaded_foci[_iri].resourceMetadata
         yield (TROVE.resourceMetadata, _loaded_metadata)
 
 
 def _load_cards_and_contents(
+    card_loader: CardContentLoader,
     *,
     card_iris: Iterable[str] | None = None,
     value_iris: Iterable[str] | None = None,
-    deriver_iri: str,
-) -> dict[str, IndexcardFocus]:
-    return (
-        _load_cards_and_extracted_rdf_contents(card_iris, value_iris)
-        if deriver_iri is None
-        else _load_cards_and_derived_contents(card_iris, value_iris, deriver_iri)
-    )
-
-
-def _load_cards_and_extracted_rdf_contents(
-    card_iris: Iterable[str] | None = None,
-    value_iris: Iterable[str] | None = None,
+    deriver_iri: str | None,
 ) -> dict[str, IndexcardFocus]:
-    _card_namespace = trove_indexcard_namespace()
-    _resource_description_qs = (
-        trove_db.LatestResourceDescription.objects
-        .select_related('indexcard')
-        .prefetch_related('indexcard__focus_identifier_set')
+    _loaded_cards = (
+        card_loader.load_by_card_iris(card_iris, deriver_iri=deriver_iri)
+        if card_iris is not None
+        else card_loader.load_by_focus_iris(value_iris or (), deriver_iri=deriver_iri)
     )
-    if card_iris is not None:
-        _indexcard_uuids = {
-            rdf.iri_minus_namespace(_card_iri, namespace=_card_namespace)
-            for _card_iri in card_iris
-        }
-        _resource_description_qs = _resource_description_qs.filter(indexcard__uuid__in=_indexcard_uuids)
-    if value_iris is not None:
-        _resource_description_qs = _resource_description_qs.filter(
-            indexcard__focus_identifier_set__in=(
-                trove_db.ResourceIdentifier.objects
-                .queryset_for_iris(value_iris)
-            ),
-        )
-    _card_foci: dict[str, IndexcardFocus] = {}
-    for _resource_description in _resource_description_qs:
-        _card = _resource_description.indexcard
-        _card_iri = _card.get_iri()
-        _quoted_graph = _resource_description.as_quoted_graph()
-        _quoted_graph.add(
-            (_quoted_graph.focus_iri, FOAF.isPrimaryTopicOf, _card_iri),
-        )
-        _card_foci[_card_iri] = IndexcardFocus.new(
-            iris=_card_iri,
-            indexcard=_card,
-            resourceMetadata=_quoted_graph,
-        )
-    return _card_foci
+    return {
+        _card_iri: _card_focus(_loaded_card, card_loader)
+        for _card_iri, _loaded_card in _loaded_cards.items()
+    }
 
 
-def _load_cards_and_derived_contents(
-    card_iris: Iterable[str] | None,
-    value_iris: Iterable[str] | None,
-    deriver_iri: str,
-) -> dict[str, IndexcardFocus]:
-    _card_namespace = trove_indexcard_namespace()
-    # include pre-formatted data from a DerivedIndexcard
-    _derived_indexcard_qs = (
-        trove_db.DerivedIndexcard.objects
-        .filter(
-            deriver_identifier__in=(
-                trove_db.ResourceIdentifier.objects
-                .queryset_for_iri(deriver_iri)
-            ),
-        )
-        .select_related('upriver_indexcard', 'deriver_identifier')
-        .prefetch_related('upriver_indexcard__focus_identifier_set')
+def _card_focus(loaded_card: LoadedCard, card_loader: CardContentLoader) -> IndexcardFocus:
+    return IndexcardFocus.new(
+        iris=loaded_card.card_iri,
+        indexcard=loaded_card.indexcard,
+        resourceMetadata=loaded_card.content,
+        focus_identifiers=loaded_card.focus_identifiers,
+        card_loader=card_loader,
     )
-    if card_iris is not None:
-        _indexcard_uuids = {
-            rdf.iri_minus_namespace(_card_iri, namespace=_card_namespace)
-            for _card_iri in card_iris
-        }
-        _derived_indexcard_qs = _derived_indexcard_qs.filter(
-            upriver_indexcard__uuid__in=_indexcard_uuids,
-        )
-    if value_iris is not None:
-        _derived_indexcard_qs = _derived_indexcard_qs.filter(
-            upriver_indexcard__focus_identifier_set__in=(
-                trove_db.ResourceIdentifier.objects
-                .queryset_for_iris(value_iris)
-            ),
-        )
-    _card_foci: dict[str, IndexcardFocus] = {}
-    for _derived in _derived_indexcard_qs:
-        _card_iri = _derived.upriver_indexcard.get_iri()
-        _card_foci[_card_iri] = IndexcardFocus.new(
-            iris=_card_iri,
-            indexcard=_derived.upriver_indexcard,
-            resourceMetadata=_derived.as_rdf_literal(),
-        )
-    return _card_foci
 
 
 ###
@@ -1,3 +1,4 @@
+import functools
 import json
 import re
 import urllib.parse as _urp
@@ -20,6 +21,10 @@ QUOTED_IRI_REGEX = re.compile(
 )
 UNQUOTED_IRI_REGEX = re.compile(f'{IRI_SCHEME_REGEX.pattern}{COLON}|{COLON_SLASH_SLASH}')
 
+# how many iris to remember the sufficiently-unique form of (the same iris
+# come up again and again -- in every card's rdf, every filter, every lookup)
+SUFFUNIQ_IRI_CACHE_SIZE = 2**16
+
 # treat similar-enough IRIs as equivalent, based on a wild assertion:
 #   if two IRIs differ only in their `scheme`
 #   and have non-empty `authority` component,
@@ -86,6 +91,12 @@ def get_sufficiently_unique_iri_and_scheme(iri: str) -> tuple[str, str]:
     >>> get_sufficiently_unique_iri_and_scheme('namly:urn.example:blerg')
     ('namly:urn.example:blerg', 'namly')
     '''
+    return _suffuniq_iri_and_scheme(iri)
+
+
+@functools.lru_cache(maxsize=SUFFUNIQ_IRI_CACHE_SIZE)
+def _suffuniq_iri_and_scheme(iri: str) -> tuple[str, str]:
+    # memoized (invalid iris are not -- they raise every time)
     _scheme_match = IRI_SCHEME_REGEX_IGNORECASE.match(iri)
     if _scheme_match:
         _scheme = _scheme_match.group().lower()
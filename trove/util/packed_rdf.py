@@ -0,0 +1,111 @@
+'''pack an rdf tripledict (as parsed from turtle) into compact json, quick to unpack
+
+each distinct iri is written once, in a table, and referenced by index:
+- iris (subjects, predicates, iri objects) as int
+- literals as `[unicode_value, [datatype iri, ...]]`
+- blanknodes as `{"b": [[predicate, object], ...]}`
+
+only what `primitive_rdf.tripledict_from_turtle` gives is supported -- anything else
+raises `PackingError` (for which, keep the turtle)
+'''
+import json
+from typing import Any
+
+from primitive_metadata import primitive_rdf as rdf
+
+__all__ = ('PackingError', 'pack_tripledict', 'unpack_tripledict')
+
+
+_PACKED_VERSION = 1
+
+
+class PackingError(ValueError):
+    pass
+
+
+def pack_tripledict(tripledict: rdf.RdfTripleDictionary) -> str:
+    '''
+    >>> pack_tripledict({
+    ...     'https://foo.example/a': {
+    ...         'https://foo.example/p': {'https://foo.example/a'},
+    ...         'https://foo.example/q': {rdf.literal('blurp', datatype_iris='https://foo.example/T')},
+    ...     },
+    ... })
+    '{"v":1,"iris":["https://foo.example/a","https://foo.example/p","https://foo.example/q","https://foo.example/T"],"graph":[[0,[[1,[0]],[2,[["blurp",[3]]]]]]]}'
+    >>> pack_tripledict({'https://foo.example/a': {'https://foo.example/p': {7}}})
+    Traceback (most recent call last):
+      ...
+    trove.util.packed_rdf.PackingError: cannot pack 7 (of type int)
+    '''
+    _iri_indexes: dict[str, int] = {}
+
+    def _iri(iri: str) -> int:
+        try:
+            return _iri_indexes[iri]
+        except KeyError:
+            _iri_indexes[iri] = _index = len(_iri_indexes)
+            return _index
+
+    def _obj(obj: rdf.RdfObject) -> int | list[Any] | dict[str, Any]:
+        if isinstance(obj, str):
+            return _iri(obj)
+        if isinstance(obj, rdf.Literal):
+            return [obj.unicode_value, sorted(map(_iri, obj.datatype_iris))]
+        if isinstance(obj, frozenset):  # blanknode
+            return {'b': [[_iri(_pred), _obj(_nested_obj)] for _pred, _nested_obj in obj]}
+        raise PackingError(f'cannot pack {obj!r} (of type {type(obj).__name__})')
+
+    _graph = [
+        [_iri(_subj), [
+            [_iri(_pred), [_obj(_o) for _o in _objs]]
+            for _pred, _objs in _twopledict.items()
+        ]]
+        for _subj, _twopledict in tripledict.items()
+    ]
+    return json.dumps(
+        {'v': _PACKED_VERSION, 'iris': list(_iri_indexes.keys()), 'graph': _graph},
+        separators=(',', ':'),
+    )
+
+
+def unpack_tripledict(packed: str) -> rdf.RdfTripleDictionary:
+    '''
+    >>> _tripledict = {
+    ...     'https://foo.example/a': {
+    ...         'https://foo.example/p': {
+    ...             'https://foo.example/b',
+    ...             rdf.literal('blurp', language='en'),
+    ...             rdf.blanknode({'https://foo.example/q': {rdf.literal('blorp')}}),
+    ...         },
+    ...     },
+    ... }
+    >>> unpack_tripledict(pack_tripledict(_tripledict)) == _tripledict
+    True
+    >>> unpack_tripledict('{"v":999}')
+    Traceback (most recent call last):
+      ...
+    trove.util.packed_rdf.PackingError: unknown packed version 999
+    '''
+    _unpacked = json.loads(packed)
+    if _unpacked['v'] != _PACKED_VERSION:
+        raise PackingError(f'unknown packed version {_unpacked["v"]}')
+    _iris = _unpacked['iris']
+
+    def _obj(packed_obj: int | list[Any] | dict[str, Any]) -> rdf.RdfObject:
+        if isinstance(packed_obj, int):
+            return _iris[packed_obj]
+        if isinstance(packed_obj, list):
+            _value, _datatype_indexes = packed_obj
+            return rdf.Literal(_value, frozenset(_iris[_i] for _i in _datatype_indexes))
+        return frozenset(
+            (_iris[_pred], _obj(_nested_obj))
+            for _pred, _nested_obj in packed_obj['b']
+        )
+
+    return {
+        _iris[_subj]: {
+            _iris[_pred]: {_obj(_o) for _o in _objs}
+            for _pred, _objs in _twoples
+        }
+        for _subj, _twoples in _unpacked['graph']
+    }
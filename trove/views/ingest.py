@@ -1,5 +1,7 @@
+from collections.abc import Generator
 import datetime
 from http import HTTPStatus
+import json
 import logging
 
 from django import http
@@ -8,8 +10,10 @@ from django.views import View
 
 from share.models.feature_flag import FeatureFlag
 from trove import digestive_tract
+from trove.digestive_tract import RecordToIngest
 from trove import exceptions as trove_exceptions
 from trove.util.queryparams import parse_booly_str
+from trove.vocab import mediatypes
 if __debug__:
     from share.models import ShareUser
 
@@ -30,19 +34,17 @@ class RdfIngestView(View):
         assert isinstance(request.user, ShareUser)
         if FeatureFlag.objects.flag_is_up(FeatureFlag.FORBID_UNTRUSTED_FEED) and not request.user.is_trusted:
             return http.HttpResponse(status=HTTPStatus.FORBIDDEN)
+        if request.content_type == mediatypes.NDJSON:
+            return self._post_batch(request)
         # TODO: declare/validate params with dataclass
         _focus_iri = request.GET.get('focus_iri')
         if not _focus_iri:
             return http.HttpResponse('focus_iri queryparam required', status=HTTPStatus.BAD_REQUEST)
         _record_identifier = request.GET.get('record_identifier')
-        _expiration_date_str = request.GET.get('expiration_date')
-        if _expiration_date_str is None:
-            _expiration_date = None
-        else:
-            try:
-                _expiration_date = datetime.date.fromisoformat(_expiration_date_str)
-            except ValueError:
-                return http.HttpResponse('expiration_date queryparam must be in ISO-8601 date format (YYYY-MM-DD)', status=HTTPStatus.BAD_REQUEST)
+        try:
+            _expiration_date = _parse_expiration_date(request.GET.get('expiration_date'))
+        except ValueError:
+            return http.HttpResponse('expiration_date queryparam must be in ISO-8601 date format (YYYY-MM-DD)', status=HTTPStatus.BAD_REQUEST)
         _nonurgent = parse_booly_str(request.GET.get('nonurgent'))
         try:
             if not request.content_type:
@@ -64,6 +66,32 @@ class RdfIngestView(View):
         # TODO: include (link to?) extracted card(s)
         return http.HttpResponse(status=HTTPStatus.CREATED)
 
+    def _post_batch(self, request: HttpRequest) -> HttpResponse:
+        '''ingest many records in one request, as newline-delimited json
+
+        each line a json object with keys:
+            "focus_iri" (required)
+            "raw_record" (required)
+            "record_mediatype" (default "text/turtle")
+            "record_identifier" (default focus_iri)
+            "is_supplementary" (default false)
+            "expiration_date" (ISO-8601 date; default none)
+        '''
+        assert isinstance(request.user, ShareUser)
+        _nonurgent = parse_booly_str(request.GET.get('nonurgent'))
+        try:
+            _records = list(_parse_ndjson_records(request.body.decode(encoding='utf-8')))
+            digestive_tract.ingest_batch(
+                from_user=request.user,
+                records=_records,
+                urgent=(not _nonurgent),
+                restore_deleted=True,
+            )
+        except trove_exceptions.DigestiveError as e:
+            logger.exception(str(e))
+            return http.HttpResponse(str(e), status=HTTPStatus.BAD_REQUEST)
+        return http.HttpResponse(status=HTTPStatus.CREATED)
+
     def delete(self, request: HttpRequest) -> HttpResponse:
         # TODO: cleaner permissions
         if not request.user.is_authenticated:
@@ -80,3 +108,33 @@ class RdfIngestView(View):
             record_identifier=_record_identifier,
         )
         return http.HttpResponse(status=HTTPStatus.OK)
+
+
+###
+# local helpers
+
+def _parse_expiration_date(expiration_date_str: str | None) -> datetime.date | None:
+    # may raise ValueError
+    return (
+        None
+        if expiration_date_str is None
+        else datetime.date.fromisoformat(expiration_date_str)
+    )
+
+
+def _parse_ndjson_records(ndjson: str) -> Generator[RecordToIngest]:
+    for _line_number, _line in enumerate(ndjson.splitlines(), start=1):
+        if not _line.strip():
+            continue
+        try:
+            _record_json = json.loads(_line)
+            yield RecordToIngest(
+                focus_iri=_record_json['focus_iri'],
+                raw_record=_record_json['raw_record'],
+                record_mediatype=_record_json.get('record_mediatype', mediatypes.TURTLE),
+                record_identifier=_record_json.get('record_identifier'),
+                is_supplementary=bool(_record_json.get('is_supplementary', False)),
+                expiration_date=_parse_expiration_date(_record_json.get('expiration_date')),
+            )
+        except (ValueError, KeyError, TypeError) as _error:
+            raise trove_exceptions.DigestiveError(f'invalid record on line {_line_number}: {_error!r}')
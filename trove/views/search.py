@@ -5,6 +5,7 @@ import logging
 from primitive_metadata import gather
 
 from share.search import index_strategy
+from share.search.search_result_cache import with_search_result_cache
 from trove.trovesearch.search_handle import BasicSearchHandle
 from trove.trovesearch.search_params import (
     CardsearchParams,
@@ -48,7 +49,7 @@ class _BaseTrovesearchView(GatheredTroveView, abc.ABC):
         raise NotImplementedError
 
     def _get_wrapped_handler(self, strategy: index_strategy.IndexStrategy):
-        _raw_handler = self.get_search_handler(strategy)
+        _raw_handler = with_search_result_cache(strategy, self.get_search_handler(strategy))
 
         def _wrapped_handler(search_params: CardsearchParams) -> BasicSearchHandle:
             _handle = _raw_handler(search_params)
@@ -7,6 +7,7 @@ TSV = 'text/tab-separated-values'
 CSV = 'text/csv'
 RSS = 'application/rss+xml'
 ATOM = 'application/atom+xml'
+NDJSON = 'application/x-ndjson'
 
 
 _file_extensions = {
@@ -19,6 +20,7 @@ _file_extensions = {
     CSV: '.csv',
     RSS: '.xml',
     ATOM: '.xml',
+    NDJSON: '.ndjson',
 }
 
 _PARAMETER_DELIMITER = ';'
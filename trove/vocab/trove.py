@@ -647,6 +647,9 @@ a query parameter to control the maximum number of results returned at once
 
 integer value, e.g. `page[size]=7` (default `13`)
 
+special value `page[size]=all` streams every result, page by page
+(only allowed with `withFileName`, for downloading e.g. a full csv)
+
 may not be used with `page[cursor]`
 ''', language='en')},
     },